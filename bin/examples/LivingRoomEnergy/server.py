@@ -32,13 +32,18 @@ import itty
 
 from pycast.methods.exponentialsmoothing import HoltWintersMethod
 from pycast.optimization import GridSearch
+from pycast.optimization.randomsearch import RandomSearch
 from pycast.errors import SymmetricMeanAbsolutePercentageError as SMAPE
 from pycast.common.timeseries import TimeSeries
 from pycast.common.json_encoder import PycastEncoder
+from pycast.common.resultcache import ResultCache
 
 db = sqlite3.connect('energy.db')
 MY_ROOT = os.path.join(os.path.dirname(__file__), 'static')
 
+# the same data is posted repeatedly by the client
+RESULT_CACHE = ResultCache(maximalEntries=1024, maximalMemory=64 * 1024 * 1024)
+
 @itty.get('/energyData')
 def energy_data():
     """
@@ -58,23 +63,30 @@ def optimize(request):
         seasonLength - integer
         valuesToForecast - integer
         data - two dimensional array of [timestamp, value]
+    Optionally a time limit for the optimization can be set:
+        timeLimit - float, seconds
     """
     #Parse arguments
     seasonLength = int(request.POST.get('seasonLength', 6))
     valuesToForecast = int(request.POST.get('valuesToForecast', 0))
-    data = json.loads(request.POST.get('data', []))
+    data = request.POST.get('data', '[]')
+    timeLimit = request.POST.get('timeLimit', None)
 
-    original = TimeSeries.from_twodim_list(data)
+    original = TimeSeries.from_json(data)
     original.normalize("day") #due to bug in TimeSeries.apply
     original.set_timeformat("%d.%m")
 
     #optimize smoothing
     hwm = HoltWintersMethod(seasonLength = seasonLength, valuesToForecast = valuesToForecast)
-    gridSearch = GridSearch(SMAPE)
-    optimal_forecasting, error, optimal_params = gridSearch.optimize(original, [hwm])
+    if timeLimit is None:
+        optimizer = GridSearch(SMAPE, resultCache=RESULT_CACHE)
+    else:
+        optimizer = RandomSearch(SMAPE, precision=-2, resultCache=RESULT_CACHE, numberOfSamples=1000,
+                                 sampling="latinhypercube", seed=0, timeLimit=float(timeLimit))
+    optimal_forecasting, error, optimal_params = optimizer.optimize(original, [hwm])
 
     #perform smoothing
-    smoothed = optimal_forecasting.execute(original)
+    smoothed = RESULT_CACHE.execute(optimal_forecasting, original)
     smoothed.set_timeformat("%d.%m")
     result = {  'params': optimal_params,
                 'original': original,
@@ -101,7 +113,7 @@ def holtWinters(request):
     seasonSmoothingFactor = float(request.POST.get('seasonSmoothingFactor', 0.4))
     seasonLength = int(request.POST.get('seasonLength', 6))
     valuesToForecast = int(request.POST.get('valuesToForecast', 0))
-    data = json.loads(request.POST.get('data', []))
+    data = request.POST.get('data', '[]')
 
     #perform smoothing
     hwm = HoltWintersMethod(smoothingFactor = smoothingFactor,
@@ -109,9 +121,9 @@ def holtWinters(request):
                             seasonSmoothingFactor =  seasonSmoothingFactor,
                             seasonLength = seasonLength,
                             valuesToForecast = valuesToForecast)
-    original = TimeSeries.from_twodim_list(data)
+    original = TimeSeries.from_json(data)
     original.set_timeformat("%d.%m")
-    smoothed = hwm.execute(original)
+    smoothed = RESULT_CACHE.execute(hwm, original)
     smoothed.set_timeformat("%d.%m")
 
     error = SMAPE()
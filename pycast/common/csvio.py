@@ -0,0 +1,273 @@
+# !/usr/bin/env python
+#  -*- coding: UTF-8 -*-
+
+# Copyright (c) 2012-2015 Christian Schwarz
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+"""Reads and writes TimeSeries from and to CSV files.
+
+Three layouts are supported:
+
+    - plain files, containing one data point per row: timestamp, value, ...
+    - wide files, containing one time series per row: id, ..., value 1, value 2, ...
+      This is the layout of the M3 and M4 competition data.
+    - long files, containing one data point of one of many time series per row: id, timestamp, value
+
+The files are read in chunks of rows and each column of a chunk is converted at once.
+"""
+
+import csv
+from array import array
+from itertools import islice, izip
+from collections import OrderedDict
+
+from timeseries import TimeSeries, MultiDimensionalTimeSeries
+
+# number of rows that are parsed or formatted at once
+_CHUNK_SIZE = 8192
+
+def _read_chunks(filepath, delimiter, skipHeader, chunkSize):
+    """Returns an iterator over lists of chunkSize rows of the given CSV file.
+
+    :param string filepath:    Path of the CSV file.
+    :param string delimiter:    Character separating the columns.
+    :param boolean skipHeader:    If this is :py:const:`True`, the first row is ignored.
+    :param integer chunkSize:    Maximal number of rows per chunk.
+    """
+    with open(filepath, "rb") as csvfile:
+        reader = csv.reader(csvfile, delimiter=delimiter)
+        if skipHeader:
+            next(reader, None)
+
+        chunk = list(islice(reader, chunkSize))
+        while 0 < len(chunk):
+            yield chunk
+            chunk = list(islice(reader, chunkSize))
+
+def _convert_timestamps(timestamps, tsformat):
+    """Converts the given timestamps into UNIX epochs.
+
+    :param list timestamps:    List of timestamps given as strings.
+    :param string tsformat:    Format of the timestamps. If this is :py:const:`None`,
+        the timestamps have to be UNIX epochs already.
+
+    :return:    Returns a list containing the UNIX epochs.
+    :rtype: list
+    """
+    if tsformat is None:
+        return map(float, timestamps)
+
+    return TimeSeries.convert_timestamps_to_epoch(timestamps, tsformat)
+
+def read_csv(filepath, timestampColumn=0, valueColumns=(1,), delimiter=",", skipHeader=False, tsformat=None, storage="list", chunkSize=_CHUNK_SIZE):
+    """Reads a TimeSeries from a CSV file containing one data point per row.
+
+    :param string filepath:    Path of the CSV file.
+    :param integer timestampColumn:    Index of the column containing the timestamps.
+    :param list valueColumns:    Indices of the columns containing the values. If more than one
+        column is given, a :py:class:`MultiDimensionalTimeSeries` with one dimension per column is returned.
+    :param string delimiter:    Character separating the columns, e.g. "\\t" for TSV files.
+    :param boolean skipHeader:    If this is :py:const:`True`, the first row is ignored.
+    :param string tsformat:    Format of the timestamps. For valid examples take a look into
+        the :py:func:`time.strptime` documentation. If this is :py:const:`None`, the timestamps have
+        to be UNIX epochs.
+    :param string storage:    Storage backend used to hold the data points.
+        The available storage backends are defined in :py:data:`timeseries.StorageBackends`.
+    :param integer chunkSize:    Number of rows that are parsed at once.
+
+    :return:    Returns the TimeSeries containing all rows of the file.
+    :rtype: TimeSeries
+
+    :raise: Raises a :py:exc:`ValueError` if a value cannot be converted into a float.
+    """
+    timestamps = array("d")
+    values     = [array("d") for column in valueColumns]
+
+    for chunk in _read_chunks(filepath, delimiter, skipHeader, chunkSize):
+        timestamps.extend(_convert_timestamps([row[timestampColumn] for row in chunk], tsformat))
+        for column, valueColumn in izip(values, valueColumns):
+            column.extend(map(float, [row[valueColumn] for row in chunk]))
+
+    if 1 == len(values):
+        ts = TimeSeries.from_arrays(timestamps, values[0], storage=storage)
+    else:
+        ts = MultiDimensionalTimeSeries.from_arrays(timestamps, values, storage=storage)
+
+    ts.set_timeformat(tsformat)
+    return ts
+
+def read_wide_csv(filepath, idColumn=0, firstValueColumn=1, delimiter=",", skipHeader=True, start=0.0, step=1.0, storage="list", chunkSize=_CHUNK_SIZE):
+    """Reads multiple TimeSeries from a CSV file containing one time series per row.
+
+    The values of each row start at firstValueColumn and are given the timestamps
+    start, start + step, start + 2 * step, ... Empty cells are skipped.
+
+    :param string filepath:    Path of the CSV file.
+    :param integer idColumn:    Index of the column containing the name of the time series.
+    :param integer firstValueColumn:    Index of the column containing the first value.
+    :param string delimiter:    Character separating the columns.
+    :param boolean skipHeader:    If this is :py:const:`True`, the first row is ignored.
+    :param float start:    Timestamp of the first value.
+    :param float step:    Distance between two timestamps.
+    :param string storage:    Storage backend used to hold the data points.
+        The available storage backends are defined in :py:data:`timeseries.StorageBackends`.
+    :param integer chunkSize:    Number of rows that are parsed at once.
+
+    :return:    Returns an ordered dictionary containing one TimeSeries per row, using the ids as keys.
+    :rtype: OrderedDict
+
+    :raise: Raises a :py:exc:`ValueError` if a value cannot be converted into a float.
+    """
+    result = OrderedDict()
+
+    for chunk in _read_chunks(filepath, delimiter, skipHeader, chunkSize):
+        for row in chunk:
+            cells = row[firstValueColumn:]
+
+            # rows of different length are padded with empty cells
+            if "" in cells:
+                indices = [idx for idx, cell in enumerate(cells) if "" != cell]
+                values  = map(float, [cells[idx] for idx in indices])
+            else:
+                indices = xrange(len(cells))
+                values  = map(float, cells)
+
+            timestamps = [start + idx * step for idx in indices]
+            result[row[idColumn].strip()] = TimeSeries.from_arrays(timestamps, values, assumeSorted=True, storage=storage)
+
+    return result
+
+def read_long_csv(filepath, idColumn=0, timestampColumn=1, valueColumn=2, delimiter=",", skipHeader=False, tsformat=None, storage="list", chunkSize=_CHUNK_SIZE):
+    """Reads multiple TimeSeries from a CSV file containing one data point of one time series per row.
+
+    :param string filepath:    Path of the CSV file.
+    :param integer idColumn:    Index of the column containing the name of the time series.
+    :param integer timestampColumn:    Index of the column containing the timestamps.
+    :param integer valueColumn:    Index of the column containing the values.
+    :param string delimiter:    Character separating the columns.
+    :param boolean skipHeader:    If this is :py:const:`True`, the first row is ignored.
+    :param string tsformat:    Format of the timestamps. For valid examples take a look into
+        the :py:func:`time.strptime` documentation. If this is :py:const:`None`, the timestamps have
+        to be UNIX epochs.
+    :param string storage:    Storage backend used to hold the data points.
+        The available storage backends are defined in :py:data:`timeseries.StorageBackends`.
+    :param integer chunkSize:    Number of rows that are parsed at once.
+
+    :return:    Returns an ordered dictionary containing one TimeSeries per id, in the order
+        of their first occurrence.
+    :rtype: OrderedDict
+
+    :raise: Raises a :py:exc:`ValueError` if a value cannot be converted into a float.
+    """
+    columns = OrderedDict()
+
+    for chunk in _read_chunks(filepath, delimiter, skipHeader, chunkSize):
+        timestamps = _convert_timestamps([row[timestampColumn] for row in chunk], tsformat)
+        values     = map(float, [row[valueColumn] for row in chunk])
+
+        for row, timestamp, value in izip(chunk, timestamps, values):
+            seriesId = row[idColumn]
+            if seriesId not in columns:
+                columns[seriesId] = (array("d"), array("d"))
+
+            seriesColumns = columns[seriesId]
+            seriesColumns[0].append(timestamp)
+            seriesColumns[1].append(value)
+
+    result = OrderedDict()
+    for seriesId, seriesColumns in columns.iteritems():
+        ts = TimeSeries.from_arrays(seriesColumns[0], seriesColumns[1], storage=storage)
+        ts.set_timeformat(tsformat)
+        result[seriesId] = ts
+
+    return result
+
+def _format_columns(columns, delimiter, tsformat, prefix=""):
+    """Returns an iterator over chunks of formatted CSV rows.
+
+    :param list columns:    List containing one sequence of floats per column.
+        The first column contains the timestamps.
+    :param string delimiter:    Character separating the columns.
+    :param string tsformat:    Format of the timestamps. If this is :py:const:`None`,
+        the timestamps are written as UNIX epochs.
+    :param string prefix:    String written in front of each row.
+    """
+    prefix    = prefix.replace("%", "%%")
+    rowFormat = prefix + delimiter.join(["%r"] * len(columns)) + "\n"
+    if tsformat is not None:
+        rowFormat = prefix + delimiter.join(["%s"] + ["%r"] * (len(columns) - 1)) + "\n"
+
+    length = len(columns[0])
+    for start in xrange(0, length, _CHUNK_SIZE):
+        chunkColumns = [column[start:start + _CHUNK_SIZE] for column in columns]
+        if tsformat is not None:
+            chunkColumns[0] = TimeSeries.convert_epochs_to_timestamps(chunkColumns[0], tsformat)
+
+        yield "".join([rowFormat % row for row in izip(*chunkColumns)])
+
+def write_csv(timeSeries, filepath, delimiter=",", header=None, tsformat=None):
+    """Writes the given TimeSeries into a CSV file containing one data point per row.
+
+    The rows are formatted in chunks and each chunk is written at once. Values are written
+    with their full precision, so reading the file results in an equal TimeSeries.
+
+    :param TimeSeries timeSeries:    TimeSeries or MultiDimensionalTimeSeries that is written.
+    :param string filepath:    Path used to create the file. If that file already exists,
+        it will be overwritten!
+    :param string delimiter:    Character separating the columns.
+    :param list header:    Names of the columns. If this is :py:const:`None`, no header is written.
+    :param string tsformat:    Format of the timestamps. If this is :py:const:`None`,
+        the timestamps are written as UNIX epochs.
+    """
+    columns = [timeSeries.get_column(0)]
+    if isinstance(timeSeries, MultiDimensionalTimeSeries):
+        columns += [timeSeries.get_column(idx) for idx in xrange(1, timeSeries.dimension_count() + 1)]
+    else:
+        columns.append(timeSeries.get_column(1))
+
+    with open(filepath, "wb") as csvfile:
+        if header is not None:
+            csvfile.write(delimiter.join(header) + "\n")
+
+        for chunk in _format_columns(columns, delimiter, tsformat):
+            csvfile.write(chunk)
+
+def write_long_csv(timeSeriesDict, filepath, delimiter=",", header=None, tsformat=None):
+    """Writes the given TimeSeries into a CSV file containing one data point of one time series per row.
+
+    :param dictionary timeSeriesDict:    Dictionary containing the TimeSeries, using their ids as keys.
+        The ids must not contain the delimiter.
+    :param string filepath:    Path used to create the file. If that file already exists,
+        it will be overwritten!
+    :param string delimiter:    Character separating the columns.
+    :param list header:    Names of the columns. If this is :py:const:`None`, no header is written.
+    :param string tsformat:    Format of the timestamps. If this is :py:const:`None`,
+        the timestamps are written as UNIX epochs.
+    """
+    with open(filepath, "wb") as csvfile:
+        if header is not None:
+            csvfile.write(delimiter.join(header) + "\n")
+
+        for seriesId, timeSeries in timeSeriesDict.iteritems():
+            columns = [timeSeries.get_column(0), timeSeries.get_column(1)]
+            for chunk in _format_columns(columns, delimiter, tsformat, "%s%s" % (seriesId, delimiter)):
+                csvfile.write(chunk)
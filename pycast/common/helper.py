@@ -36,12 +36,6 @@ def linear_interpolation(first, last, steps):
 
     :todo:     Define a more general interface!
     """
-    result = []
+    divisor = float(steps + 1)
 
-    for step in xrange(0, steps):
-        fpart = (steps - step) * first
-        lpart = (step + 1)            * last
-        value = (fpart + lpart) / float(steps + 1)
-        result.append(value)
-
-    return result
+    return [((steps - step) * first + (step + 1) * last) / divisor for step in xrange(0, steps)]
@@ -22,14 +22,207 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
 # WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
+
 import json
+from itertools import izip
+
 from pycastobject import PyCastObject
+from timeseries import TimeSeries, MultiDimensionalTimeSeries
+from storage import _get_implicit_timestamps
+
+# number of data points that are encoded at once
+_CHUNK_SIZE = 8192
+
+_INFINITY = float("inf")
 
 class PycastEncoder(json.JSONEncoder, PyCastObject):
 
-    """Encodes a PyCastObject to json."""
+    """Encodes a PyCastObject to json.
+
+    TimeSeries are encoded chunk by chunk while the result of :py:meth:`PycastEncoder.iterencode`
+    is consumed, e.g. by :py:func:`json.dump`. They are never converted into a two dimensional list.
+    """
+
+    def __init__(self, columnar=False, chunkSize=_CHUNK_SIZE, **kwargs):
+        """Initializes the PycastEncoder.
+
+        :param boolean columnar:    If this is :py:const:`False`, TimeSeries are encoded as a list of
+            [timestamp, value] pairs. Otherwise they are encoded as {"t0": ..., "step": ..., "values": [...]},
+            if their timestamps are equidistant and as {"timestamps": [...], "values": [...]} if not.
+            Columnar JSON always contains the timestamps as UNIX epochs.
+            MultiDimensionalTimeSeries contain one list of values per dimension.
+        :param integer chunkSize:    Number of data points that are encoded at once.
+        :param kwargs:    Parameters of :py:class:`json.JSONEncoder`.
+        """
+        super(PycastEncoder, self).__init__(**kwargs)
+        self._columnar   = columnar
+        self._chunkSize  = chunkSize
+        self._timeSeries = {}
 
     def default(self, obj):
+        # TimeSeries are replaced by a placeholder that gets replaced by the
+        # streamed TimeSeries within PycastEncoder.iterencode.
+        if isinstance(obj, TimeSeries):
+            placeholder = '"__pycast_timeseries_%s__"' % id(obj)
+            self._timeSeries[placeholder] = obj
+            return placeholder[1:-1]
+
         # Cannot use the to_json method, because it returns a string rather
         # than a serializable list.
         return obj.to_twodim_list()
+
+    def iterencode(self, o, _one_shot=False):
+        """Encodes the given object.
+
+        :param o:    Object that will be encoded.
+
+        :return:    Returns an iterator over the chunks of the JSON representation of o.
+        :rtype: iterator
+        """
+        if isinstance(o, TimeSeries):
+            return self._iterencode_timeseries(o)
+
+        # the C implementation of the encoder would encode a whole structure at once
+        self._timeSeries = {}
+        return self._replace_placeholders(super(PycastEncoder, self).iterencode(o, False))
+
+    def _replace_placeholders(self, chunks):
+        """Replaces the placeholders created by :py:meth:`PycastEncoder.default` by the encoded TimeSeries.
+
+        :param iterator chunks:    Chunks of the JSON representation containing the placeholders.
+        """
+        timeSeries = self._timeSeries
+        for chunk in chunks:
+            ts = timeSeries.get(chunk)
+            if ts is None:
+                yield chunk
+                continue
+
+            for tsChunk in self._iterencode_timeseries(ts):
+                yield tsChunk
+
+    def _floatstr(self, value):
+        """Returns the JSON representation of a float, like :py:class:`json.JSONEncoder` does.
+
+        :raise: Raises a :py:exc:`ValueError` if value is not finite and allow_nan is not set.
+        """
+        if value != value:
+            text = "NaN"
+        elif _INFINITY == value:
+            text = "Infinity"
+        elif -_INFINITY == value:
+            text = "-Infinity"
+        else:
+            return repr(value)
+
+        if not self.allow_nan:
+            raise ValueError("Out of range float values are not JSON compliant: %r" % value)
+
+        return text
+
+    def _format_floats(self, values):
+        """Returns the JSON representations of the given floats.
+
+        :param list values:    Sequence of floats.
+
+        :return:    Returns a list containing one string per value.
+        :rtype: list
+        """
+        strings = map(repr, values)
+
+        # nan and inf are the only float representations containing an n
+        if "n" in "".join(strings):
+            strings = map(self._floatstr, values)
+
+        return strings
+
+    def _iterencode_column(self, ts, column):
+        """Encodes one column of the given TimeSeries as a JSON list."""
+        separator = self.item_separator
+        chunkSize = self._chunkSize
+        length    = len(ts)
+
+        yield "["
+        for start in xrange(0, length, chunkSize):
+            chunk = separator.join(self._format_floats(ts.view(start, start + chunkSize).get_column(column)))
+            yield chunk if 0 == start else separator + chunk
+
+        yield "]"
+
+    def _iterencode_timeseries(self, ts):
+        """Encodes the given TimeSeries.
+
+        :param TimeSeries ts:    TimeSeries or MultiDimensionalTimeSeries that will be encoded.
+        """
+        dimensions = 1
+        if isinstance(ts, MultiDimensionalTimeSeries):
+            dimensions = ts.dimension_count()
+
+        if self._columnar:
+            return self._iterencode_columnar(ts, dimensions)
+
+        return self._iterencode_pairs(ts, dimensions)
+
+    def _iterencode_pairs(self, ts, dimensions):
+        """Encodes the given TimeSeries as a list of [timestamp, value] pairs."""
+        separator = self.item_separator
+        chunkSize = self._chunkSize
+        length    = len(ts)
+        tsformat  = ts.get_timeformat()
+
+        encodeString = json.encoder.encode_basestring_ascii if self.ensure_ascii else json.encoder.encode_basestring
+
+        # the rows are equal to the ones returned by to_twodim_list
+        rowFormat = "[" + separator.join(["%s"] * (dimensions + 1)) + "]"
+        if isinstance(ts, MultiDimensionalTimeSeries) and tsformat is not None:
+            rowFormat = "[%s" + separator + "[" + separator.join(["%s"] * dimensions) + "]]"
+
+        yield "["
+        for start in xrange(0, length, chunkSize):
+            view       = ts.view(start, start + chunkSize)
+            timestamps = view.get_column(0)
+            if tsformat is None:
+                timestamps = self._format_floats(timestamps)
+            else:
+                timestamps = map(encodeString, TimeSeries.convert_epochs_to_timestamps(timestamps, tsformat))
+
+            columns = [timestamps] + [self._format_floats(view.get_column(column)) for column in xrange(1, dimensions + 1)]
+            chunk   = separator.join([rowFormat % row for row in izip(*columns)])
+            yield chunk if 0 == start else separator + chunk
+
+        yield "]"
+
+    def _iterencode_columnar(self, ts, dimensions):
+        """Encodes the given TimeSeries as a dictionary containing one list per column."""
+        separator = self.item_separator
+        colon     = self.key_separator
+
+        geometry = None
+        if 1 == len(ts):
+            geometry = (ts[0][0], 0.0)
+        elif 1 < len(ts) and ts.is_normalized():
+            geometry = _get_implicit_timestamps(ts.get_column(0))
+
+        if geometry is None:
+            yield '{"timestamps"%s' % colon
+            for chunk in self._iterencode_column(ts, 0):
+                yield chunk
+        else:
+            yield '{"t0"%s%s%s"step"%s%s' % (colon, self._floatstr(geometry[0]), separator, colon, self._floatstr(geometry[1]))
+
+        yield '%s"values"%s' % (separator, colon)
+        if 1 == dimensions:
+            for chunk in self._iterencode_column(ts, 1):
+                yield chunk
+        else:
+            yield "["
+            for column in xrange(1, dimensions + 1):
+                if 1 < column:
+                    yield separator
+
+                for chunk in self._iterencode_column(ts, column):
+                    yield chunk
+
+            yield "]"
+
+        yield "}"
@@ -32,6 +32,7 @@ from math import sqrt
 from pycastobject import PyCastObject
 from decorators import optimized
 from timeseries import MultiDimensionalTimeSeries
+from storage import pack_columns, unpack_columns
 
 def sign(a, b):
     """Return a with the algebraic sign of b"""
@@ -242,13 +243,11 @@ class Matrix(PyCastObject):
                     of the Matrix
         :rtype:     MultiDimensionalTimeSeries
         """
-        ts = MultiDimensionalTimeSeries(dimensions=self.get_width())
-        for row in xrange(self.get_height()):
-            newEntry = []
-            for col in xrange(self.get_width()):
-                newEntry.append(self.get_value(col, row))
-            ts.add_entry(row, newEntry)
-        return ts
+        values = []
+        for col in xrange(self.get_width()):
+            values.append([self.get_value(col, row) for row in xrange(self.get_height())])
+
+        return MultiDimensionalTimeSeries.from_arrays(range(self.get_height()), values, assumeSorted=True)
 
     def get_array(self, rowBased=True):
         """Return a two dimensional list with the values of the :py:obj:`self`.
@@ -360,6 +359,32 @@ class Matrix(PyCastObject):
         gjResult._columns = len(gjResult.matrix)
         return gjResult
 
+    def __getstate__(self):
+        """Return the state of the Matrix used by :py:mod:`pickle`
+
+        If the Matrix only contains float values, they are stored within one contiguous
+        buffer of float64 values, one column after the other.
+
+        :return:    Returns a dictionary containing the attributes of the Matrix.
+        :rtype:     dictionary
+        """
+        state = self.__dict__.copy()
+
+        # other values, e.g. integers, would change their type or value when stored as float64
+        if all(type(value) is float for column in self.matrix for value in column):
+            state["matrix"] = pack_columns(self.matrix)
+
+        return state
+
+    def __setstate__(self, state):
+        """Restore the Matrix from the state returned by :py:meth:`Matrix.__getstate__`
+
+        :param dictionary state:    Attributes of the pickled Matrix.
+        """
+        self.__dict__.update(state)
+        if isinstance(self.matrix, str):
+            self.matrix = [column.tolist() for column in unpack_columns(self.matrix, self._columns)]
+
     def __copy__(self):
         """Return a new clone of the Matrix
 
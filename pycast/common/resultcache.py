@@ -0,0 +1,211 @@
+# !/usr/bin/env python
+#  -*- coding: UTF-8 -*-
+
+# Copyright (c) 2012-2015 Christian Schwarz
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+"""Caches the results of smoothing and forecasting methods.
+
+A :py:class:`ResultCache` is passed to :py:meth:`pycast.common.timeseries.TimeSeries.apply`
+or to an optimization method. Results are stored using the fingerprint of the
+TimeSeries, the class of the method and its parameters as key. The least recently
+used results are evicted when the number of entries or the estimated memory
+consumption exceeds its limits.
+"""
+
+import threading
+
+from copy import copy
+from collections import OrderedDict
+
+class ResultCache(object):
+
+    """LRU cache for the results of :py:meth:`pycast.methods.basemethod.BaseMethod.execute`.
+
+    The ResultCache can be shared by multiple threads.
+    """
+
+    def __init__(self, maximalEntries=128, maximalMemory=None):
+        """Initializes the ResultCache.
+
+        :param integer maximalEntries:    Maximal number of cached results.
+        :param integer maximalMemory:    Maximal estimated size of all cached results in bytes.
+            The size of a result is estimated by its storage backend, including the overhead of the
+            Python objects holding the values. :py:const:`None` disables the memory limit.
+
+        :raise:    Raises a :py:exc:`ValueError` if one of the limits is smaller than one.
+        """
+        super(ResultCache, self).__init__()
+
+        if maximalEntries < 1:
+            raise ValueError("maximalEntries has to be larger than zero.")
+        if maximalMemory is not None and maximalMemory < 1:
+            raise ValueError("maximalMemory has to be larger than zero.")
+
+        self._maximalEntries = maximalEntries
+        self._maximalMemory  = maximalMemory
+
+        ## key -> [result, estimated size, digest of the TimeSeries]
+        self._entries = OrderedDict()
+        self._memory  = 0
+        self._lock    = threading.Lock()
+
+        self._hits      = 0
+        self._misses    = 0
+        self._evictions = 0
+
+    def __len__(self):
+        """Returns the number of cached results.
+
+        :return:    Returns the number of cached results.
+        :rtype: integer
+        """
+        return len(self._entries)
+
+    @classmethod
+    def get_key(cls, method, timeSeries):
+        """Returns the cache key for executing the method on the given TimeSeries.
+
+        :param BaseMethod method:    Method that is executed.
+        :param TimeSeries timeSeries:    TimeSeries the method is executed on.
+
+        :return:    Returns a tuple of the TimeSeries fingerprint, the methods class,
+            its parameters and its forecasting goal.
+        :rtype: tuple
+        """
+        return (timeSeries.fingerprint(), method.__class__,
+                tuple(sorted(method._parameters.iteritems())),
+                getattr(method, "_forecastUntil", None))
+
+    @classmethod
+    def _estimate_size(cls, result):
+        """Returns the estimated size of a result in bytes.
+
+        :param TimeSeries result:    Result of a method.
+
+        :return:    Returns the size of the data points of the result, as estimated by its storage backend.
+        :rtype: integer
+        """
+        if not hasattr(result, "_timeseriesData"):
+            return 0
+
+        return result._timeseriesData.estimate_size()
+
+    def execute(self, method, timeSeries):
+        """Executes the method on the given TimeSeries, if the result is not cached already.
+
+        :param BaseMethod method:    Method that is executed.
+        :param TimeSeries timeSeries:    TimeSeries the method is executed on.
+            The TimeSeries has to fullfill the methods requirements.
+
+        :return:    Returns a copy of the cached result of :py:meth:`BaseMethod.execute`.
+        :rtype: TimeSeries
+        """
+        key    = self.get_key(method, timeSeries)
+        digest = self._get_digest(timeSeries)
+
+        with self._lock:
+            entry = self._entries.pop(key, None)
+
+            if entry is not None and entry[2] == digest:
+                self._hits += 1
+                self._entries[key] = entry
+                return copy(entry[0])
+
+            # the data entries were changed without changing the fingerprint
+            if entry is not None:
+                self._memory -= entry[1]
+
+            self._misses += 1
+
+        # the result is calculated without holding the lock
+        result = method.execute(timeSeries)
+
+        with self._lock:
+            self._store(key, copy(result), digest)
+
+        return result
+
+    @classmethod
+    def _get_digest(cls, timeSeries):
+        """Returns the digest used to validate cached results of the given TimeSeries.
+
+        The fingerprint of a TimeSeries does not change if the data entries of the "list" storage backend are
+        changed, so the results of those TimeSeries are validated using :py:meth:`TimeSeries.digest`.
+
+        :param TimeSeries timeSeries:    TimeSeries the method is executed on.
+
+        :return:    Returns the digest of the TimeSeries or :py:const:`None`, if its storage tracks all changes.
+        :rtype: string
+        """
+        if timeSeries._timeseriesData.mutation_count() is not None:
+            return None
+
+        return timeSeries.digest()
+
+    def _store(self, key, result, digest=None):
+        """Stores the result and evicts the least recently used results, if necessary.
+
+        The caller has to hold the lock of the ResultCache.
+
+        :param tuple key:    Key of the result as returned by :py:meth:`ResultCache.get_key`.
+        :param TimeSeries result:    Result that will be cached.
+        :param string digest:    Digest of the TimeSeries as returned by :py:meth:`ResultCache._get_digest`.
+        """
+        size = self._estimate_size(result)
+
+        # results larger than the cache itself are not stored
+        if self._maximalMemory is not None and size > self._maximalMemory:
+            return
+
+        # another thread might have stored the same result already
+        if key in self._entries:
+            self._memory -= self._entries.pop(key)[1]
+
+        self._entries[key] = [result, size, digest]
+        self._memory += size
+
+        while len(self._entries) > self._maximalEntries or \
+              (self._maximalMemory is not None and self._memory > self._maximalMemory):
+            self._memory -= self._entries.popitem(last=False)[1][1]
+            self._evictions += 1
+
+    def clear(self):
+        """Removes all cached results. The statistics are not reset."""
+        with self._lock:
+            self._entries.clear()
+            self._memory = 0
+
+    def get_statistics(self):
+        """Returns the statistics of the ResultCache.
+
+        :return:    Returns a dictionary containing the number of "hits", "misses" and
+            "evictions", the number of cached "entries" and their estimated "memory" in bytes.
+        :rtype: dictionary
+        """
+        return {
+            "hits":      self._hits,
+            "misses":    self._misses,
+            "evictions": self._evictions,
+            "entries":   len(self._entries),
+            "memory":    self._memory
+        }
@@ -0,0 +1,1185 @@
+# !/usr/bin/env python
+#  -*- coding: UTF-8 -*-
+
+# Copyright (c) 2012-2015 Christian Schwarz
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""Module contains the storage backends used to hold the data points of a TimeSeries."""
+
+import mmap
+import os
+import struct
+import sys
+
+from array import array
+from itertools import izip, imap
+from operator import itemgetter
+
+# type code used for all column buffers (C double, float64)
+_TYPECODE = "d"
+
+# Header of the binary TimeSeries file format. All values are stored little endian.
+#   - magic string
+#   - format version
+#   - flags (see below)
+#   - number of columns, including the timestamp column
+#   - number of data points
+#   - first timestamp and distance between two timestamps, if the TimeSeries is normalized
+#   - name of the normalization level, if any
+# The header is followed by one float64 column after the other.
+_FILE_HEADER  = struct.Struct("<8sHHIQdd16s8x")
+_FILE_MAGIC   = "PYCASTTS"
+_FILE_VERSION = 1
+
+# the timestamps are not stored, they are calculated from start and step
+_FLAG_IMPLICIT_TIMESTAMPS = 1
+# the TimeSeries is normalized
+_FLAG_NORMALIZED          = 2
+
+# the columns are stored little endian
+_SWAP_BYTES = "big" == sys.byteorder
+
+# size of a reference within a list
+_POINTER_SIZE = struct.calcsize("P")
+
+# number of values that are read at once while iterating over a mapped column
+_CHUNK_SIZE = 8192
+
+def _get_implicit_timestamps(timestamps):
+    """Determines if the given timestamps can be calculated from the first timestamp and a constant step.
+
+    :param list timestamps:    Sequence of at least two timestamps.
+
+    :return:    Returns a tuple (start, step), if every timestamp is exactly start + idx * step,
+        :py:const:`None` otherwise.
+    :rtype: tuple
+    """
+    if isinstance(timestamps, ImplicitColumn) and timestamps.is_implicit():
+        return timestamps._start, timestamps._step
+
+    start = timestamps[0]
+    step  = timestamps[1] - start
+
+    for idx in xrange(len(timestamps)):
+        if start + idx * step != timestamps[idx]:
+            return None
+
+    return start, step
+
+def _check_column_lengths(columns):
+    """Checks, if all given columns have the same length.
+
+    :param list columns:    List containing the columns.
+
+    :raise:    Raises a :py:exc:`ValueError` if the columns differ in length.
+    """
+    if 1 < len(set(len(column) for column in columns)):
+        raise ValueError("All columns have to have the same length.")
+
+class _RowColumn(object):
+
+    """Read only sequence of the values of one column within a RowStorage."""
+
+    __slots__ = ("_rows", "_column")
+
+    def __init__(self, rows, column):
+        """Initializes the _RowColumn.
+
+        :param RowStorage rows:    Storage containing the data points.
+        :param integer column:    Index of the column.
+        """
+        self._rows   = rows
+        self._column = column
+
+    def __len__(self):
+        """Returns the number of values within the column."""
+        return len(self._rows)
+
+    def __getitem__(self, index):
+        """Returns the value at the given index."""
+        return self._rows[index][self._column]
+
+class RowStorage(list):
+
+    """Stores the data points of a TimeSeries as a list of [timestamp, value, ...] lists.
+
+    This is the default storage backend. Each data point is a separate Python list.
+    Single entries are cheap to access and to modify, but every data point costs
+    more than 100 bytes of memory.
+    """
+
+    def __init__(self, columnCount=2, rows=None):
+        """Initializes the RowStorage.
+
+        :param integer columnCount:    Number of columns per data point, including the timestamp.
+        :param list rows:    List of [timestamp, value, ...] lists containing floats that is used to
+            initialize the storage. The lists are taken over without being copied.
+        """
+        super(RowStorage, self).__init__()
+        self._columnCount = columnCount
+
+        if rows is not None:
+            self.extend(rows)
+
+    def column_count(self):
+        """Returns the number of columns per data point, including the timestamp.
+
+        :return:    Returns the number of columns.
+        :rtype: integer
+        """
+        return self._columnCount
+
+    def mutation_count(self):
+        """Returns the number of changes of stored values.
+
+        The data points are plain lists, so changing them cannot be tracked.
+
+        :return:    Returns :py:const:`None`.
+        :rtype: NoneType
+        """
+        return None
+
+    def get_column(self, column):
+        """Returns all values of the given column.
+
+        :param integer column:    Index of the column. 0 is the timestamp column.
+
+        :return:    Returns a new list containing the column values.
+        :rtype: list
+        """
+        return [row[column] for row in self]
+
+    def get_column_range(self, column, start, stop):
+        """Returns the values of the given column within [start, stop).
+
+        :param integer column:    Index of the column. 0 is the timestamp column.
+        :param integer start:    Index of the first data point.
+        :param integer stop:    Index behind the last data point.
+
+        :return:    Returns a new list containing the column values.
+        :rtype: list
+        """
+        return [row[column] for row in self[start:stop]]
+
+    def get_column_view(self, column):
+        """Returns a read only sequence of the values of the given column without copying them.
+
+        :param integer column:    Index of the column. 0 is the timestamp column.
+
+        :return:    Returns a sequence reading the values from the data points on access.
+        :rtype: object
+        """
+        return _RowColumn(self, column)
+
+    def estimate_size(self):
+        """Returns the estimated memory consumption of the data points.
+
+        :return:    Returns the size of the list, its data point lists and their float objects in bytes.
+        :rtype: integer
+        """
+        # the spare capacity of the lists is ignored to keep the estimate equal for copies
+        listSize  = sys.getsizeof([])
+        pointSize = listSize + self._columnCount * (_POINTER_SIZE + sys.getsizeof(0.0))
+
+        return listSize + len(self) * (_POINTER_SIZE + pointSize)
+
+    def sort_by_timestamp(self, reverse=False):
+        """Sorts the data points by their timestamp.
+
+        The sort is stable, data points with equal timestamps keep their order.
+
+        :param boolean reverse:    Sorts descending, if this is :py:const:`True`.
+        """
+        self.sort(key=itemgetter(0), reverse=reverse)
+
+    @classmethod
+    def from_columns(cls, columns):
+        """Creates a new RowStorage from the given columns.
+
+        :param list columns:    List containing one sequence of floats per column.
+            The first column contains the timestamps.
+
+        :return:    Returns a new RowStorage containing one data point per column entry.
+        :rtype: RowStorage
+
+        :raise:    Raises a :py:exc:`ValueError` if the columns differ in length.
+        """
+        _check_column_lengths(columns)
+        return cls(len(columns), map(list, izip(*columns)))
+
+    def append_columns(self, columns):
+        """Appends one data point per entry of the given columns.
+
+        :param list columns:    List containing one sequence of floats per column.
+            The first column contains the timestamps.
+
+        :raise:    Raises a :py:exc:`ValueError` if the number of columns does not match the storage
+            or if the columns differ in length.
+        """
+        if len(columns) != self._columnCount:
+            raise ValueError("%s columns are required instead of %s." % (self._columnCount, len(columns)))
+
+        _check_column_lengths(columns)
+        self.extend(map(list, izip(*columns)))
+
+    def truncate(self, length):
+        """Removes all data points behind the given length.
+
+        :param integer length:    Number of data points that are kept.
+        """
+        del self[length:]
+
+    def has_implicit_timestamps(self):
+        """Returns if the timestamps are calculated from the first timestamp and a constant step.
+
+        :return:    Returns :py:const:`False`, the RowStorage stores all timestamps.
+        :rtype: boolean
+        """
+        return False
+
+    def to_list(self):
+        """Returns the data points as a two dimensional list.
+
+        :return:    Returns the RowStorage itself, because it already is a two dimensional list.
+        :rtype: list
+        """
+        return self
+
+    def copy(self):
+        """Returns a deep copy of the RowStorage.
+
+        :return:    Returns a new RowStorage containing copies of all data points.
+        :rtype: RowStorage
+        """
+        return RowStorage(self._columnCount, [row[:] for row in self])
+
+class DataPoint(object):
+
+    """Represents a single data point stored within a ColumnStorage.
+
+    A DataPoint behaves like the [timestamp, value, ...] list used by the RowStorage.
+    It does not copy any data but reads from and writes to the columns of its storage.
+
+    :warning:    A DataPoint references a position, not a value. After the storage was
+        sorted, it will represent the data point that is now stored at that position.
+    """
+
+    __slots__ = ("_columns", "_index", "_storage")
+
+    def __init__(self, columns, index, storage=None):
+        """Initializes the DataPoint.
+
+        :param list columns:    List containing the column buffers of the ColumnStorage.
+        :param integer index:    Position of the data point within the columns.
+        :param ColumnStorage storage:    Storage whose mutation count is increased by changes of the DataPoint.
+        """
+        self._columns = columns
+        self._index   = index
+        self._storage = storage
+
+    def __getitem__(self, item):
+        """Returns the value of the item-th column.
+
+        :param item:    Index of the column or a slice of columns.
+
+        :return:    Returns the value, or a list of values if item is a slice.
+        :rtype: float
+        """
+        if isinstance(item, slice):
+            return [column[self._index] for column in self._columns[item]]
+
+        return self._columns[item][self._index]
+
+    def __setitem__(self, item, value):
+        """Sets the value of the item-th column.
+
+        :param integer item:    Index of the column.
+        :param float value:    New value for the column.
+        """
+        self._columns[item][self._index] = value
+
+        if self._storage is not None:
+            self._storage._mutations += 1
+
+    def __len__(self):
+        """Returns the number of columns of the DataPoint."""
+        return len(self._columns)
+
+    def __iter__(self):
+        """Returns an iterator over the column values of the DataPoint."""
+        index = self._index
+        return (column[index] for column in self._columns)
+
+    def __eq__(self, other):
+        """Returns if the DataPoint contains the same values as the other sequence."""
+        try:
+            return list(self) == list(other)
+        except TypeError:
+            return False
+
+    def __ne__(self, other):
+        """Returns if the DataPoint and the other sequence differ."""
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        """Returns the string representation of the corresponding [timestamp, value, ...] list."""
+        return repr(list(self))
+
+class ColumnStorage(object):
+
+    """Stores the data points of a TimeSeries in contiguous float64 columns.
+
+    One :py:class:`array.array` buffer is used per column. This reduces the
+    memory consumption to 8 bytes per value and allows bulk operations to run
+    directly on the columns, as returned by :py:meth:`ColumnStorage.get_column`.
+    Single data points are exposed as :py:class:`DataPoint` instances.
+    """
+
+    def __init__(self, columnCount=2, rows=None):
+        """Initializes the ColumnStorage.
+
+        :param integer columnCount:    Number of columns per data point, including the timestamp.
+        :param list rows:    List of [timestamp, value, ...] lists used to initialize the storage.
+        """
+        super(ColumnStorage, self).__init__()
+
+        # the list itself is never replaced, because DataPoints reference it
+        self._columns = [array(_TYPECODE) for dummy in xrange(columnCount)]
+
+        # number of values changed using __setitem__ or DataPoints
+        self._mutations = 0
+
+        if rows is not None:
+            for idx, column in enumerate(self._columns):
+                column.extend([row[idx] for row in rows])
+
+    def column_count(self):
+        """Returns the number of columns per data point, including the timestamp.
+
+        :return:    Returns the number of columns.
+        :rtype: integer
+        """
+        return len(self._columns)
+
+    def mutation_count(self):
+        """Returns the number of changes of stored values.
+
+        Changes using :py:meth:`ColumnStorage.__setitem__` or the returned :py:class:`DataPoint`
+        instances are counted. Appending or removing data points does not change the count.
+
+        :return:    Returns the number of changes.
+        :rtype: integer
+        """
+        return self._mutations
+
+    def get_column(self, column):
+        """Returns the buffer of the given column.
+
+        :param integer column:    Index of the column. 0 is the timestamp column.
+
+        :return:    Returns the column buffer itself.
+        :rtype: array.array
+
+        :warning:    The returned buffer is not a copy and has to be treated as read only.
+        """
+        return self._columns[column]
+
+    def get_column_range(self, column, start, stop):
+        """Returns the values of the given column within [start, stop).
+
+        :param integer column:    Index of the column. 0 is the timestamp column.
+        :param integer start:    Index of the first data point.
+        :param integer stop:    Index behind the last data point.
+
+        :return:    Returns a new array containing the column values.
+        :rtype: array.array
+        """
+        return self._columns[column][start:stop]
+
+    def get_column_view(self, column):
+        """Returns a read only sequence of the values of the given column without copying them.
+
+        :param integer column:    Index of the column. 0 is the timestamp column.
+
+        :return:    Returns the column itself.
+        :rtype: object
+        """
+        return self._columns[column]
+
+    def estimate_size(self):
+        """Returns the estimated memory consumption of the data points.
+
+        :return:    Returns the size of the column arrays in bytes.
+        :rtype: integer
+        """
+        # the spare capacity of the arrays is ignored to keep the estimate equal for copies
+        arraySize = sys.getsizeof(array(_TYPECODE))
+
+        size = sys.getsizeof([]) + len(self._columns) * _POINTER_SIZE
+        for column in self._columns:
+            if isinstance(column, array):
+                size += arraySize + column.itemsize * len(column)
+            else:
+                size += sys.getsizeof(column)
+
+        return size
+
+    def __len__(self):
+        """Returns the number of data points stored."""
+        return len(self._columns[0])
+
+    def __getitem__(self, index):
+        """Returns the data point stored at the given position.
+
+        :param index:    Position of the data point or a slice of positions.
+
+        :return:    Returns a DataPoint, or a list of DataPoints if index is a slice.
+        :rtype: DataPoint
+
+        :raise:    Raises an :py:exc:`IndexError` if the index is out of range.
+        """
+        length = len(self)
+
+        if isinstance(index, slice):
+            return [DataPoint(self._columns, idx, self) for idx in xrange(*index.indices(length))]
+
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("ColumnStorage index out of range")
+
+        return DataPoint(self._columns, index, self)
+
+    def __setitem__(self, index, row):
+        """Replaces the data point stored at the given position.
+
+        :param integer index:    Position of the data point.
+        :param list row:    A list of the form [timestamp, value, ...].
+
+        :raise:    Raises an :py:exc:`IndexError` if the index is out of range.
+        """
+        for column, value in izip(self._columns, row):
+            column[index] = value
+
+        self._mutations += 1
+
+    def __iter__(self):
+        """Returns an iterator over all data points."""
+        columns = self._columns
+        return (DataPoint(columns, idx, self) for idx in xrange(len(self)))
+
+    def append(self, row):
+        """Appends a data point to the storage.
+
+        :param list row:    A list of the form [timestamp, value, ...].
+
+        :raise:    Raises a :py:exc:`ValueError` if row does not contain one value per column.
+        """
+        if len(row) != len(self._columns):
+            raise ValueError("row has to contain %s values." % len(self._columns))
+
+        for column, value in izip(self._columns, row):
+            column.append(value)
+
+    def append_columns(self, columns):
+        """Appends one data point per entry of the given columns.
+
+        :param list columns:    List containing one sequence of floats per column.
+            The first column contains the timestamps.
+
+        :raise:    Raises a :py:exc:`ValueError` if the number of columns does not match the storage
+            or if the columns differ in length.
+        """
+        if len(columns) != len(self._columns):
+            raise ValueError("%s columns are required instead of %s." % (len(self._columns), len(columns)))
+
+        _check_column_lengths(columns)
+        for column, values in izip(self._columns, columns):
+            column.extend(values)
+
+    def truncate(self, length):
+        """Removes all data points behind the given length.
+
+        :param integer length:    Number of data points that are kept.
+        """
+        for column in self._columns:
+            del column[length:]
+
+    def has_implicit_timestamps(self):
+        """Returns if the timestamps are calculated from the first timestamp and a constant step.
+
+        :return:    Returns :py:const:`False`, the ColumnStorage stores all timestamps.
+        :rtype: boolean
+        """
+        return False
+
+    def sort_by_timestamp(self, reverse=False):
+        """Sorts the data points by their timestamp.
+
+        The sort is stable, data points with equal timestamps keep their order.
+
+        :param boolean reverse:    Sorts descending, if this is :py:const:`True`.
+        """
+        timestamps = self._columns[0]
+        order      = sorted(xrange(len(timestamps)), key=timestamps.__getitem__, reverse=reverse)
+
+        for idx, column in enumerate(self._columns):
+            self._columns[idx] = array(_TYPECODE, [column[position] for position in order])
+
+    @classmethod
+    def from_columns(cls, columns):
+        """Creates a new ColumnStorage from the given columns.
+
+        :param list columns:    List containing one sequence of floats per column.
+            The first column contains the timestamps.
+
+        :return:    Returns a new ColumnStorage containing copies of the given columns.
+        :rtype: ColumnStorage
+
+        :raise:    Raises a :py:exc:`ValueError` if the columns differ in length.
+        """
+        _check_column_lengths(columns)
+
+        storage = cls(len(columns))
+        for idx, column in enumerate(columns):
+            storage._columns[idx] = array(_TYPECODE, column)
+
+        return storage
+
+    def to_list(self):
+        """Returns the data points as a two dimensional list.
+
+        :return:    Returns a new list containing one [timestamp, value, ...] list per data point.
+        :rtype: list
+        """
+        return [list(row) for row in izip(*self._columns)]
+
+    def copy(self):
+        """Returns a copy of the ColumnStorage.
+
+        :return:    Returns a new ColumnStorage containing copies of all column buffers.
+        :rtype: ColumnStorage
+        """
+        return ColumnStorage.from_columns(self._columns)
+
+def write_binary_file(datafile, columns, isNormalized=False, normalizationLevel=None):
+    """Writes the given columns in the binary TimeSeries file format.
+
+    The timestamps of a normalized TimeSeries are not stored, if they can be calculated
+    exactly from the first timestamp and the distance between two timestamps.
+
+    :param file datafile:    File opened for binary writing.
+    :param list columns:    List containing one sequence of floats per column, ordered
+        ascending by the timestamps in the first column.
+    :param boolean isNormalized:    Determines if the columns represent a normalized TimeSeries.
+    :param string normalizationLevel:    Name of the normalization level of the TimeSeries, if any.
+
+    :raise:    Raises a :py:exc:`ValueError` if the columns differ in length.
+    """
+    _check_column_lengths(columns)
+
+    timestamps = columns[0]
+    length     = len(timestamps)
+    flags      = 0
+    start      = 0.0
+    step       = 0.0
+
+    if isNormalized:
+        flags |= _FLAG_NORMALIZED
+
+        geometry = None
+        if 1 < length:
+            geometry = _get_implicit_timestamps(timestamps)
+
+        if geometry is not None:
+            start, step = geometry
+            flags      |= _FLAG_IMPLICIT_TIMESTAMPS
+            columns     = columns[1:]
+
+    datafile.write(_FILE_HEADER.pack(_FILE_MAGIC, _FILE_VERSION, flags, len(columns) + (flags & _FLAG_IMPLICIT_TIMESTAMPS),
+                                     length, start, step, normalizationLevel or ""))
+
+    for column in columns:
+        column = array(_TYPECODE, column)
+        if _SWAP_BYTES:
+            column.byteswap()
+        column.tofile(datafile)
+
+def pack_columns(columns):
+    """Packs the given columns into one contiguous buffer of little endian float64 values.
+
+    :param list columns:    List containing one sequence of floats per column.
+
+    :return:    Returns a string containing one column after the other.
+    :rtype: string
+
+    :raise:    Raises a :py:exc:`ValueError` if the columns differ in length.
+    """
+    _check_column_lengths(columns)
+
+    buffer = array(_TYPECODE)
+    for column in columns:
+        buffer.extend(column)
+
+    if _SWAP_BYTES:
+        buffer.byteswap()
+
+    return buffer.tostring()
+
+def unpack_columns(data, columnCount):
+    """Unpacks the columns packed by :py:func:`pack_columns`.
+
+    :param string data:    String containing the packed columns.
+    :param integer columnCount:    Number of packed columns.
+
+    :return:    Returns a list containing one array per column.
+    :rtype: list
+
+    :raise:    Raises a :py:exc:`ValueError` if the size of data does not match the number of columns.
+    """
+    buffer = array(_TYPECODE)
+    buffer.fromstring(data)
+    if _SWAP_BYTES:
+        buffer.byteswap()
+
+    length = len(buffer) // columnCount
+    if length * columnCount != len(buffer):
+        raise ValueError("data does not contain %s columns of equal length." % columnCount)
+
+    return [buffer[idx * length:(idx + 1) * length] for idx in xrange(columnCount)]
+
+class _MappedColumn(object):
+
+    """Read only sequence of the float64 values of one column within a memory mapped file."""
+
+    __slots__ = ("_buffer", "_offset", "_length")
+
+    def __init__(self, buffer, offset, length):
+        """Initializes the _MappedColumn.
+
+        :param mmap buffer:    Memory mapped file containing the column.
+        :param integer offset:    Position of the first value within the buffer in bytes.
+        :param integer length:    Number of values within the column.
+        """
+        self._buffer = buffer
+        self._offset = offset
+        self._length = length
+
+    def __len__(self):
+        """Returns the number of values within the column."""
+        return self._length
+
+    def _read(self, start, stop):
+        """Reads the values within [start, stop) into a new array."""
+        values = array(_TYPECODE)
+        if start < stop:
+            values.fromstring(self._buffer[self._offset + 8 * start:self._offset + 8 * stop])
+            if _SWAP_BYTES:
+                values.byteswap()
+
+        return values
+
+    def __getitem__(self, index):
+        """Returns the value at the given index, slices return a new array."""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            if 1 == step:
+                return self._read(start, stop)
+
+            return array(_TYPECODE, [self[idx] for idx in xrange(start, stop, step)])
+
+        if index < 0:
+            index += self._length
+
+        if not 0 <= index < self._length:
+            raise IndexError("column index out of range")
+
+        return struct.unpack_from("<d", self._buffer, self._offset + 8 * index)[0]
+
+    def __iter__(self):
+        """Iterates over the values of the column, reading them in chunks."""
+        for start in xrange(0, self._length, _CHUNK_SIZE):
+            for value in self._read(start, min(start + _CHUNK_SIZE, self._length)):
+                yield value
+
+class ImplicitColumn(object):
+
+    """Read only sequence of the timestamps of a normalized TimeSeries, calculated from start and step.
+
+    The timestamp at the index idx is start + idx * step.
+    """
+
+    __slots__ = ("_start", "_step", "_length")
+
+    def __init__(self, start, step, length):
+        """Initializes the ImplicitColumn.
+
+        :param float start:    First timestamp.
+        :param float step:    Distance between two timestamps.
+        :param integer length:    Number of timestamps.
+        """
+        self._start  = start
+        self._step   = step
+        self._length = length
+
+    def __len__(self):
+        """Returns the number of timestamps."""
+        return self._length
+
+    def __getitem__(self, index):
+        """Returns the timestamp at the given index, slices return a new array."""
+        if isinstance(index, slice):
+            start, step = self._start, self._step
+            return array(_TYPECODE, [start + idx * step for idx in xrange(*index.indices(self._length))])
+
+        if index < 0:
+            index += self._length
+
+        if not 0 <= index < self._length:
+            raise IndexError("column index out of range")
+
+        return self._start + index * self._step
+
+    def __iter__(self):
+        """Iterates over the timestamps."""
+        start, step = self._start, self._step
+        for idx in xrange(self._length):
+            yield start + idx * step
+
+    def is_implicit(self):
+        """Returns if all timestamps are calculated from start and step."""
+        return True
+
+class MappedColumnStorage(object):
+
+    """Provides read only access to the data points stored in a binary TimeSeries file.
+
+    The file is memory mapped, data points are read on access only. The data points
+    are returned as new lists, so changing them does not change the file.
+    """
+
+    def __init__(self, filepath):
+        """Opens the binary TimeSeries file.
+
+        :param string filepath:    Path of the file written by :py:func:`write_binary_file`.
+
+        :raise:    Raises a :py:exc:`ValueError` if the file is not a valid binary TimeSeries file.
+        :raise:    Raises an :py:exc:`IOError` if the file cannot be opened.
+        """
+        super(MappedColumnStorage, self).__init__()
+
+        filesize = os.path.getsize(filepath)
+        if filesize < _FILE_HEADER.size:
+            raise ValueError("%s is not a binary TimeSeries file." % filepath)
+
+        with open(filepath, "rb") as datafile:
+            self._buffer = mmap.mmap(datafile.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # the file is not used if the header is invalid
+        try:
+            magic, version, flags, columnCount, length, start, step, level = _FILE_HEADER.unpack_from(self._buffer)
+            if magic != _FILE_MAGIC or version != _FILE_VERSION:
+                raise ValueError("%s is not a binary TimeSeries file." % filepath)
+
+            storedColumns = columnCount - (flags & _FLAG_IMPLICIT_TIMESTAMPS)
+            if filesize != _FILE_HEADER.size + 8 * length * storedColumns:
+                raise ValueError("%s is truncated." % filepath)
+        except:
+            self._buffer.close()
+            raise
+
+        self._columns = []
+        if flags & _FLAG_IMPLICIT_TIMESTAMPS:
+            self._columns.append(ImplicitColumn(start, step, length))
+
+        for idx in xrange(storedColumns):
+            self._columns.append(_MappedColumn(self._buffer, _FILE_HEADER.size + 8 * length * idx, length))
+
+        self._length             = length
+        self._isNormalized       = bool(flags & _FLAG_NORMALIZED)
+        self._normalizationLevel = level.rstrip("\x00") or None
+
+    def close(self):
+        """Closes the memory mapped file. The storage cannot be used afterwards."""
+        self._buffer.close()
+
+    def column_count(self):
+        """Returns the number of columns per data point, including the timestamp."""
+        return len(self._columns)
+
+    def mutation_count(self):
+        """Returns the number of changes of stored values, which is zero for the read only file."""
+        return 0
+
+    def is_normalized(self):
+        """Returns if the stored TimeSeries was normalized."""
+        return self._isNormalized
+
+    def normalization_level(self):
+        """Returns the name of the normalization level of the stored TimeSeries or :py:const:`None`."""
+        return self._normalizationLevel
+
+    def has_implicit_timestamps(self):
+        """Returns if the timestamps are calculated from the first timestamp and a constant step."""
+        return isinstance(self._columns[0], ImplicitColumn)
+
+    def __len__(self):
+        """Returns the number of data points stored."""
+        return self._length
+
+    def __getitem__(self, index):
+        """Returns the data point at the given index as a new list.
+
+        :param integer index:    Index of the data point. Slices return a list of data points.
+
+        :return:    Returns the [timestamp, value, ...] list.
+        :rtype: list
+
+        :raise:    Raises an :py:exc:`IndexError` if the index is out of range.
+        """
+        if isinstance(index, slice):
+            return map(list, izip(*[column[index] for column in self._columns]))
+
+        return [column[index] for column in self._columns]
+
+    def __setitem__(self, index, row):
+        """The data points of a MappedColumnStorage cannot be changed.
+
+        :raise:    Raises a :py:exc:`TypeError`.
+        """
+        raise TypeError("A MappedColumnStorage is read only.")
+
+    def __iter__(self):
+        """Returns an iterator over the data points as new lists."""
+        return imap(list, izip(*self._columns))
+
+    def append(self, row):
+        """The data points of a MappedColumnStorage cannot be changed.
+
+        :raise:    Raises a :py:exc:`TypeError`.
+        """
+        raise TypeError("A MappedColumnStorage is read only.")
+
+    def append_columns(self, columns):
+        """The data points of a MappedColumnStorage cannot be changed.
+
+        :raise:    Raises a :py:exc:`TypeError`.
+        """
+        raise TypeError("A MappedColumnStorage is read only.")
+
+    def truncate(self, length):
+        """The data points of a MappedColumnStorage cannot be changed.
+
+        :raise:    Raises a :py:exc:`TypeError`.
+        """
+        raise TypeError("A MappedColumnStorage is read only.")
+
+    def get_column(self, column):
+        """Returns the given column.
+
+        :param integer column:    Index of the column. 0 is the timestamp column.
+
+        :return:    Returns a read only sequence that reads the values from the file on access.
+            Slices of that sequence are arrays.
+        :rtype: object
+        """
+        return self._columns[column]
+
+    def get_column_range(self, column, start, stop):
+        """Returns the values of the given column within [start, stop).
+
+        :param integer column:    Index of the column. 0 is the timestamp column.
+        :param integer start:    Index of the first data point.
+        :param integer stop:    Index behind the last data point.
+
+        :return:    Returns a new array containing the column values.
+        :rtype: array.array
+        """
+        return self._columns[column][start:stop]
+
+    def get_column_view(self, column):
+        """Returns a read only sequence of the values of the given column without copying them.
+
+        :param integer column:    Index of the column. 0 is the timestamp column.
+
+        :return:    Returns the column itself.
+        :rtype: object
+        """
+        return self._columns[column]
+
+    def estimate_size(self):
+        """Returns the estimated memory consumption of the data points.
+
+        :return:    Returns the size of the memory mapped file in bytes.
+        :rtype: integer
+        """
+        return len(self._buffer)
+
+    def sort_by_timestamp(self, reverse=False):
+        """The data points of a binary TimeSeries file are sorted ascending already.
+
+        :param boolean reverse:    Has to be :py:const:`False`.
+
+        :raise:    Raises a :py:exc:`TypeError` if a descending order is requested.
+        """
+        if reverse:
+            raise TypeError("A MappedColumnStorage is read only.")
+
+    def to_list(self):
+        """Returns the data points as a two dimensional list.
+
+        :return:    Returns a new list of [timestamp, value, ...] lists.
+        :rtype: list
+        """
+        return list(self)
+
+    def copy(self):
+        """Returns a copy of the data points that is held in memory.
+
+        :return:    Returns a new ColumnStorage containing the data points.
+        :rtype: ColumnStorage
+        """
+        return ColumnStorage.from_columns([column[:] for column in self._columns])
+
+class _ImplicitTimestampColumn(ImplicitColumn):
+
+    """Timestamp column of an ImplicitTimestampStorage.
+
+    Appended timestamps that do not fit start + idx * step are stored explicitly behind
+    the calculated ones, until they get truncated again. If a calculated timestamp is
+    changed, the column replaces itself by an array within the columns of its storage.
+    """
+
+    __slots__ = ("_owner", "_extra")
+
+    def __init__(self, owner, start=0.0, step=0.0, length=0):
+        """Initializes the _ImplicitTimestampColumn.
+
+        :param list owner:    List containing the columns of the storage. The column is its first item.
+        :param float start:    First timestamp.
+        :param float step:    Distance between two timestamps.
+        :param integer length:    Number of timestamps.
+        """
+        super(_ImplicitTimestampColumn, self).__init__(start, step, length)
+        self._owner = owner
+        self._extra = array(_TYPECODE)
+
+    def is_implicit(self):
+        """Returns if all timestamps are calculated from start and step."""
+        return 0 == len(self._extra)
+
+    def __sizeof__(self):
+        """Returns the size of the column including the explicitly stored timestamps."""
+        return super(_ImplicitTimestampColumn, self).__sizeof__() + sys.getsizeof(array(_TYPECODE)) + 8 * len(self._extra)
+
+    def _materialize(self):
+        """Replaces the column within its storage by an array containing all timestamps.
+
+        :return:    Returns the new array.
+        :rtype: array.array
+        """
+        column = array(_TYPECODE, self)
+        self._owner[0] = column
+        return column
+
+    def fits(self, timestamp):
+        """Returns if the given timestamp can be appended without storing it.
+
+        :param float timestamp:    Timestamp that should be appended.
+
+        :return:    Returns :py:const:`True` if the timestamp equals start + length * step.
+        :rtype: boolean
+        """
+        if 0 < len(self._extra):
+            return False
+
+        if 0 == self._length:
+            return True
+
+        if 1 == self._length:
+            return self._start + (timestamp - self._start) == timestamp
+
+        return self._start + self._length * self._step == timestamp
+
+    def append(self, timestamp):
+        """Appends the given timestamp to the column."""
+        if not self.fits(timestamp):
+            self._extra.append(timestamp)
+            return
+
+        if 0 == self._length:
+            self._start = timestamp
+        elif 1 == self._length:
+            self._step = timestamp - self._start
+
+        self._length += 1
+
+    def extend(self, timestamps):
+        """Appends all given timestamps to the column."""
+        append = self.append
+        for timestamp in timestamps:
+            append(timestamp)
+
+    def __len__(self):
+        """Returns the number of timestamps."""
+        return self._length + len(self._extra)
+
+    def __getitem__(self, index):
+        """Returns the timestamp at the given index, slices return a new array."""
+        if isinstance(index, slice):
+            return array(_TYPECODE, [self[idx] for idx in xrange(*index.indices(len(self)))])
+
+        if index < 0:
+            index += len(self)
+
+        if self._length <= index:
+            return self._extra[index - self._length]
+
+        if index < 0:
+            raise IndexError("column index out of range")
+
+        return self._start + index * self._step
+
+    def __iter__(self):
+        """Iterates over the timestamps."""
+        for timestamp in super(_ImplicitTimestampColumn, self).__iter__():
+            yield timestamp
+
+        for timestamp in self._extra:
+            yield timestamp
+
+    def __setitem__(self, index, value):
+        """Sets the timestamp at the given index, storing all timestamps if required."""
+        if self[index] == value:
+            return
+
+        if index < 0:
+            index += len(self)
+
+        if self._length <= index:
+            self._extra[index - self._length] = value
+        else:
+            self._materialize()[index] = value
+
+    def __delitem__(self, index):
+        """Deletes the given timestamps, storing all timestamps if they are not at the end of the column."""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if 1 == step and stop == len(self):
+                if start <= self._length:
+                    self._length = start
+                    self._extra  = array(_TYPECODE)
+                else:
+                    del self._extra[start - self._length:]
+
+                return
+
+        del self._materialize()[index]
+
+class ImplicitTimestampStorage(ColumnStorage):
+
+    """Stores the data points of a normalized TimeSeries without storing their timestamps.
+
+    As long as all timestamps are exactly start + idx * step, only start and step
+    are stored and the timestamps are calculated on access. This halves the memory
+    consumption of a normalized TimeSeries compared to the ColumnStorage and
+    allows to check its normalization in constant time. The values are stored like
+    within a :py:class:`ColumnStorage`. Timestamps that do not fit are stored
+    explicitly and the storage behaves like a ColumnStorage from then on.
+    """
+
+    def __init__(self, columnCount=2, rows=None):
+        """Initializes the ImplicitTimestampStorage.
+
+        :param integer columnCount:    Number of columns per data point, including the timestamp.
+        :param list rows:    List of [timestamp, value, ...] lists used to initialize the storage.
+        """
+        super(ImplicitTimestampStorage, self).__init__(columnCount, rows)
+        self._compact_timestamps()
+
+    def _compact_timestamps(self):
+        """Replaces the stored timestamps by start and step, if possible."""
+        timestamps = self._columns[0]
+        if isinstance(timestamps, ImplicitColumn) and timestamps.is_implicit():
+            return
+
+        length   = len(timestamps)
+        geometry = (0.0, 0.0)
+        if 1 == length:
+            geometry = (timestamps[0], 0.0)
+        elif 1 < length:
+            geometry = _get_implicit_timestamps(timestamps)
+
+        if geometry is not None:
+            self._columns[0] = _ImplicitTimestampColumn(self._columns, geometry[0], geometry[1], length)
+
+    def has_implicit_timestamps(self):
+        """Returns if the timestamps are calculated from the first timestamp and a constant step.
+
+        :return:    Returns :py:const:`True` if no timestamp is stored.
+        :rtype: boolean
+        """
+        timestamps = self._columns[0]
+        return isinstance(timestamps, ImplicitColumn) and timestamps.is_implicit()
+
+    def sort_by_timestamp(self, reverse=False):
+        """Sorts the data points by their timestamp.
+
+        The sort is stable, data points with equal timestamps keep their order.
+
+        :param boolean reverse:    Sorts descending, if this is :py:const:`True`.
+        """
+        super(ImplicitTimestampStorage, self).sort_by_timestamp(reverse)
+        self._compact_timestamps()
+
+    @classmethod
+    def from_columns(cls, columns):
+        """Creates a new ImplicitTimestampStorage from the given columns.
+
+        :param list columns:    List containing one sequence of floats per column.
+            The first column contains the timestamps.
+
+        :return:    Returns a new ImplicitTimestampStorage containing copies of the given columns.
+        :rtype: ImplicitTimestampStorage
+
+        :raise:    Raises a :py:exc:`ValueError` if the columns differ in length.
+        """
+        _check_column_lengths(columns)
+
+        storage = cls(len(columns))
+        for idx, column in enumerate(columns):
+            if isinstance(column, ImplicitColumn) and column.is_implicit():
+                storage._columns[idx] = _ImplicitTimestampColumn(storage._columns, column._start, column._step, len(column))
+            else:
+                storage._columns[idx] = array(_TYPECODE, column)
+
+        storage._compact_timestamps()
+        return storage
+
+    def copy(self):
+        """Returns a copy of the ImplicitTimestampStorage.
+
+        :return:    Returns a new ImplicitTimestampStorage containing copies of all columns.
+        :rtype: ImplicitTimestampStorage
+        """
+        return ImplicitTimestampStorage.from_columns(self._columns)
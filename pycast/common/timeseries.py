@@ -27,10 +27,24 @@
 import time
 import random
 import os
+import json
+import hashlib
+import re
+
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import izip, imap, islice, chain
+from operator import le
 
 # some string constants
 _STR_EPOCHS = "UNIX-epochs"
 
+# number of data points that are formatted at once when writing gnuplot data files
+_GNUPLOT_CHUNK_SIZE = 8192
+
+# table and column names that can be used within SQL statements without quoting them
+_SQL_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*\Z")
+
 os.environ['TZ'] = 'GMT'
 
 # Time series levels that can be used for normalization.
@@ -45,7 +59,9 @@ NormalizationLevels = {
 }
 
 # Fusion methods that can be used to fusionate multiple data points within
-# the same time bucket. This might sort the list it is used on.
+# the same time bucket. Each method gets called once per bucket with a slice of
+# the value column (a list or an array.array, depending on the storage backend).
+# Additional methods can be plugged in by adding them to this dictionary.
 FusionMethods = {
     "mean":       lambda l: sum(l) / float(len(l)),    # pragma: no cover
     "median":     lambda l: sorted(l)[len(l)//2],      # pragma: no cover
@@ -58,7 +74,77 @@ InterpolationMethods = {
     "linear": linear_interpolation
 }
 
+# Storage backends that can be used to hold the data points of a TimeSeries.
+from storage import RowStorage, ColumnStorage, ImplicitTimestampStorage, MappedColumnStorage, ImplicitColumn, write_binary_file
+from storage import pack_columns, unpack_columns
+StorageBackends = {
+    "list":     RowStorage,
+    "column":   ColumnStorage,
+    "implicit": ImplicitTimestampStorage
+}
+
+# Placeholders used within SQL statements, depending on the paramstyle of the database module.
+SQLParameterStyles = {
+    "qmark":    "?",
+    "format":   "%s",
+    "pyformat": "%s"
+}
+
+from timestampparser import get_timestamp_parser
 from pycastobject import PyCastObject
+def write_gnuplot_datafile(datafilepath, timeSeriesList, titles=None):
+    """Dumps all given TimeSeries into one gnuplot compatible data file.
+
+    Each TimeSeries is written as a separate data block. The blocks are separated by two
+    empty lines, so each of them can be selected using the index keyword of gnuplot.
+
+    :param string datafilepath:    Path used to create the file. If that file already exists,
+        it will be overwritten!
+    :param list timeSeriesList:    List containing the TimeSeries and MultiDimensionalTimeSeries instances.
+    :param list titles:    Optional list containing one title per TimeSeries. The titles are
+        written as a comment in front of each block.
+
+    :return:   Returns :py:const:`True` if the data could be written, :py:const:`False` otherwise.
+    :rtype:    boolean
+    """
+    try:
+        datafile = file(datafilepath, "wb")
+    except Exception:
+        return False
+
+    with datafile:
+        for blockIdx, timeSeries in enumerate(timeSeriesList):
+            if 0 < blockIdx:
+                datafile.write("\n\n")
+
+            if titles is not None:
+                datafile.write("# %s\n" % titles[blockIdx])
+
+            for chunk in timeSeries._format_gnuplot_chunks():
+                datafile.write(chunk)
+
+    return True
+
+def _equal_columns(columns, otherColumns):
+    """Returns if the given columns contain equal values.
+
+    :param list columns:    List containing one sequence of floats per column.
+    :param list otherColumns:    List containing one sequence of floats per column.
+
+    :return:    Returns :py:const:`True` if all columns are equal, :py:const:`False` otherwise.
+    :rtype: boolean
+    """
+    for column, otherColumn in izip(columns, otherColumns):
+        # lists and arrays are compared at once, other sequences do not support comparison
+        if type(column) is not type(otherColumn) or not isinstance(column, (list, array)):
+            column      = list(column)
+            otherColumn = list(otherColumn)
+
+        if column != otherColumn:
+            return False
+
+    return True
+
 class TimeSeries(PyCastObject):
 
     """A TimeSeries instance stores all relevant data for a real world time series.
@@ -66,7 +152,7 @@ class TimeSeries(PyCastObject):
     :warning: TimeSeries instances are NOT thread-safe.
     """
 
-    def __init__(self, isNormalized=False, isSorted=False):
+    def __init__(self, isNormalized=False, isSorted=False, storage="list"):
         """Initializes the TimeSeries.
 
         :param boolean isNormalized:    Within a normalized TimeSeries, all data points
@@ -77,7 +163,14 @@ class TimeSeries(PyCastObject):
             TimeSeries normalization can be forced by executing :py:meth:`TimeSeries.normalize`.
         :param boolean isSorted:    If all data points added to the time series are added
             in their ascending temporal order, this should set to :py:const:`True`.
+        :param string storage:    Storage backend used to hold the data points.
+            The available storage backends are defined in :py:data:`timeseries.StorageBackends`.
+
+        :raise: Raises a :py:exc:`ValueError` if storage has an unknown value.
         """
+        if storage not in StorageBackends:
+            raise ValueError("Storage backend %s is unknown." % storage)
+
         super(TimeSeries, self).__init__()
         self._normalized           = True
         self._normalizationLevel   = None
@@ -86,10 +179,103 @@ class TimeSeries(PyCastObject):
         self._sorted               = isSorted
         self._predefinedSorted     = isSorted
 
-        self._timeseriesData = []
+        self._storage        = storage
+        self._timeseriesData = self._create_storage()
+
+        # required to normalize data entries appended after TimeSeries.normalize
+        self._normalizationState = None
 
         self._timestampFormat = None
 
+        self._sqlLoadStatistics = None
+
+        # [hash object, number of hashed data entries, hashed storage], see TimeSeries.fingerprint
+        self._fingerprintState = None
+
+    def _column_count(self):
+        """Returns the number of columns each data point consists of, including the timestamp.
+
+        :return:    Returns the number of columns.
+        :rtype: integer
+        """
+        return 2
+
+    def _create_storage(self, rows=None):
+        """Creates a new storage of the TimeSeries storage backend.
+
+        :param list rows:    List of [timestamp, value, ...] lists containing floats that is used
+            to initialize the storage.
+
+        :return:    Returns the new storage.
+        :rtype: RowStorage or ColumnStorage
+        """
+        return StorageBackends[self._storage](self._column_count(), rows)
+
+    def _create_empty(self, isNormalized=False, isSorted=False):
+        """Creates a new, empty TimeSeries with the same dimensions and storage backend as :py:obj:`self`.
+
+        :param boolean isNormalized:    See :py:meth:`TimeSeries.__init__`.
+        :param boolean isSorted:    See :py:meth:`TimeSeries.__init__`.
+
+        :return:    Returns the new TimeSeries.
+        :rtype: TimeSeries
+        """
+        return TimeSeries(isNormalized, isSorted, storage=self._storage)
+
+    def _initialize_from_columns(self, columns, assumeSorted=False, assumeNormalized=False):
+        """Replaces all data points of the TimeSeries with the given columns at once.
+
+        :param list columns:    List containing one sequence of numeric values per column.
+            The first column contains the timestamps as UNIX epochs.
+        :param boolean assumeSorted:    If this is :py:const:`True`, the columns are expected to be
+            ordered ascending by their timestamps and are not sorted again.
+        :param boolean assumeNormalized:    If this is :py:const:`True`, the columns are expected to
+            be normalized and the normalization is not checked.
+
+        :return:    Returns :py:obj:`self` for convenience.
+        :rtype:     TimeSeries
+
+        :raise: Raises a :py:exc:`ValueError` if the number of columns does not match the
+            TimeSeries or if the columns differ in length.
+        """
+        if len(columns) != self._column_count():
+            raise ValueError("%s columns are required instead of %s." % (self._column_count(), len(columns)))
+
+        columns = [map(float, column) for column in columns]
+        self._timeseriesData     = StorageBackends[self._storage].from_columns(columns)
+        self._normalizationState = None
+
+        self._sorted = assumeSorted
+        self.sort_timeseries()
+
+        self._normalized = assumeNormalized or self._check_normalization()
+
+        return self
+
+    def get_column(self, column):
+        """Returns all values of one column of the TimeSeries.
+
+        :param integer column:    Index of the column. 0 returns the timestamps, 1 the values.
+
+        :return:    Returns a sequence containing the values of the column.
+            Depending on the storage backend this is either a new list or the column buffer itself,
+            so it has to be treated as read only.
+        :rtype: list or array.array
+        """
+        return self._timeseriesData.get_column(column)
+
+    def view(self, start=0, stop=None):
+        """Returns a view on the data entries within [start, stop) that does not copy them.
+
+        :param integer start:    Index of the first data entry. Negative values count from the end, like for slices.
+        :param integer stop:    Index behind the last data entry. If this is :py:const:`None`,
+            the view ends at the last data entry.
+
+        :return:    Returns a TimeSeriesView referencing the data entries of :py:obj:`self`.
+        :rtype: TimeSeriesView
+        """
+        return TimeSeriesView(self, start, stop)
+
     def set_timeformat(self, tsformat=None):
         """Sets the TimeSeries global time format.
 
@@ -100,43 +286,184 @@ class TimeSeries(PyCastObject):
         """
         self._timestampFormat = tsformat
 
+    def get_timeformat(self):
+        """Returns the TimeSeries global time format.
+
+        :return:    Returns the format set by :py:meth:`TimeSeries.set_timeformat` or :py:const:`None`,
+            if the timestamps are serialized as UNIX epochs.
+        :rtype: string
+        """
+        return self._timestampFormat
+
     def to_gnuplot_datafile(self, datafilepath):
         """Dumps the TimeSeries into a gnuplot compatible data file.
 
         :param string datafilepath:    Path used to create the file. If that file already exists,
             it will be overwritten!
 
+        :return:   Returns :py:const:`True` if the data could be written, :py:const:`False` otherwise.
+        :rtype:    boolean
+        """
+        return write_gnuplot_datafile(datafilepath, [self])
+
+    def _format_gnuplot_chunks(self):
+        """Returns an iterator over the lines of the gnuplot data block of the TimeSeries.
+
+        The lines are joined into chunks of _GNUPLOT_CHUNK_SIZE data points.
+        """
+        tsformat    = self._timestampFormat
+        columnCount = self._column_count()
+        header      = "value" if 2 == columnCount else "value..."
+
+        yield "# time_as_<%s> %s\n" % (_STR_EPOCHS if tsformat is None else tsformat, header)
+
+        lineFormat = " ".join(["%s"] * columnCount) + "\n"
+        convert    = TimeSeries.convert_epochs_to_timestamps
+        storage    = self._timeseriesData
+        length     = len(storage)
+        for start in xrange(0, length, _GNUPLOT_CHUNK_SIZE):
+            stop    = min(start + _GNUPLOT_CHUNK_SIZE, length)
+            columns = [storage.get_column_range(column, start, stop) for column in xrange(columnCount)]
+
+            if tsformat is not None:
+                columns[0] = convert(columns[0], tsformat)
+
+            yield "".join([lineFormat % row for row in izip(*columns)])
+
+    def to_binary_file(self, filepath):
+        """Dumps the TimeSeries into a binary file that can be memory mapped by :py:meth:`TimeSeries.from_binary_file`.
+
+        The file contains a header, followed by one float64 column after the other. The data entries
+        are stored in ascending temporal order. The timestamps of a normalized TimeSeries are
+        calculated from the header, if possible.
+
+        :param string filepath:    Path used to create the file. If that file already exists,
+            it will be overwritten!
+
         :return:   Returns :py:const:`True` if the data could be written, :py:const:`False` otherwise.
         :rtype:    boolean
         """
         try:
-            datafile = file(datafilepath, "wb")
+            datafile = file(filepath, "wb")
         except Exception:
             return False
 
-        if self._timestampFormat is None:
-            self._timestampFormat = _STR_EPOCHS
-
-        datafile.write("# time_as_<%s> value\n" % self._timestampFormat)
+        ts = self
+        if not ts.is_sorted():
+            ts = ts.sorted_timeseries()
 
-        convert = TimeSeries.convert_epoch_to_timestamp
-        for datapoint in self._timeseriesData:
-            timestamp, value = datapoint
-            if self._timestampFormat is not None:
-                timestamp = convert(timestamp, self._timestampFormat)
-
-            datafile.write("%s %s\n" % (timestamp, value))
+        columns = [ts.get_column(column) for column in xrange(self._column_count())]
+        write_binary_file(datafile, columns, ts.is_normalized(), self._normalizationLevel)
 
         datafile.close()
         return True
 
+    @classmethod
+    def from_binary_file(cls, filepath):
+        """Opens a binary file written by :py:meth:`TimeSeries.to_binary_file`.
+
+        The file gets memory mapped and the data entries are read on access only.
+        The returned TimeSeries is read only, a modifiable TimeSeries can be created using :py:func:`copy.copy`.
+
+        :param string filepath:    Path of the binary file.
+
+        :return:    Returns a TimeSeries instance containing the data from the file.
+        :rtype:     TimeSeries
+
+        :raise: Raises a :py:exc:`ValueError` if the file is not a valid binary file of a TimeSeries.
+        """
+        storage = MappedColumnStorage(filepath)
+
+        if 2 != storage.column_count():
+            storage.close()
+            raise ValueError("%s does not contain a TimeSeries." % filepath)
+
+        return TimeSeries(storage="column")._initialize_from_mapped_storage(storage)
+
+    def close(self):
+        """Closes the memory mapped file of a TimeSeries opened by :py:meth:`TimeSeries.from_binary_file`.
+
+        The data entries of the file cannot be accessed afterwards. TimeSeries that do not
+        read their data entries from a file are not changed.
+        """
+        if isinstance(self._timeseriesData, MappedColumnStorage):
+            self._timeseriesData.close()
+
+    def __enter__(self):
+        """Returns the TimeSeries to be used within a with statement that closes it afterwards.
+
+        :return:    Returns :py:obj:`self`.
+        :rtype:     TimeSeries
+        """
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        """Closes the TimeSeries at the end of a with statement, see :py:meth:`TimeSeries.close`."""
+        self.close()
+
+    def _initialize_from_mapped_storage(self, storage):
+        """Uses the given MappedColumnStorage to hold the data points of the TimeSeries.
+
+        Data points created by the TimeSeries, e.g. during normalization, are
+        stored in the storage backend defined in :py:meth:`TimeSeries.__init__`.
+
+        :param MappedColumnStorage storage:    Storage of a memory mapped binary file.
+
+        :return:    Returns :py:obj:`self` for convenience.
+        :rtype:     TimeSeries
+        """
+        self._timeseriesData     = storage
+        self._normalizationState = None
+
+        self._normalized           = storage.is_normalized()
+        self._predefinedNormalized = storage.is_normalized()
+        self._normalizationLevel   = storage.normalization_level()
+
+        # binary files are sorted by definition
+        self._sorted           = True
+        self._predefinedSorted = True
+
+        return self
+
+    def __getstate__(self):
+        """Returns the state of the TimeSeries used by :py:mod:`pickle`.
+
+        The data points are stored within one contiguous buffer of float64 values
+        instead of pickling one list per data point.
+
+        :return:    Returns a dictionary containing the attributes of the TimeSeries.
+        :rtype: dictionary
+        """
+        state   = self.__dict__.copy()
+        storage = self._timeseriesData
+
+        state["_timeseriesData"]   = pack_columns([storage.get_column(column) for column in xrange(self._column_count())])
+        state["_fingerprintState"] = None
+        return state
+
+    def __setstate__(self, state):
+        """Restores the TimeSeries from the state returned by :py:meth:`TimeSeries.__getstate__`.
+
+        :param dictionary state:    Attributes of the pickled TimeSeries.
+        """
+        self.__dict__.update(state)
+
+        columns = unpack_columns(self._timeseriesData, self._column_count())
+        self._timeseriesData = StorageBackends[self._storage].from_columns(columns)
+
     def __copy__(self):
         """Returns a new clone of the TimeSeries.
 
         :return:    Returns a TimeSeries containing the same data and configuration as self.
         :rtype:     TimeSeries
         """
-        ts = TimeSeries.from_twodim_list(self._timeseriesData)
+        ts = TimeSeries(storage=self._storage)
+        ts._timeseriesData = self._timeseriesData.copy()
+
+        if self._normalizationState is not None:
+            ts._normalizationState = dict(self._normalizationState,
+                                          tail=self._normalizationState["tail"][:],
+                                          previous=self._normalizationState["previous"][:])
 
         ts._normalizationLevel   = self._normalizationLevel
         ts._normalized           = self._normalized
@@ -156,7 +483,7 @@ class TimeSeries(PyCastObject):
         tsformat = self._timestampFormat
 
         if tsformat is None:
-            return self._timeseriesData
+            return self._timeseriesData.to_list()
 
         datalist = []
         append   = datalist.append
@@ -180,48 +507,284 @@ class TimeSeries(PyCastObject):
         :return:    Returns a TimeSeries instance containing the data from datalist.
         :rtype:     TimeSeries
         """
-        # create and fill the given TimeSeries
-        ts = TimeSeries()
-        ts.set_timeformat(tsformat)
+        timestamps = [entry[0] for entry in datalist]
+        values     = [entry[1] for entry in datalist]
 
-        for entry in datalist:
-            ts.add_entry(*entry[:2])
+        if tsformat is not None:
+            timestamps = TimeSeries.convert_timestamps_to_epoch(timestamps, tsformat)
 
-        # set the normalization level
-        ts._normalized = ts.is_normalized()
-        ts.sort_timeseries()
+        ts = TimeSeries.from_arrays(timestamps, values)
+        ts.set_timeformat(tsformat)
 
         return ts
 
-    def initialize_from_sql_cursor(self, sqlcursor):
+    @classmethod
+    def from_arrays(cls, timestamps, values, assumeSorted=False, assumeNormalized=False, storage="list"):
+        """Creates a new TimeSeries instance from a sequence of timestamps and a sequence of values.
+
+        All data entries are stored at once, which is much faster than adding them one
+        by one using :py:meth:`TimeSeries.add_entry`.
+
+        :param list timestamps:    Sequence containing the timestamps as UNIX epochs.
+        :param list values:    Sequence containing the value for each timestamp.
+        :param boolean assumeSorted:    If this is :py:const:`True`, the timestamps are expected to be
+            ordered ascending and the data entries are not sorted again.
+        :param boolean assumeNormalized:    If this is :py:const:`True`, the timestamps are expected to
+            be normalized and the normalization is not checked.
+        :param string storage:    Storage backend used to hold the data points.
+            The available storage backends are defined in :py:data:`timeseries.StorageBackends`.
+
+        :return:    Returns a TimeSeries instance containing the given data.
+        :rtype:     TimeSeries
+
+        :raise: Raises a :py:exc:`ValueError` if timestamps and values differ in length or if
+            storage has an unknown value.
+        """
+        ts = TimeSeries(storage=storage)
+        return ts._initialize_from_columns([timestamps, values], assumeSorted, assumeNormalized)
+
+    @classmethod
+    def from_json(cls, data, tsformat=None, assumeSorted=False, storage="list"):
+        """Creates a new TimeSeries instance from its JSON representation.
+
+        All representations created by :py:class:`pycast.common.json_encoder.PycastEncoder` are supported:
+        A list of [timestamp, value] pairs, {"t0": ..., "step": ..., "values": [...]} and
+        {"timestamps": [...], "values": [...]}. The latter can declare its timestamps as
+        ordered ascending by containing "sorted": true.
+
+        :param data:    String containing the JSON representation or a file like object to read it from.
+        :param string tsformat:    Format of the timestamps, if they are given as strings. This is used
+            to convert the timestamps into UNIX epochs. For valid examples take a look into the
+            :py:func:`time.strptime` documentation.
+        :param boolean assumeSorted:    If this is :py:const:`True`, the timestamps are expected to be
+            ordered ascending and the data entries are not sorted again.
+        :param string storage:    Storage backend used to hold the data points.
+            The available storage backends are defined in :py:data:`timeseries.StorageBackends`.
+
+        :return:    Returns a TimeSeries instance containing the data points of the JSON representation.
+        :rtype:     TimeSeries
+
+        :raise: Raises a :py:exc:`ValueError` if data is no valid JSON representation of a TimeSeries.
+        """
+        ts = TimeSeries(storage=storage)
+        return ts._initialize_from_json(data, tsformat, assumeSorted)
+
+    def _initialize_from_json(self, data, tsformat=None, assumeSorted=False):
+        """Replaces all data points of the TimeSeries with the ones of the given JSON representation.
+
+        See :py:meth:`TimeSeries.from_json` for a description of the parameters.
+
+        :return:    Returns :py:obj:`self` for convenience.
+        :rtype:     TimeSeries
+
+        :raise: Raises a :py:exc:`ValueError` if data is no valid JSON representation of the TimeSeries.
+        """
+        if hasattr(data, "read"):
+            data = data.read()
+
+        data        = json.loads(data)
+        columnCount = self._column_count()
+
+        assumeNormalized = False
+        try:
+            if isinstance(data, dict):
+                values = data["values"]
+                if 2 < columnCount or (0 < len(values) and isinstance(values[0], list)):
+                    columns = list(values)
+                else:
+                    columns = [values]
+
+                if "t0" in data:
+                    step             = float(data["step"])
+                    timestamps       = ImplicitColumn(float(data["t0"]), step, len(columns[0]))
+                    assumeSorted     = assumeSorted or 0.0 <= step
+                    assumeNormalized = True
+                else:
+                    timestamps   = data["timestamps"]
+                    assumeSorted = assumeSorted or data.get("sorted", False) is True
+
+            else:
+                timestamps = [entry[0] for entry in data]
+                if 0 < len(data) and isinstance(data[0][1], list):
+                    columns = [[entry[1][idx] for entry in data] for idx in xrange(columnCount - 1)]
+                else:
+                    columns = [[entry[idx] for entry in data] for idx in xrange(1, columnCount)]
+
+        except (KeyError, IndexError, TypeError):
+            raise ValueError("data does not contain a valid JSON representation of a %s." % self.__class__.__name__)
+
+        if tsformat is not None and 0 < len(timestamps) and isinstance(timestamps[0], basestring):
+            timestamps = TimeSeries.convert_timestamps_to_epoch(timestamps, tsformat)
+
+        self._initialize_from_columns([timestamps] + columns, assumeSorted, assumeNormalized)
+        self.set_timeformat(tsformat)
+
+        return self
+
+    def initialize_from_sql_cursor(self, sqlcursor, arraysize=1000):
         """Initializes the TimeSeries's data from the given SQL cursor.
 
-        You need to set the time stamp format using :py:meth:`TimeSeries.set_timeformat`.
+        The rows are fetched in batches of arraysize rows and each batch is appended to the
+        TimeSeries at once. Numeric time stamps are taken over as UNIX epochs. Other time stamps,
+        e.g. strings or :py:class:`datetime.datetime` objects, are converted from their string
+        representation using the format set by :py:meth:`TimeSeries.set_timeformat`.
 
         :param SQLCursor sqlcursor:    Cursor that was holds the SQL result for any given
             "SELECT timestamp, value, ... FROM ..." SQL query.
             Only the first two attributes of the SQL result will be used.
+        :param integer arraysize:    Number of rows fetched from the database at once.
 
         :return:    Returns the number of entries added to the TimeSeries.
         :rtype:     integer
         """
+        startTime = time.time()
+
         # initialize the result
-        tuples = 0
+        tuples  = 0
+        batches = 0
 
         # add the SQL result to the time series
-        data = sqlcursor.fetchmany()
+        data = sqlcursor.fetchmany(arraysize)
         while 0 < len(data):
-            for entry in data:
-                self.add_entry(str(entry[0]), entry[1])
+            self._append_sql_rows(data)
+            tuples  += len(data)
+            batches += 1
 
-            data = sqlcursor.fetchmany()
+            data = sqlcursor.fetchmany(arraysize)
 
         # set the normalization level
-        self._normalized = self._check_normalization
+        if 0 < tuples:
+            self._sorted     = self._predefinedSorted
+            self._normalized = self._check_normalization()
+
+        seconds = time.time() - startTime
+        self._sqlLoadStatistics = {
+            "rows":          tuples,
+            "batches":       batches,
+            "seconds":       seconds,
+            "rowsPerSecond": tuples / seconds if 0 < seconds else float(tuples)
+        }
 
         # return the number of tuples added to the timeseries.
         return tuples
 
+    def _append_sql_rows(self, rows):
+        """Appends the given rows of an SQL result to the TimeSeries at once.
+
+        :param list rows:    List of "timestamp, value, ..." rows. Only the first
+            :py:meth:`TimeSeries._column_count` attributes of each row are used.
+        """
+        columns = [[row[idx] for row in rows] for idx in xrange(self._column_count())]
+
+        # numeric time stamps are UNIX epochs, all others are parsed from their string representation
+        timestamps = columns[0]
+        tsformat   = self._timestampFormat
+        if tsformat is not None and not isinstance(timestamps[0], (int, long, float)):
+            timestamps = [timestamp if isinstance(timestamp, basestring) else str(timestamp) for timestamp in timestamps]
+            timestamps = TimeSeries.convert_timestamps_to_epoch(timestamps, tsformat)
+        else:
+            timestamps = map(float, timestamps)
+
+        # data entries appended in temporal order can be normalized incrementally
+        state = self._normalizationState
+        if state is not None:
+            lastTimestamp = state["lastTimestamp"]
+            for timestamp in timestamps:
+                if timestamp < lastTimestamp:
+                    self._normalizationState = None
+                    break
+
+                lastTimestamp = timestamp
+            else:
+                state["lastTimestamp"] = lastTimestamp
+
+        self._timeseriesData.append_columns([timestamps] + [map(float, column) for column in columns[1:]])
+
+    def sql_load_statistics(self):
+        """Returns statistics about the last call of :py:meth:`TimeSeries.initialize_from_sql_cursor`.
+
+        :return:    Returns a dictionary containing the number of "rows" and "batches" that were
+            loaded, the "seconds" it took and the resulting "rowsPerSecond".
+            Returns :py:const:`None` if no SQL result was loaded yet.
+        :rtype: dictionary
+        """
+        return self._sqlLoadStatistics
+
+    def to_sql(self, connection, table, batch_size=1000, upsert=False, columnNames=None, paramstyle="qmark"):
+        """Writes all data points of the TimeSeries into the given database table.
+
+        The data points are inserted using executemany with batch_size data points per call.
+        All batches are written within one transaction that is committed at the end and
+        rolled back if an error occurs. The timestamps are written as UNIX epochs.
+
+        :warning: to_sql ends the current transaction of the connection. Changes made by the caller
+            that are not committed yet are committed together with the data points, or they are
+            discarded if writing the data points fails.
+
+        :param DBConnection connection:    DB-API 2.0 connection to the database.
+        :param string table:    Name of the existing table the data points are inserted into.
+            The name can be qualified by a schema name, like "schema.table".
+        :param integer batch_size:    Number of data points inserted at once.
+        :param boolean upsert:    If this is :py:const:`True`, data points replace the existing rows
+            with the same timestamp. This requires a unique constraint on the timestamp column and a
+            database supporting "INSERT ... ON CONFLICT", like SQLite 3.24 or PostgreSQL 9.5.
+        :param list columnNames:    Names of the table columns, starting with the timestamp column.
+            By default, "timestamp" followed by "value" or "value1", "value2", ... for
+            each dimension of a MultiDimensionalTimeSeries is used.
+        :param string paramstyle:    paramstyle of the database module. The available styles are
+            defined in :py:data:`timeseries.SQLParameterStyles`.
+
+        :return:    Returns the number of data points written into the table.
+        :rtype: integer
+
+        :raise: Raises a :py:exc:`ValueError` if the number of column names does not match
+            the TimeSeries, batch_size is smaller than 1 or paramstyle is unknown.
+        :raise: Raises a :py:exc:`ValueError` if the table or a column name is not a valid
+            SQL identifier, consisting of letters, digits and underscores only.
+        """
+        columnCount = self._column_count()
+        if columnNames is None:
+            columnNames = ["timestamp", "value"]
+            if 2 < columnCount:
+                columnNames = ["timestamp"] + ["value%s" % idx for idx in xrange(1, columnCount)]
+
+        if len(columnNames) != columnCount:
+            raise ValueError("%s column names are required instead of %s." % (columnCount, len(columnNames)))
+
+        # the names are part of the statement, so they must not contain any SQL
+        for name in table.split(".") + list(columnNames):
+            if not _SQL_IDENTIFIER.match(name):
+                raise ValueError("%r is not a valid SQL identifier." % name)
+
+        if batch_size < 1:
+            raise ValueError("batch_size has to be 1 at least.")
+
+        if paramstyle not in SQLParameterStyles:
+            raise ValueError("paramstyle %s is not supported." % paramstyle)
+
+        sqlstmt = "INSERT INTO %s (%s) VALUES (%s)" % (table, ", ".join(columnNames), ", ".join([SQLParameterStyles[paramstyle]] * columnCount))
+        if upsert:
+            sqlstmt += " ON CONFLICT (%s) DO UPDATE SET %s" % (columnNames[0], ", ".join(["%s = excluded.%s" % (name, name) for name in columnNames[1:]]))
+
+        columns = [self.get_column(idx) for idx in xrange(columnCount)]
+        length  = len(self)
+
+        cursor = connection.cursor()
+        try:
+            for start in xrange(0, length, batch_size):
+                stop = min(start + batch_size, length)
+                cursor.executemany(sqlstmt, izip(*[column[start:stop] for column in columns]))
+
+            # a failed commit is rolled back as well
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            cursor.close()
+
+        return length
+
     def __str__(self):
         """Returns a string representation of the TimeSeries.
 
@@ -240,8 +803,85 @@ class TimeSeries(PyCastObject):
         :return:    Returns a new TimeSeries instance containing the data entries of :py:obj:`self` and otherTimeSeries.
         :rtype:     TimeSeries
         """
-        data = self._timeseriesData + otherTimeSeries.to_twodim_list()
-        return TimeSeries.from_twodim_list(data)
+        return self._merge(otherTimeSeries)
+
+    def _merge(self, otherTimeSeries):
+        """Merges the data entries of :py:obj:`self` and otherTimeSeries into a new, sorted TimeSeries.
+
+        Sorted TimeSeries are merged in linear time. Data entries with equal timestamps keep their
+        order, the entries of :py:obj:`self` come first.
+        If one TimeSeries directly follows the other one, the result is normalized when both
+        TimeSeries are normalized and have the same temporal distance between their entries.
+
+        :param TimeSeries otherTimeSeries:    TimeSeries instance that will be merged with :py:obj:`self`.
+            It has to consist of the same number of columns as :py:obj:`self`.
+
+        :return:    Returns a new TimeSeries instance containing the data entries of :py:obj:`self` and otherTimeSeries.
+        :rtype:     TimeSeries
+        """
+        left  = self
+        right = otherTimeSeries
+        if not left.is_sorted():
+            left = left.sorted_timeseries()
+        if not right.is_sorted():
+            right = right.sorted_timeseries()
+
+        columnCount  = self._column_count()
+        leftColumns  = [left.get_column(column) for column in xrange(columnCount)]
+        rightColumns = [right.get_column(column) for column in xrange(columnCount)]
+
+        # one TimeSeries follows the other one
+        if 0 < len(right) and 0 < len(left) and right[-1][0] < left[0][0]:
+            left, right, leftColumns, rightColumns = right, left, rightColumns, leftColumns
+
+        leftTimestamps  = leftColumns[0]
+        rightTimestamps = rightColumns[0]
+
+        if 0 == len(left) or 0 == len(right) or leftTimestamps[-1] <= rightTimestamps[0]:
+            columns = []
+            for leftColumn, rightColumn in izip(leftColumns, rightColumns):
+                column = list(leftColumn)
+                column.extend(rightColumn)
+                columns.append(column)
+
+            # the distances within both TimeSeries and between them have to be equal
+            distances = set()
+            for timestamps in (leftTimestamps, rightTimestamps):
+                if 1 < len(timestamps):
+                    distances.add(timestamps[1] - timestamps[0])
+            if 0 < len(left) and 0 < len(right):
+                distances.add(rightTimestamps[0] - leftTimestamps[-1])
+
+            isNormalized = left._normalized and right._normalized and len(distances) < 2
+
+            return self._create_empty()._initialize_from_columns(columns, assumeSorted=True, assumeNormalized=isNormalized)
+
+        # determine the order of the data entries
+        leftLength  = len(leftTimestamps)
+        rightLength = len(rightTimestamps)
+        leftIdx     = 0
+        rightIdx    = 0
+        takeLeft    = []
+        append      = takeLeft.append
+        while leftIdx < leftLength and rightIdx < rightLength:
+            if rightTimestamps[rightIdx] < leftTimestamps[leftIdx]:
+                append(False)
+                rightIdx += 1
+            else:
+                append(True)
+                leftIdx += 1
+
+        # merge each column, one of them has remaining entries
+        columns = []
+        for leftColumn, rightColumn in izip(leftColumns, rightColumns):
+            leftEntries  = iter(leftColumn)
+            rightEntries = iter(rightColumn)
+            column = [leftEntries.next() if isLeft else rightEntries.next() for isLeft in takeLeft]
+            column.extend(leftEntries)
+            column.extend(rightEntries)
+            columns.append(column)
+
+        return self._create_empty()._initialize_from_columns(columns, assumeSorted=True)
 
     def __len__(self):
         """Returns the number of data entries stored in the TimeSeries.
@@ -268,21 +908,82 @@ class TimeSeries(PyCastObject):
         if len(self) != len(otherTimeSeries):
             return False
 
-        # @todo: This can be really cost intensive!
-        orgTS  = self.sorted_timeseries()
-        compTS = otherTimeSeries.sorted_timeseries()
+        columnCount = self._column_count()
+        return _equal_columns(self._sorted_columns(columnCount), otherTimeSeries._sorted_columns(columnCount))
 
-        for idx in xrange(len(orgTS)):
-            # compare the timestamp
-            if orgTS[idx][0] != compTS[idx][0]:
-                return False
+    def _sorted_columns(self, columnCount):
+        """Returns the first columnCount columns of the TimeSeries, ordered ascending by their timestamps.
 
-            # compare the data
-            if orgTS[idx][1] != compTS[idx][1]:
-                return False
+        The columns of sorted TimeSeries are returned without being copied. Data entries
+        with equal timestamps keep their order, like in :py:meth:`TimeSeries.sort_timeseries`.
 
-        # everything seams to be ok
-        return True
+        :param integer columnCount:    Number of columns, including the timestamp column.
+
+        :return:    Returns a list containing one sequence of floats per column.
+            Those sequences have to be treated as read only.
+        :rtype: list
+        """
+        storage    = self._timeseriesData
+        columns    = [storage.get_column(column) for column in xrange(columnCount)]
+        timestamps = columns[0]
+
+        if self._sorted or all(imap(le, timestamps, islice(timestamps, 1, None))):
+            return columns
+
+        order = sorted(xrange(len(timestamps)), key=timestamps.__getitem__)
+        return [[column[idx] for idx in order] for column in columns]
+
+    def digest(self):
+        """Returns a fingerprint of the data entries of the TimeSeries.
+
+        TimeSeries with different digests are not equal. Equal TimeSeries have equal digests,
+        unless they differ in the sign of zero values or in NaN values. The digest does not depend
+        on the order the data entries were added in, the timestamp format or the storage backend.
+
+        :return:    Returns the SHA-1 digest of the sorted data entries as a hex string.
+        :rtype: string
+        """
+        columnCount = self._column_count()
+
+        fingerprint = hashlib.sha1("%s:" % columnCount)
+        fingerprint.update(pack_columns(self._sorted_columns(columnCount)))
+
+        return fingerprint.hexdigest()
+
+    def fingerprint(self):
+        """Returns a fingerprint of the data entries and the flags of the TimeSeries.
+
+        In contrast to :py:meth:`TimeSeries.digest`, the fingerprint depends on the order of the data
+        entries and on the sorted and normalized flags of the TimeSeries, so it can be used to memoize
+        results calculated from the TimeSeries. It is maintained incrementally: Data entries appended
+        since the last call, e.g. by :py:meth:`TimeSeries.add_entry`, are hashed on their own. All data
+        entries are hashed again after the TimeSeries was sorted, normalized or changed, using
+        :py:meth:`TimeSeries.__setitem__` or the data entries returned by :py:meth:`TimeSeries.__getitem__`.
+
+        :warning: Changes of the data entries of the "list" storage backend are not detected, because they
+            are plain lists. Use :py:meth:`TimeSeries.digest` to detect those changes.
+
+        :return:    Returns the SHA-1 fingerprint as a hex string.
+        :rtype: string
+        """
+        storage     = self._timeseriesData
+        length      = len(storage)
+        columnCount = self._column_count()
+        mutations   = storage.mutation_count()
+
+        state = self._fingerprintState
+        if state is None or state[2] is not storage or length < state[1] or state[3] != mutations:
+            state = self._fingerprintState = [hashlib.sha1("%s:" % columnCount), 0, storage, mutations]
+
+        if state[1] < length:
+            columns = [storage.get_column_range(column, state[1], length) for column in xrange(columnCount)]
+            state[0].update(pack_columns([array("d", chain.from_iterable(izip(*columns)))]))
+            state[1] = length
+
+        fingerprint = state[0].copy()
+        fingerprint.update("|%s|%s|%s" % (self._normalized, self._sorted, self._normalizationLevel))
+
+        return fingerprint.hexdigest()
 
     def __ne__(self, otherTimeSeries):
         """Returns if :py:obj:`self` and the other MultiDimensionalTimeSeries are equal."""
@@ -317,8 +1018,102 @@ class TimeSeries(PyCastObject):
 
         :raise:    Raises an :py:exc:`IndexError` if the index is out of range.
         """
+        self._normalizationState = None
+        self._fingerprintState   = None
         self._timeseriesData[index] = value
 
+    def _search_timestamp(self, timestamp, right=False):
+        """Returns the position of the given timestamp within the sorted data entries.
+
+        The position is calculated directly for normalized TimeSeries and determined
+        by bisection otherwise. The TimeSeries gets ordered ascending automatically.
+
+        :param float timestamp:    Timestamp as UNIX epochs.
+        :param boolean right:    If this is :py:const:`True`, the position behind all data entries
+            with the given timestamp is returned, otherwise the position in front of them.
+
+        :return:    Returns the index where timestamp would be inserted into the TimeSeries.
+        :rtype: integer
+        """
+        self.sort_timeseries()
+
+        # bisect directly on the storage instead of copying the timestamps
+        timestamps = self._timeseriesData.get_column_view(0)
+        length     = len(timestamps)
+        search     = bisect_left
+        if right:
+            search = bisect_right
+
+        if not self._normalized or length < 2:
+            return search(timestamps, timestamp)
+
+        distance = timestamps[1] - timestamps[0]
+        if distance <= 0:
+            return search(timestamps, timestamp)
+
+        # estimate the position and verify it using the neighbouring timestamps
+        estimate = int((timestamp - timestamps[0]) // distance) + 1
+        low      = min(max(estimate - 1, 0), length)
+        high     = min(max(estimate + 1, 0), length)
+
+        if right:
+            isValid = (0 == low or timestamps[low - 1] <= timestamp) and (length == high or timestamp < timestamps[high])
+        else:
+            isValid = (0 == low or timestamps[low - 1] < timestamp) and (length == high or timestamp <= timestamps[high])
+
+        if not isValid:
+            return search(timestamps, timestamp)
+
+        return search(timestamps, timestamp, low, high)
+
+    def loc(self, timestamp):
+        """Returns the data entry with the given timestamp.
+
+        If multiple data entries share the timestamp, the first one is returned.
+        The TimeSeries gets ordered ascending automatically.
+
+        :param float timestamp:    Timestamp as UNIX epochs.
+
+        :return:    Returns the [timestamp, data] list stored at the timestamp.
+        :rtype: list
+
+        :raise: Raises a :py:exc:`KeyError` if the TimeSeries does not contain the timestamp.
+        """
+        idx = self._search_timestamp(timestamp)
+
+        if idx == len(self) or self._timeseriesData[idx][0] != timestamp:
+            raise KeyError(timestamp)
+
+        return self._timeseriesData[idx]
+
+    def between(self, start=None, end=None):
+        """Returns a new TimeSeries containing all data entries within [start, end].
+
+        The TimeSeries gets ordered ascending automatically.
+
+        :param float start:    Timestamp as UNIX epochs. Data entries before start are not returned.
+            If this is :py:const:`None`, the result starts at the first data entry.
+        :param float end:    Timestamp as UNIX epochs. Data entries behind end are not returned.
+            If this is :py:const:`None`, the result ends at the last data entry.
+
+        :return:    Returns a new TimeSeries instance containing the data entries within [start, end].
+        :rtype:     TimeSeries
+        """
+        startIdx = 0
+        endIdx   = len(self)
+
+        if start is not None:
+            startIdx = self._search_timestamp(start)
+        if end is not None:
+            endIdx = max(startIdx, self._search_timestamp(end, right=True))
+
+        # a range of a normalized TimeSeries is normalized
+        columns = [self._timeseriesData.get_column_range(column, startIdx, endIdx) for column in xrange(self._column_count())]
+        ts      = self._create_empty()._initialize_from_columns(columns, assumeSorted=True, assumeNormalized=self._normalized)
+        ts.set_timeformat(self._timestampFormat)
+
+        return ts
+
     @classmethod
     def convert_timestamp_to_epoch(cls, timestamp, tsformat):
         """Converts the given timestamp into a float representing UNIX-epochs.
@@ -332,7 +1127,24 @@ class TimeSeries(PyCastObject):
         :return:    Returns an float, representing the UNIX-epochs for the given timestamp.
         :rtype: float
         """
-        return time.mktime(time.strptime(timestamp, tsformat))
+        return get_timestamp_parser(tsformat).to_epoch(timestamp)
+
+    @classmethod
+    def convert_timestamps_to_epoch(cls, timestamps, tsformat):
+        """Converts all given timestamps into floats representing UNIX-epochs.
+
+        Consecutive timestamps sharing their date and hour are converted
+        much faster than by calling :py:meth:`TimeSeries.convert_timestamp_to_epoch` for each of them.
+
+        :param list timestamps: Sequence of timestamps in the defined format.
+        :param string tsformat:    Format of the given timestamps. This is used to convert the
+            timestamps into UNIX epochs. For valid examples take a look into
+            the :py:func:`time.strptime` documentation.
+
+        :return:    Returns a list of floats, representing the UNIX-epochs for the given timestamps.
+        :rtype: list
+        """
+        return get_timestamp_parser(tsformat).convert(timestamps)
 
     @classmethod
     def convert_epoch_to_timestamp(cls, timestamp, tsformat):
@@ -348,6 +1160,34 @@ class TimeSeries(PyCastObject):
         """
         return time.strftime(tsformat, time.gmtime(timestamp))
 
+    @classmethod
+    def convert_epochs_to_timestamps(cls, timestamps, tsformat):
+        """Converts all given floats representing UNIX-epochs into actual timestamps.
+
+        Each second is only formatted once, even if it occurs multiple times.
+
+        :param list timestamps:    Sequence of timestamps as UNIX-epochs.
+        :param string tsformat:    Format of the returned timestamps. For valid examples take a
+            look into the :py:func:`time.strptime` documentation.
+
+        :return:    Returns a list containing the timestamps as defined in format.
+        :rtype: list
+        """
+        convert = TimeSeries.convert_epoch_to_timestamp
+        cache   = {}
+        result  = []
+        append  = result.append
+        for timestamp in timestamps:
+            # time.gmtime truncates the timestamps to seconds as well
+            second    = int(timestamp)
+            formatted = cache.get(second)
+            if formatted is None:
+                formatted = cache[second] = convert(second, tsformat)
+
+            append(formatted)
+
+        return result
+
     def add_entry(self, timestamp, data):
         """Adds a new data entry to the TimeSeries.
 
@@ -363,7 +1203,17 @@ class TimeSeries(PyCastObject):
         if tsformat is not None:
             timestamp = TimeSeries.convert_timestamp_to_epoch(timestamp, tsformat)
 
-        self._timeseriesData.append([float(timestamp), float(data)])
+        timestamp = float(timestamp)
+
+        # data entries appended in temporal order can be normalized incrementally
+        state = self._normalizationState
+        if state is not None:
+            if timestamp < state["lastTimestamp"]:
+                self._normalizationState = None
+            else:
+                state["lastTimestamp"] = timestamp
+
+        self._timeseriesData.append([timestamp, float(data)])
 
     def sort_timeseries(self, ascending=True):
         """Sorts the data points within the TimeSeries according to their occurrence inline.
@@ -379,14 +1229,14 @@ class TimeSeries(PyCastObject):
         if ascending and self._sorted:
             return
 
-        sortorder = 1
         if not ascending:
-            sortorder = -1
-            self._predefinedSorted = False
+            self._predefinedSorted   = False
+            self._normalizationState = None
 
-        self._timeseriesData.sort(key=lambda i: sortorder * i[0])
+        self._timeseriesData.sort_by_timestamp(reverse=not ascending)
 
-        self._sorted = ascending
+        self._sorted           = ascending
+        self._fingerprintState = None
 
         return self
 
@@ -401,15 +1251,12 @@ class TimeSeries(PyCastObject):
         :return:    Returns a new TimeSeries instance sorted in the requested order.
         :rtype:     TimeSeries
         """
-        sortorder = 1
-        if not ascending:
-            sortorder = -1
+        newTS = self._create_empty(self._normalized)
+        newTS._normalized     = self._normalized
+        newTS._timeseriesData = self._timeseriesData.copy()
 
-        data = sorted(self._timeseriesData, key=lambda i: sortorder * i[0])
-
-        newTS = TimeSeries(self._normalized)
-        for entry in data:
-            newTS.add_entry(*entry)
+        if not (ascending and self._sorted):
+            newTS._timeseriesData.sort_by_timestamp(reverse=not ascending)
 
         newTS._sorted = ascending
 
@@ -450,6 +1297,15 @@ class TimeSeries(PyCastObject):
             self._normalized = True
             return
 
+        # only normalize the data entries appended since the last normalization, if possible
+        state = self._normalizationState
+        if state is not None and len(self) > state["length"] and \
+           (normalizationLevel, fusionMethod, interpolationMethod) == state["methods"]:
+            self._normalize_appended_entries()
+            return
+
+        state = {"methods": (normalizationLevel, fusionMethod, interpolationMethod)}
+
         # get the defined methods and parameter
         self._normalizationLevel = normalizationLevel
         normalizationLevel       = NormalizationLevels[normalizationLevel]
@@ -459,74 +1315,177 @@ class TimeSeries(PyCastObject):
         # sort the TimeSeries
         self.sort_timeseries()
 
+        # work on the columns to avoid the access of single data points
+        timestamps = self.get_column(0)
+        values     = self.get_column(1)
+
         # prepare the required buckets
-        start           = self._timeseriesData[0][0]
-        end             = self._timeseriesData[-1][0]
+        start           = timestamps[0]
+        end             = timestamps[-1]
         span            = end - start
         bucketcnt       = int(span / normalizationLevel) + 1
 
-        buckethalfwidth = normalizationLevel / 2.0
-        bucketstart     = start + buckethalfwidth
-        buckets         = [[bucketstart + idx * normalizationLevel] for idx in xrange(bucketcnt)]
+        state["start"]           = start
+        state["bucketwidth"]     = normalizationLevel
+        state["buckethalfwidth"] = normalizationLevel / 2.0
+        state["bucketstart"]     = start + state["buckethalfwidth"]
 
-        # Step One: Populate buckets
-        # Initialize the timeseries data iterators
-        tsdStartIdx = 0
-        tsdEndIdx   = 0
-        tsdlength   = len(self)
+        # Step One: Fusionate the values of all non empty buckets
+        segments      = self._get_bucket_segments(timestamps, state, bucketcnt)
+        bucketIndices = [segment[0] for segment in segments]
+        bucketValues  = [fusionMethod(values[segment[1]:segment[2]]) for segment in segments]
+
+        # Step Two: Fill missing buckets
+        # The first bucket is not empty by definition!
+        normalizedValues = self._fill_missing_buckets(bucketIndices, bucketValues, interpolationMethod, -1, None)
+
+        bucketstart          = state["bucketstart"]
+        normalizedTimestamps = ImplicitColumn(bucketstart, normalizationLevel, len(normalizedValues))
+        self._timeseriesData = StorageBackends[self._storage].from_columns([normalizedTimestamps, normalizedValues])
+
+        # store the state of the last bucket, it can still receive data entries
+        lastSegment            = segments[-1]
+        state["tail"]          = list(values[lastSegment[1]:lastSegment[2]])
+        state["length"]        = len(normalizedValues)
+        state["previous"]      = [-1, None]
+        if 1 < len(segments):
+            state["previous"]  = [bucketIndices[-2], bucketValues[-2]]
+        state["lastTimestamp"] = timestamps[lastSegment[2] - 1]
+        self._normalizationState = state
+
+        # at the end set self._normalized to True
+        self._normalized = True
+
+    def _normalize_appended_entries(self):
+        """Normalizes the data entries that were appended in temporal order after the last normalization.
+
+        Only the last bucket of the normalized data and the new buckets are calculated.
+        The result is equal to a normalization of all data entries.
+        """
+        self._fingerprintState = None
+
+        state               = self._normalizationState
+        length              = state["length"]
+        fusionMethod        = FusionMethods[state["methods"][1]]
+        interpolationMethod = InterpolationMethods[state["methods"][2]]
+
+        appended   = self._timeseriesData[length:]
+        timestamps = [entry[0] for entry in appended]
+        values     = [entry[1] for entry in appended]
+
+        segments = self._get_bucket_segments(timestamps, state)
+        self._timeseriesData.truncate(length)
+
+        # data entries within the last bucket change its fusioned value
+        # and the interpolated values in front of it
+        lastIdx   = length - 1
+        lastValue = self._timeseriesData[lastIdx][1]
+        if segments[0][0] == lastIdx:
+            segment = segments.pop(0)
+            state["tail"].extend(values[segment[1]:segment[2]])
+
+            previousIdx, previousValue = state["previous"]
+            lastValue = fusionMethod(state["tail"])
+            bucketValues = self._fill_missing_buckets([lastIdx], [lastValue], interpolationMethod, previousIdx, previousValue)
+            for idx, value in enumerate(bucketValues, previousIdx + 1):
+                self._timeseriesData[idx][1] = value
+
+        # add the new buckets
+        if 0 < len(segments):
+            bucketIndices    = [segment[0] for segment in segments]
+            bucketValues     = [fusionMethod(values[segment[1]:segment[2]]) for segment in segments]
+            normalizedValues = self._fill_missing_buckets(bucketIndices, bucketValues, interpolationMethod, lastIdx, lastValue)
+
+            bucketstart = state["bucketstart"]
+            bucketwidth = state["bucketwidth"]
+            append      = self._timeseriesData.append
+            for idx, value in enumerate(normalizedValues, length):
+                append([bucketstart + idx * bucketwidth, value])
+
+            lastSegment       = segments[-1]
+            state["tail"]     = values[lastSegment[1]:lastSegment[2]]
+            state["previous"] = [lastIdx, lastValue]
+            if 1 < len(segments):
+                state["previous"] = [bucketIndices[-2], bucketValues[-2]]
+
+        state["length"]  = len(self._timeseriesData)
+        self._sorted     = True
+        self._normalized = True
 
-        for idx in xrange(bucketcnt):
-            # get the bucket to avoid multiple calls of buckets.__getitem__()
-            bucket = buckets[idx]
+    def _get_bucket_segments(self, timestamps, state, bucketcnt=None):
+        """Determines the buckets of the given, ascending ordered timestamps.
+
+        A data entry belongs to the first bucket that ends behind its timestamp.
+        All entries of a bucket form one segment of the timestamp column.
+
+        :param list timestamps:    Ascending ordered timestamps.
+        :param dictionary state:    Normalization state containing the bucket geometry.
+        :param integer bucketcnt:    Number of available buckets. Data entries behind the last bucket are ignored.
+            If this is :py:const:`None`, the number of buckets is not limited.
+
+        :return:    Returns a list containing a [bucketIndex, segmentStart, segmentEnd] list per non empty bucket.
+        :rtype: list
+        """
+        start           = state["start"]
+        bucketwidth     = state["bucketwidth"]
+        buckethalfwidth = state["buckethalfwidth"]
+        bucketstart     = state["bucketstart"]
+
+        segments    = []
+        tsdStartIdx = 0
+        tsdlength   = len(timestamps)
 
-            # get the range for the given bucket
-            bucketend   = bucket[0] + buckethalfwidth
+        while tsdStartIdx < tsdlength:
+            timestamp = timestamps[tsdStartIdx]
 
-            while tsdEndIdx < tsdlength and self._timeseriesData[tsdEndIdx][0] < bucketend:
-                tsdEndIdx += 1
+            # estimate the bucket and correct it using the exact bucket ends
+            idx = int((timestamp - start) // bucketwidth)
+            while 0 < idx and timestamp < bucketstart + (idx - 1) * bucketwidth + buckethalfwidth:
+                idx -= 1
+            while timestamp >= bucketstart + idx * bucketwidth + buckethalfwidth:
+                idx += 1
 
-            # continue, if no valid data entries exist
-            if tsdStartIdx == tsdEndIdx:
-                continue
+            # data entries behind the last bucket are ignored
+            if bucketcnt is not None and bucketcnt <= idx:
+                break
 
-            # use the given fusion method to calculate the fusioned value
-            values = [i[1] for i in self._timeseriesData[tsdStartIdx:tsdEndIdx]]
-            bucket.append(fusionMethod(values))
+            # find the end of the segment
+            bucketend = bucketstart + idx * bucketwidth + buckethalfwidth
+            tsdEndIdx = bisect_left(timestamps, bucketend, tsdStartIdx)
 
-            # set the new timeseries data index
+            segments.append([idx, tsdStartIdx, tsdEndIdx])
             tsdStartIdx = tsdEndIdx
 
-        # Step Two: Fill missing buckets
-        missingCount   = 0
-        lastIdx        = 0
-        for idx in xrange(bucketcnt):
-            # bucket is empty
-            if 1 == len(buckets[idx]):
-                missingCount += 1
-                continue
-
-            # This is the first bucket. The first bucket is not empty by definition!
-            if idx == 0:
-                lastIdx = idx
-                continue
-
-            # update the lastIdx, if none was missing
-            if 0 == missingCount:
-                lastIdx = idx
-                continue
+        return segments
 
-            # calculate and fill in missing values
-            missingValues = interpolationMethod(buckets[lastIdx][1], buckets[idx][1], missingCount)
-            for idx2 in xrange(1, missingCount + 1):
-                buckets[lastIdx + idx2].append(missingValues[idx2 - 1])
+    def _fill_missing_buckets(self, bucketIndices, bucketValues, interpolationMethod, lastIdx, lastValue):
+        """Interpolates the values of all empty buckets.
 
-            lastIdx = idx
-            missingCount = 0
+        :param list bucketIndices:    Ascending indices of all non empty buckets.
+        :param list bucketValues:    Fusioned values of the non empty buckets.
+        :param function interpolationMethod:    Interpolation method used for the missing values.
+        :param integer lastIdx:    Index of the bucket in front of the first bucket in bucketIndices.
+        :param float lastValue:    Value of the bucket with the index lastIdx.
+
+        :return:    Returns a list containing the values of all buckets in (lastIdx, bucketIndices[-1]].
+        :rtype: list
+        """
+        normalizedValues = []
+        append           = normalizedValues.append
+        extend           = normalizedValues.extend
 
-        self._timeseriesData = buckets
+        for idx, value in izip(bucketIndices, bucketValues):
+            missingCount = idx - lastIdx - 1
 
-        # at the end set self._normalized to True
-        self._normalized = True
+            # calculate and fill in missing values
+            if 0 < missingCount:
+                extend(interpolationMethod(lastValue, value, missingCount))
+
+            append(value)
+            lastIdx   = idx
+            lastValue = value
+
+        return normalizedValues
 
     def is_normalized(self):
         """Returns if the TimeSeries is normalized.
@@ -545,20 +1504,20 @@ class TimeSeries(PyCastObject):
         :return:    Returns :py:const:`True` if all data entries of the TimeSeries have an equal temporal
             distance, :py:const:`False` otherwise.
         """
-        lastDistance = None
-        distance     = None
-        for idx in xrange(len(self) - 1):
-            distance = self[idx+1][0] - self[idx][0]
+        # timestamps calculated from start and step are normalized by definition
+        if self._timeseriesData.has_implicit_timestamps():
+            return True
 
-            # first run
-            if lastDistance is None:
-                lastDistance = distance
-                continue
+        timestamps = self.get_column(0)
 
-            if lastDistance != distance:
-                return False
+        # TimeSeries with less than three entries are always normalized
+        if len(timestamps) < 3:
+            return True
 
-            lastDistance = distance
+        distance = timestamps[1] - timestamps[0]
+        for idx in xrange(2, len(timestamps)):
+            if timestamps[idx] - timestamps[idx-1] != distance:
+                return False
 
         return True
 
@@ -570,12 +1529,14 @@ class TimeSeries(PyCastObject):
         """
         return self._sorted
 
-    def apply(self, method):
+    def apply(self, method, resultCache=None):
         """Applies the given ForecastingAlgorithm or SmoothingMethod from the :py:mod:`pycast.methods`
         module to the TimeSeries.
 
         :param BaseMethod method: Method that should be used with the TimeSeries.
             For more information about the methods take a look into their corresponding documentation.
+        :param ResultCache resultCache:    Optional :py:class:`pycast.common.resultcache.ResultCache`.
+            Results of previous calls with the same data and method parameters are returned from it.
 
         :raise:    Raises a StandardError when the TimeSeries was not normalized and hte method requires a
             normalized TimeSeries
@@ -587,6 +1548,9 @@ class TimeSeries(PyCastObject):
         if method.has_to_be_sorted():
             self.sort_timeseries()
 
+        if resultCache is not None:
+            return resultCache.execute(method, self)
+
         return method.execute(self)
 
     def sample(self, percentage):
@@ -603,24 +1567,25 @@ class TimeSeries(PyCastObject):
         if not (0.0 < percentage < 1.0):
             raise ValueError("Parameter percentage has to be in (0.0, 1.0).")
 
-        cls         = self.__class__
-        value_count = int(len(self) * percentage)
-        values      = random.sample(self, value_count)
-
-        sample      = cls.from_twodim_list(values)
-        rest_values = self._timeseriesData[:]
+        length      = len(self)
+        value_count = int(length * percentage)
+        sampled     = random.sample(xrange(length), value_count)
 
-        for value in values:
-            rest_values.remove(value)
+        isSampled = [False] * length
+        for idx in sampled:
+            isSampled[idx] = True
+        remaining = [idx for idx in xrange(length) if not isSampled[idx]]
 
-        rest = cls.from_twodim_list(rest_values)
+        columns = [self.get_column(column) for column in xrange(self._column_count())]
+        sample  = self._create_empty()._initialize_from_columns([[column[idx] for idx in sampled] for column in columns])
+        rest    = self._create_empty()._initialize_from_columns([[column[idx] for idx in remaining] for column in columns])
 
         return sample, rest
 
 class MultiDimensionalTimeSeries(TimeSeries):
     """Implements a multi dimensional TimeSeries."""
 
-    def __init__(self, dimensions=1, isNormalized=False, isSorted=False):
+    def __init__(self, dimensions=1, isNormalized=False, isSorted=False, storage="list"):
         """Initializes the TimeSeries.
 
         :param integer dimensions:    Number of dimensions the MultiDimensionalTimeSeries contains.
@@ -634,17 +1599,40 @@ class MultiDimensionalTimeSeries(TimeSeries):
             TimeSeries normalization can be forced by executing :py:meth:`TimeSeries.normalize`.
         :param boolean isSorted:    If all data points added to the time series are added
             in their ascending temporal order, this should set to :py:const:`True`.
+        :param string storage:    Storage backend used to hold the data points.
+            The available storage backends are defined in :py:data:`timeseries.StorageBackends`.
 
         :raise:    Raises a :py:exc:`ValueError` if the number of dimensions is smaller than 1.
+        :raise:    Raises a :py:exc:`ValueError` if storage has an unknown value.
         """
-        super(MultiDimensionalTimeSeries, self).__init__(isNormalized, isSorted)
-
         dimensions = int(dimensions)
         if dimensions < 1:
             raise ValueError("A MultiDimensionalTimeSeries has to have at least one dimension!.")
 
+        # required to create the storage
         self._dimensionCount = dimensions
 
+        super(MultiDimensionalTimeSeries, self).__init__(isNormalized, isSorted, storage)
+
+    def _column_count(self):
+        """Returns the number of columns each data point consists of, including the timestamp.
+
+        :return:    Returns the number of columns.
+        :rtype: integer
+        """
+        return 1 + self._dimensionCount
+
+    def _create_empty(self, isNormalized=False, isSorted=False):
+        """Creates a new, empty MultiDimensionalTimeSeries with the same dimensions and storage backend as :py:obj:`self`.
+
+        :param boolean isNormalized:    See :py:meth:`MultiDimensionalTimeSeries.__init__`.
+        :param boolean isSorted:    See :py:meth:`MultiDimensionalTimeSeries.__init__`.
+
+        :return:    Returns the new MultiDimensionalTimeSeries.
+        :rtype: MultiDimensionalTimeSeries
+        """
+        return MultiDimensionalTimeSeries(self._dimensionCount, isNormalized, isSorted, storage=self._storage)
+
     def dimension_count(self):
         """Returns the number of dimensions the MultiDimensionalTimeSeries contains.
 
@@ -679,31 +1667,6 @@ class MultiDimensionalTimeSeries(TimeSeries):
 
         self._timeseriesData.append([float(timestamp)] + [float(dimensionValue) for dimensionValue in data])
 
-    def sorted_timeseries(self, ascending=True):
-        """Returns a sorted copy of the TimeSeries, preserving the original one.
-
-        As an assumption this new TimeSeries is not ordered anymore if a new value is added.
-
-        :param boolean ascending:    Determines if the TimeSeries will be ordered ascending
-            or descending.
-
-        :return:    Returns a new TimeSeries instance sorted in the requested order.
-        :rtype:     TimeSeries
-        """
-        sortorder = 1
-        if not ascending:
-            sortorder = -1
-
-        data = sorted(self._timeseriesData, key=lambda i: sortorder * i[0])
-
-        newTS = MultiDimensionalTimeSeries(self._dimensionCount, self._normalized)
-        for entry in data:
-            newTS.add_entry(entry[0], entry[1:])
-
-        newTS._sorted = ascending
-
-        return newTS
-
     def to_twodim_list(self):
         """Serializes the MultiDimensionalTimeSeries data into a two dimensional list of [timestamp, [values]] pairs.
 
@@ -711,7 +1674,7 @@ class MultiDimensionalTimeSeries(TimeSeries):
         :rtype:     list
         """
         if self._timestampFormat is None:
-            return self._timeseriesData
+            return self._timeseriesData.to_list()
 
         datalist = []
         append   = datalist.append
@@ -736,19 +1699,82 @@ class MultiDimensionalTimeSeries(TimeSeries):
         :return:    Returns a MultiDimensionalTimeSeries instance containing the data from datalist.
         :rtype:     MultiDimensionalTimeSeries
         """
-        # create and fill the given TimeSeries
-        ts = MultiDimensionalTimeSeries(dimensions=dimensions)
-        ts.set_timeformat(tsformat)
-
+        timestamps = []
+        rows       = []
         for entry in datalist:
-            ts.add_entry(entry[0], entry[1])
+            data = entry[1]
+            if not isinstance(data, list):
+                data = [data]
 
-        # set the normalization level
-        ts._normalized = ts.is_normalized()
-        ts.sort_timeseries()
+            if len(data) != dimensions:
+                raise ValueError("data does contain %s instead of %s dimensions.\n   %s" % (len(data), dimensions, data))
+
+            timestamps.append(entry[0])
+            rows.append(data)
+
+        if tsformat is not None:
+            timestamps = TimeSeries.convert_timestamps_to_epoch(timestamps, tsformat)
+
+        values = [[row[dimension] for row in rows] for dimension in xrange(dimensions)]
+
+        ts = MultiDimensionalTimeSeries.from_arrays(timestamps, values)
+        ts.set_timeformat(tsformat)
 
         return ts
 
+    @classmethod
+    def from_arrays(cls, timestamps, values, assumeSorted=False, assumeNormalized=False, storage="list"):
+        """Creates a new MultiDimensionalTimeSeries instance from a sequence of timestamps and one sequence of values per dimension.
+
+        All data entries are stored at once, which is much faster than adding them one
+        by one using :py:meth:`MultiDimensionalTimeSeries.add_entry`.
+
+        :param list timestamps:    Sequence containing the timestamps as UNIX epochs.
+        :param list values:    List containing one sequence of values per dimension.
+        :param boolean assumeSorted:    If this is :py:const:`True`, the timestamps are expected to be
+            ordered ascending and the data entries are not sorted again.
+        :param boolean assumeNormalized:    If this is :py:const:`True`, the timestamps are expected to
+            be normalized and the normalization is not checked.
+        :param string storage:    Storage backend used to hold the data points.
+            The available storage backends are defined in :py:data:`timeseries.StorageBackends`.
+
+        :return:    Returns a MultiDimensionalTimeSeries instance containing the given data.
+        :rtype:     MultiDimensionalTimeSeries
+
+        :raise: Raises a :py:exc:`ValueError` if values does not contain at least one dimension,
+            if the sequences differ in length or if storage has an unknown value.
+        """
+        ts = MultiDimensionalTimeSeries(dimensions=len(values), storage=storage)
+        return ts._initialize_from_columns([timestamps] + list(values), assumeSorted, assumeNormalized)
+
+    @classmethod
+    def from_json(cls, data, tsformat=None, assumeSorted=False, storage="list", dimensions=1):
+        """Creates a new MultiDimensionalTimeSeries instance from its JSON representation.
+
+        All representations created by :py:class:`pycast.common.json_encoder.PycastEncoder` are supported:
+        A list of [timestamp, [values]] or [timestamp, value, value, ...] lists,
+        {"t0": ..., "step": ..., "values": [[...], ...]} and {"timestamps": [...], "values": [[...], ...]}.
+        The latter can declare its timestamps as ordered ascending by containing "sorted": true.
+
+        :param data:    String containing the JSON representation or a file like object to read it from.
+        :param string tsformat:    Format of the timestamps, if they are given as strings. This is used
+            to convert the timestamps into UNIX epochs. For valid examples take a look into the
+            :py:func:`time.strptime` documentation.
+        :param boolean assumeSorted:    If this is :py:const:`True`, the timestamps are expected to be
+            ordered ascending and the data entries are not sorted again.
+        :param string storage:    Storage backend used to hold the data points.
+            The available storage backends are defined in :py:data:`timeseries.StorageBackends`.
+        :param integer dimensions:    Number of dimensions the MultiDimensionalTimeSeries contains.
+
+        :return:    Returns a MultiDimensionalTimeSeries instance containing the data points of the JSON representation.
+        :rtype:     MultiDimensionalTimeSeries
+
+        :raise: Raises a :py:exc:`ValueError` if data is no valid JSON representation of a
+            MultiDimensionalTimeSeries with the given number of dimensions.
+        """
+        ts = MultiDimensionalTimeSeries(dimensions=dimensions, storage=storage)
+        return ts._initialize_from_json(data, tsformat, assumeSorted)
+
     def __add__(self, otherTimeSeries):
         """Creates a new MultiDimensionalTimeSeries instance containing the data of :py:obj:`self` and otherMutliDimensionalTimeSeries.
 
@@ -762,8 +1788,7 @@ class MultiDimensionalTimeSeries(TimeSeries):
         if not self._dimensionCount == otherTimeSeries.dimension_count():
             raise ValueError("otherMutliDimensionalTimeSeries has to have the same number of dimensions.")
 
-        data = self.to_twodim_list() + otherTimeSeries.to_twodim_list()
-        return MultiDimensionalTimeSeries.from_twodim_list(data)
+        return self._merge(otherTimeSeries)
 
     def __eq__(self, otherTimeSeries):
         """Returns if :py:obj:`self` and the other MultiDimensionalTimeSeries are equal.
@@ -786,21 +1811,33 @@ class MultiDimensionalTimeSeries(TimeSeries):
         if self._dimensionCount != otherTimeSeries.dimension_count():
             return False
 
-        # @todo: This can be really cost intensive!
-        orgTS  = self.sorted_timeseries()
-        compTS = otherTimeSeries.sorted_timeseries()
+        columnCount = self._column_count()
+        return _equal_columns(self._sorted_columns(columnCount), otherTimeSeries._sorted_columns(columnCount))
 
-        for idx in xrange(len(orgTS)):
-            # compare the timestamp
-            if orgTS[idx][0] != compTS[idx][0]:
-                return False
+    @classmethod
+    def from_binary_file(cls, filepath):
+        """Opens a binary file written by :py:meth:`MultiDimensionalTimeSeries.to_binary_file`.
 
-            # compare the data
-            if orgTS[idx][1:] != compTS[idx][1:]:
-                return False
+        The file gets memory mapped and the data entries are read on access only.
+        The returned MultiDimensionalTimeSeries is read only, a modifiable MultiDimensionalTimeSeries
+        can be created using :py:func:`copy.copy`.
 
-        # everything seams to be ok
-        return True
+        :param string filepath:    Path of the binary file.
+
+        :return:    Returns a MultiDimensionalTimeSeries instance containing the data from the file.
+        :rtype:     MultiDimensionalTimeSeries
+
+        :raise: Raises a :py:exc:`ValueError` if the file is not a valid binary file.
+        """
+        storage = MappedColumnStorage(filepath)
+
+        try:
+            ts = MultiDimensionalTimeSeries(storage.column_count() - 1, storage="column")
+        except:
+            storage.close()
+            raise
+
+        return ts._initialize_from_mapped_storage(storage)
 
     def __copy__(self):
         """Returns a new clone of the MultiDimensionalTimeSeries.
@@ -808,7 +1845,8 @@ class MultiDimensionalTimeSeries(TimeSeries):
         :return:    Returns a MultiDimensionalTimeSeries containing the same data and configuration as self.
         :rtype:     MultiDimensionalTimeSeries
         """
-        ts = MultiDimensionalTimeSeries.from_twodim_list(self._timeseriesData, dimensions=self._dimensionCount)
+        ts = MultiDimensionalTimeSeries(self._dimensionCount, storage=self._storage)
+        ts._timeseriesData = self._timeseriesData.copy()
 
         ts._normalizationLevel   = self._normalizationLevel
         ts._normalized           = self._normalized
@@ -819,70 +1857,242 @@ class MultiDimensionalTimeSeries(TimeSeries):
 
         return ts
 
-    def initialize_from_sql_cursor(self, sqlcursor):
+    def initialize_from_sql_cursor(self, sqlcursor, arraysize=1000):
         """Initializes the MultiDimensionalTimeSeries's data from the given SQL cursor.
 
-        You need to set the time stamp format using :py:meth:`MultiDimensionalTimeSeries.set_timeformat`.
+        The rows are fetched in batches of arraysize rows and each batch is appended to the
+        MultiDimensionalTimeSeries at once. Numeric time stamps are taken over as UNIX epochs.
+        Time stamps given as strings are converted using the format set by
+        :py:meth:`MultiDimensionalTimeSeries.set_timeformat`.
 
         :param SQLCursor sqlcursor:    Cursor that was holds the SQL result for any given
             "SELECT timestamp, value, ... FROM ..." SQL query.
+        :param integer arraysize:    Number of rows fetched from the database at once.
 
         :return:    Returns the number of entries added to the MultiDimensionalTimeSeries.
         :rtype: integer
+
+        :raise:    Raises a :py:exc:`ValueError` if the SQL result does not contain one attribute
+            per dimension behind the time stamp.
         """
-        # initialize the result
-        tuples = 0
+        description = sqlcursor.description
+        if description is not None and len(description) - 1 != self._dimensionCount:
+            raise ValueError("The SQL result contains %s instead of %s dimensions." % (len(description) - 1, self._dimensionCount))
 
-        # add the SQL result to the timeseries
-        data = sqlcursor.fetchmany()
-        while 0 < len(data):
-            for entry in data:
-                self.add_entry(str(entry[0]), [item for item in entry[1:]])
+        return super(MultiDimensionalTimeSeries, self).initialize_from_sql_cursor(sqlcursor, arraysize)
 
-            data = sqlcursor.fetchmany()
+    def normalize(self, normalizationLevel="minute", fusionMethod="mean", interpolationMethod="linear"):
+        """This is a dummy function, doing nothing.
 
-        # set the normalization level
-        self._normalized = self._check_normalization()
+        :raise: Raises a :py:exc:`NotImplementedError`.
 
-        # return the number of tuples added to the timeseries.
-        return tuples
+        :note: MutliDimensionalTimeSeries cannot be normalized currently.
+        """
+        raise NotImplementedError
 
-    def to_gnuplot_datafile(self, datafilepath):
-        """Dumps the TimeSeries into a gnuplot compatible data file.
+class TimeSeriesView(PyCastObject):
 
-        :param string datafilepath:    Path used to create the file. If that file already exists,
-            it will be overwritten!
+    """A TimeSeriesView provides read access to a range of data entries of a TimeSeries without copying them.
 
-        :return:   Returns :py:const:`True` if the data could be written, :py:const:`False` otherwise.
+    The view references the storage of its TimeSeries. Changing the order or the number of data
+    entries of the TimeSeries, e.g. by sorting or normalizing it, invalidates the view.
+    """
+
+    def __init__(self, timeSeries, start=0, stop=None):
+        """Initializes the TimeSeriesView.
+
+        :param TimeSeries timeSeries:    TimeSeries or TimeSeriesView whose data entries are referenced.
+        :param integer start:    Index of the first data entry. Negative values count from the end, like for slices.
+        :param integer stop:    Index behind the last data entry. If this is :py:const:`None`,
+            the view ends at the last data entry.
+        """
+        super(TimeSeriesView, self).__init__()
+
+        start, stop, step = slice(start, stop).indices(len(timeSeries))
+        stop = max(start, stop)
+
+        # views on views reference the original TimeSeries
+        if isinstance(timeSeries, TimeSeriesView):
+            start      += timeSeries._start
+            stop       += timeSeries._start
+            timeSeries  = timeSeries._timeSeries
+
+        self._timeSeries     = timeSeries
+        self._timeseriesData = timeSeries._timeseriesData
+        self._start          = start
+        self._stop           = stop
+
+    def __len__(self):
+        """Returns the number of data entries within the TimeSeriesView.
+
+        :return:    Returns the number of data entries.
+        :rtype: integer
+        """
+        return self._stop - self._start
+
+    def __getitem__(self, index):
+        """Returns the item stored at the index-th position of the TimeSeriesView.
+
+        :param integer index:    Position of the element that should be returned. Starts at 0.
+            Slices return a list containing the selected data entries.
+
+        :return:    Returns the [timestamp, data] list of the data entry.
+        :rtype: list
+
+        :raise:     Raises an :py:exc:`IndexError` if the index is out of range.
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if 1 == step:
+                return self._timeseriesData[self._start + start:self._start + max(start, stop)]
+
+            return [self._timeseriesData[self._start + idx] for idx in xrange(start, stop, step)]
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError("TimeSeriesView index out of range")
+
+        return self._timeseriesData[self._start + index]
+
+    def __iter__(self):
+        """Returns an iterator over the data entries of the TimeSeriesView.
+
+        :return:    Returns an iterator for the TimeSeriesView.
+        :rtype:     Iterator
+        """
+        data = self._timeseriesData
+        for idx in xrange(self._start, self._stop):
+            yield data[idx]
+
+    def __str__(self):
+        """Returns a string representation of the TimeSeriesView.
+
+        :return:    Returns a string representing the TimeSeriesView in the format:
+
+            "TimeSeriesView([timestamp, data], [timestamp, data], [timestamp, data])".
+        :rtype:     string
+        """
+        return """TimeSeriesView(%s)""" % ",".join([str(entry) for entry in self])
+
+    def view(self, start=0, stop=None):
+        """Returns a view on the data entries within [start, stop) of the TimeSeriesView.
+
+        :param integer start:    Index of the first data entry. Negative values count from the end, like for slices.
+        :param integer stop:    Index behind the last data entry. If this is :py:const:`None`,
+            the view ends at the last data entry.
+
+        :return:    Returns a TimeSeriesView referencing the data entries of the underlying TimeSeries.
+        :rtype: TimeSeriesView
+        """
+        return TimeSeriesView(self, start, stop)
+
+    def get_column(self, column):
+        """Returns the values of one column of the TimeSeriesView.
+
+        :param integer column:    Index of the column. 0 returns the timestamps, 1 the values.
+
+        :return:    Returns a new sequence containing the values of the column.
+        :rtype: list or array.array
+        """
+        return self._timeseriesData.get_column_range(column, self._start, self._stop)
+
+    def is_sorted(self):
+        """Returns if the TimeSeriesView is sorted.
+
+        :return:    Returns :py:const:`True` if the underlying TimeSeries is sorted ascending, :py:const:`False` otherwise.
         :rtype: boolean
         """
-        try:
-            datafile = file(datafilepath, "wb")
-        except Exception:
-            return False
+        return self._timeSeries.is_sorted()
 
-        if self._timestampFormat is None:
-            self._timestampFormat = _STR_EPOCHS
+    def is_normalized(self):
+        """Returns if the TimeSeriesView is normalized.
 
-        datafile.write("# time_as_<%s> value..." % self._timestampFormat)
+        A range of a normalized TimeSeries is normalized as well.
 
-        convert = TimeSeries.convert_epoch_to_timestamp
-        for datapoint in self._timeseriesData:
-            timestamp = datapoint[0]
-            values = datapoint[1:]
-            if self._timestampFormat is not None:
-                timestamp = convert(timestamp, self._timestampFormat)
+        :return:    Returns :py:const:`True` if the underlying TimeSeries is normalized, :py:const:`False` otherwise.
+        :rtype: boolean
+        """
+        return self._timeSeries.is_normalized()
 
-            datafile.write("%s %s" % (timestamp, " ".join([str(entry) for entry in values])))
+    def sort_timeseries(self, ascending=True):
+        """Checks that the TimeSeriesView is sorted.
 
-        datafile.close()
-        return True
+        A TimeSeriesView cannot change the order of its data entries. This allows to pass
+        views to methods and error measures that sort their input.
 
-    def normalize(self, normalizationLevel="minute", fusionMethod="mean", interpolationMethod="linear"):
-        """This is a dummy function, doing nothing.
+        :param boolean ascending: Has to be :py:const:`True`.
 
-        :raise: Raises a :py:exc:`NotImplementedError`.
+        :return:    Returns :py:obj:`self` for convenience.
+        :rtype:     TimeSeriesView
 
-        :note: MutliDimensionalTimeSeries cannot be normalized currently.
+        :raise:    Raises a :py:exc:`ValueError` if the underlying TimeSeries is not sorted ascending.
         """
-        raise NotImplementedError
+        if not (ascending and self._timeSeries.is_sorted()):
+            raise ValueError("A TimeSeriesView cannot be sorted. Sort the underlying TimeSeries instead.")
+
+        return self
+
+    def fingerprint(self):
+        """Returns a fingerprint of the data entries and the flags of the TimeSeriesView.
+
+        :return:    Returns the SHA-1 fingerprint as a hex string.
+        :rtype: string
+        """
+        return hashlib.sha1("%s:%s:%s" % (self._timeSeries.fingerprint(), self._start, self._stop)).hexdigest()
+
+    def digest(self):
+        """Returns a fingerprint of the data entries of the TimeSeries and the range of the TimeSeriesView.
+
+        :return:    Returns the SHA-1 digest as a hex string.
+        :rtype: string
+        """
+        return hashlib.sha1("%s:%s:%s" % (self._timeSeries.digest(), self._start, self._stop)).hexdigest()
+
+    def apply(self, method, resultCache=None):
+        """Applies the given ForecastingAlgorithm or SmoothingMethod to the TimeSeriesView.
+
+        :param BaseMethod method: Method that should be used with the TimeSeriesView.
+        :param ResultCache resultCache:    Optional :py:class:`pycast.common.resultcache.ResultCache`.
+
+        :return:    Returns the TimeSeries calculated by the method.
+        :rtype:     TimeSeries
+
+        :raise:    Raises a StandardError when the TimeSeriesView is not normalized and the method
+            requires a normalized TimeSeries.
+        :raise:    Raises a :py:exc:`ValueError` when the TimeSeriesView is not sorted and the method
+            requires a sorted TimeSeries.
+        """
+        if method.has_to_be_normalized() and not self.is_normalized():
+            raise StandardError("method requires a normalized TimeSeries instance.")
+
+        if method.has_to_be_sorted():
+            self.sort_timeseries()
+
+        if resultCache is not None:
+            return resultCache.execute(method, self)
+
+        return method.execute(self)
+
+    def to_timeseries(self):
+        """Copies the data entries of the TimeSeriesView into a new TimeSeries.
+
+        :return:    Returns a TimeSeries of the same type and storage backend as the underlying one.
+        :rtype:     TimeSeries
+        """
+        timeSeries = self._timeSeries
+        columns    = [self.get_column(column) for column in xrange(timeSeries._column_count())]
+
+        ts = timeSeries._create_empty()._initialize_from_columns(columns, timeSeries._sorted, timeSeries._normalized)
+        ts.set_timeformat(timeSeries._timestampFormat)
+
+        return ts
+
+    def to_twodim_list(self):
+        """Serializes the data entries of the TimeSeriesView into a two dimensional list.
+
+        :return:    Returns a two dimensional list in the format of :py:meth:`TimeSeries.to_twodim_list`.
+        :rtype:     list
+        """
+        return self.to_timeseries().to_twodim_list()
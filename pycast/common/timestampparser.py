@@ -0,0 +1,201 @@
+# !/usr/bin/env python
+#  -*- coding: UTF-8 -*-
+
+# Copyright (c) 2012-2015 Christian Schwarz
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+"""Module contains a cached parser that converts formatted timestamps into UNIX epochs."""
+
+import re
+import time
+
+from datetime import date
+
+# Regular expressions used for the supported directives. They are equal to those used by time.strptime.
+_DIRECTIVES = {
+    "Y": r"(?P<Y>\d\d\d\d)",
+    "m": r"(?P<m>1[0-2]|0[1-9]|[1-9])",
+    "d": r"(?P<d>3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])",
+    "H": r"(?P<H>2[0-3]|[0-1]\d|\d)",
+    "M": r"(?P<M>[0-5]\d|\d)",
+    "S": r"(?P<S>6[0-1]|[0-5]\d|\d)"
+}
+
+# TimestampParser instances, stored by their format
+_parsers = {}
+
+def get_timestamp_parser(tsformat):
+    """Returns the TimestampParser for the given format.
+
+    The parsers are created once per format and reused afterwards.
+
+    :param string tsformat:    Format of the timestamps. For valid examples take a look into
+        the :py:func:`time.strptime` documentation.
+
+    :return:    Returns the TimestampParser for tsformat.
+    :rtype: TimestampParser
+    """
+    parser = _parsers.get(tsformat)
+
+    if parser is None:
+        parser = TimestampParser(tsformat)
+        _parsers[tsformat] = parser
+
+    return parser
+
+class TimestampParser(object):
+
+    """Converts timestamps of a fixed format into UNIX epochs.
+
+    Formats consisting of the directives %Y, %m, %d, %H, %M, %S and literal text, like
+    ISO-8601 timestamps, are parsed by a precompiled regular expression. The epoch of the
+    date and hour prefix is calculated once and reused for consecutive timestamps sharing
+    that prefix. All other formats are handled by :py:func:`time.strptime`.
+
+    The results are equal to time.mktime(time.strptime(timestamp, tsformat)).
+    """
+
+    def __init__(self, tsformat):
+        """Initializes the TimestampParser.
+
+        :param string tsformat:    Format of the timestamps. For valid examples take a look into
+            the :py:func:`time.strptime` documentation.
+        """
+        super(TimestampParser, self).__init__()
+
+        self._format     = tsformat
+        self._expression = self._compile(tsformat)
+
+        # position of each directive within the groups of a match, missing directives point behind them
+        self._positions = None
+        if self._expression is not None:
+            groupindex      = self._expression.groupindex
+            missing         = len(groupindex)
+            self._positions = [groupindex.get(directive, missing + 1) - 1 for directive in "YmdHMS"]
+
+        # (prefix, epoch) of the last date and hour, replaced at once to be safe for concurrent use
+        self._lastPrefixEpoch = (None, None)
+
+    def _compile(self, tsformat):
+        """Creates the regular expression matching the given format.
+
+        :param string tsformat:    Format of the timestamps.
+
+        :return:    Returns the compiled regular expression or :py:const:`None`, if
+            the format contains directives that are not supported.
+        :rtype: re.RegexObject
+        """
+        pattern = []
+        used    = set()
+        idx     = 0
+
+        while idx < len(tsformat):
+            char = tsformat[idx]
+
+            if "%" == char:
+                directive = tsformat[idx + 1:idx + 2]
+                if "%" == directive:
+                    pattern.append("%")
+                elif directive in _DIRECTIVES and directive not in used:
+                    pattern.append(_DIRECTIVES[directive])
+                    used.add(directive)
+                else:
+                    return None
+
+                idx += 2
+                continue
+
+            # whitespace matches any whitespace, like for time.strptime
+            if char.isspace():
+                pattern.append(r"\s+")
+                while idx < len(tsformat) and tsformat[idx].isspace():
+                    idx += 1
+                continue
+
+            pattern.append(re.escape(char))
+            idx += 1
+
+        return re.compile("".join(pattern) + r"\Z", re.IGNORECASE)
+
+    def _parse_slow(self, timestamp):
+        """Converts the timestamp using :py:func:`time.strptime`.
+
+        :param string timestamp:    Timestamp in the format of the TimestampParser.
+
+        :return:    Returns the UNIX epochs.
+        :rtype: float
+
+        :raise:    Raises a :py:exc:`ValueError` if the timestamp does not match the format.
+        """
+        return time.mktime(time.strptime(timestamp, self._format))
+
+    def to_epoch(self, timestamp):
+        """Converts the given timestamp into UNIX epochs.
+
+        :param string timestamp:    Timestamp in the format of the TimestampParser.
+
+        :return:    Returns a float representing the UNIX epochs.
+        :rtype: float
+
+        :raise:    Raises a :py:exc:`ValueError` if the timestamp does not match the format.
+        """
+        if self._expression is None:
+            return self._parse_slow(timestamp)
+
+        match = self._expression.match(timestamp)
+        if match is None:
+            return self._parse_slow(timestamp)
+
+        values = match.groups() + (None, )
+        yearPos, monthPos, dayPos, hourPos, minutePos, secondPos = self._positions
+
+        prefix = (values[yearPos], values[monthPos], values[dayPos], values[hourPos])
+
+        lastPrefix, epoch = self._lastPrefixEpoch
+        if prefix != lastPrefix:
+            year  = int(prefix[0] or 1900)
+            month = int(prefix[1] or 1)
+            day   = int(prefix[2] or 1)
+            hour  = int(prefix[3] or 0)
+
+            # invalid dates are reported by time.strptime
+            try:
+                date(year, month, day)
+            except ValueError:
+                return self._parse_slow(timestamp)
+
+            epoch = time.mktime((year, month, day, hour, 0, 0, 0, 1, -1))
+            self._lastPrefixEpoch = (prefix, epoch)
+
+        return epoch + 60 * int(values[minutePos] or 0) + int(values[secondPos] or 0)
+
+    def convert(self, timestamps):
+        """Converts all given timestamps into UNIX epochs.
+
+        :param list timestamps:    Sequence of timestamps in the format of the TimestampParser.
+
+        :return:    Returns a list containing the UNIX epochs.
+        :rtype: list
+
+        :raise:    Raises a :py:exc:`ValueError` if a timestamp does not match the format.
+        """
+        return map(self.to_epoch, timestamps)
@@ -22,6 +22,8 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
 # WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
+from bisect import bisect_left, bisect_right
+
 from pycast.common.pycastobject import PyCastObject
 from pycast.common.decorators import optimized
 
@@ -79,19 +81,26 @@ class BaseErrorMeasure(PyCastObject):
         appendDate  = self._errorDates.append
         local_error = self.local_error
 
+        # compare the timestamp columns instead of single data points
+        orgTimestamps  = originalTimeSeries.get_column(0)
+        calcTimestamps = calculatedTimeSeries.get_column(0)
+        calcLength     = len(calcTimestamps)
+
         minCalcIdx  = 0
 
         # calculate all valid local errors
-        for orgPair in originalTimeSeries:
-            for calcIdx in xrange(minCalcIdx, len(calculatedTimeSeries)):
-                calcPair = calculatedTimeSeries[calcIdx]
+        for orgIdx in xrange(len(orgTimestamps)):
+            timestamp = orgTimestamps[orgIdx]
 
-                # Skip values that can not be compared
-                if calcPair[0] != orgPair[0]:
-                    continue
+            # both TimeSeries are sorted, calculated values before timestamp can be skipped
+            while minCalcIdx < calcLength and calcTimestamps[minCalcIdx] < timestamp:
+                minCalcIdx += 1
 
-                append(local_error(orgPair[1:], calcPair[1:]))
-                appendDate(orgPair[0])
+            calcIdx = minCalcIdx
+            while calcIdx < calcLength and calcTimestamps[calcIdx] == timestamp:
+                append(local_error(originalTimeSeries[orgIdx][1:], calculatedTimeSeries[calcIdx][1:]))
+                appendDate(timestamp)
+                calcIdx += 1
 
         # return False, if the error cannot be calculated
         calculatedErrors    = len(filter(lambda item: item is not None, self._errorValues))
@@ -123,21 +132,18 @@ class BaseErrorMeasure(PyCastObject):
 
         :raise:    Raises a ValueError if startDate or endDate do not represent correct boundaries for error calculation.
         """
+        # the error dates are ordered ascending
         if startDate is not None:
-            possibleDates = filter(lambda date: date >= startDate, self._errorDates)
-            if 0 == len(possibleDates):
+            startIdx = bisect_left(self._errorDates, startDate)
+            if len(self._errorDates) == startIdx:
                 raise ValueError("%s does not represent a valid startDate." % startDate)
-
-            startIdx = self._errorDates.index(min(possibleDates))
         else:
             startIdx = int((startingPercentage * len(self._errorValues)) / 100.0)
 
         if endDate is not None:
-            possibleDates = filter(lambda date: date <= endDate, self._errorDates)
-            if 0 == len(possibleDates):
+            endIdx = bisect_right(self._errorDates, endDate)
+            if 0 == endIdx:
                 raise ValueError("%s does not represent a valid endDate." % endDate)
-
-            endIdx = self._errorDates.index(max(possibleDates)) + 1
         else:
             endIdx = int((endPercentage * len(self._errorValues)) / 100.0)
 
@@ -22,6 +22,8 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
 # WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
+from bisect import bisect_left
+
 from pycast.errors.baseerrormeasure import BaseErrorMeasure
 
 class MeanAbsoluteScaledError(BaseErrorMeasure):
@@ -119,7 +121,7 @@ class MeanAbsoluteScaledError(BaseErrorMeasure):
         minCalcIdx  = self._historyLength + 1
 
         # calculate all valid local errors
-        for orgPair in originalTimeSeries[minCalcIdx:]:
+        for orgPair in originalTimeSeries.view(minCalcIdx):
             for calcIdx in xrange(minCalcIdx, len(calculatedTimeSeries)):
                 calcPair = calculatedTimeSeries[calcIdx]
 
@@ -161,14 +163,8 @@ class MeanAbsoluteScaledError(BaseErrorMeasure):
 
         # get the historic mean
         if startDate is not None:
-            possibleDates = filter(lambda date: date >= startDate, self._errorDates)
-
-            # This piece of code is not required, because _get_error_values already ensured that the startDate
-            # was correct. Otherwise it would have thrown an exception.
-            #if 0 == len(possibleDates):
-            #    raise ValueError("%s does not represent a valid startDate." % startDate)
-
-            meanIdx = self._errorDates.index(min(possibleDates))
+            # _get_error_values already ensured that the startDate is correct.
+            meanIdx = bisect_left(self._errorDates, startDate)
         else:
             meanIdx = int((startingPercentage * len(self._errorValues)) / 100.0)
 
@@ -22,6 +22,8 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
 # WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
+from itertools import izip
+
 from pycast.common.pycastobject import PyCastObject
 from pycast.common.timeseries import TimeSeries, FusionMethods
 from pycast.errors.meansigneddifferenceerror import MSD
@@ -158,12 +160,12 @@ class Regression(PyCastObject):
         :return:    Two two dimensional lists containing the matched values,
         :rtype:     two List
         """
-        time1 = map(lambda item: item[0], timeseries1.to_twodim_list())
-        time2 = map(lambda item: item[0], timeseries2.to_twodim_list())
+        time1 = timeseries1.get_column(0)
+        time2 = timeseries2.get_column(0)
 
-        matches = filter(lambda x: (x in time1), time2)
-        listX  = filter(lambda x: (x[0] in matches), timeseries1.to_twodim_list())
-        listY  = filter(lambda x: (x[0] in matches), timeseries2.to_twodim_list())
+        matches = set(time1).intersection(time2)
+        listX  = [entry for timestamp, entry in izip(time1, timeseries1.to_twodim_list()) if timestamp in matches]
+        listY  = [entry for timestamp, entry in izip(time2, timeseries2.to_twodim_list()) if timestamp in matches]
 
         return listX, listY
 
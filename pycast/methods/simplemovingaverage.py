@@ -97,15 +97,16 @@ class SimpleMovingAverage(BaseMethod):
         tsLength      = len(timeSeries)
         nbrOfLoopRuns = tsLength - windowsize + 1
 
-        res = TimeSeries()
+        # work on the columns to avoid copying the data points of each window
+        orgTimestamps = timeSeries.get_column(0)
+        orgValues     = timeSeries.get_column(1)
+
+        timestamps = []
+        values     = []
         for idx in xrange(nbrOfLoopRuns):
             end = idx + windowsize
-            data = timeSeries[idx:end]
-
-            timestamp = data[windowsize//2][0]
-            value     = sum([i[1] for i in data])/windowsize
 
-            res.add_entry(timestamp, value)
+            timestamps.append(orgTimestamps[idx + windowsize//2])
+            values.append(sum(orgValues[idx:end])/windowsize)
 
-        res.sort_timeseries()
-        return res
+        return TimeSeries.from_arrays(timestamps, values)
@@ -31,7 +31,7 @@ class BaseOptimizationMethod(PyCastObject):
 
     """Baseclass for all optimization methods."""
 
-    def __init__(self, errorMeasureClass, errorMeasureInitializationParameters=None, precision=-1):
+    def __init__(self, errorMeasureClass, errorMeasureInitializationParameters=None, precision=-1, resultCache=None):
         """Initializes the optimization method.
 
         :param BaseErrorMeasure errorMeasureClass:    Error measure class from :py:mod:`pycast.errors`.
@@ -39,6 +39,8 @@ class BaseOptimizationMethod(PyCastObject):
             the errorMeasureClass. This dictionary will be passed to the errorMeasureClass as \*\*kwargs.
         :param integer precision:    Defines the accuracy for parameter tuning in 10^precision.
             This parameter has to be an integer in [-7, 0].
+        :param ResultCache resultCache:    Optional :py:class:`pycast.common.resultcache.ResultCache`
+            used for all forecasts calculated during the optimization.
 
         :raise:    Raises a :py:exc:`TypeError` if errorMeasureClass is not a valid class.
             Valid classes are derived from :py:class:`pycast.errors.BaseErrorMeasure`.
@@ -60,6 +62,10 @@ class BaseOptimizationMethod(PyCastObject):
         self._precison   = int(precision)
         self._errorClass = errorMeasureClass
         self._errorMeasureKWArgs = errorMeasureInitializationParameters
+        self._resultCache = resultCache
+
+        self._startingPercentage = 0.0
+        self._endPercentage      = 100.0
 
     def optimize(self, timeSeries, forecastingMethods=None, startingPercentage=0.0, endPercentage=100.0):
         """Runs the optimization on the given TimeSeries.
@@ -81,4 +87,116 @@ class BaseOptimizationMethod(PyCastObject):
         """
         # no forecasting methods provided
         if forecastingMethods is None or len(forecastingMethods) == 0:
-            raise ValueError("forecastingMethods cannot be empty.")
\ No newline at end of file
+            raise ValueError("forecastingMethods cannot be empty.")
+
+    def _select_best_forecasting_method(self, timeSeries, forecastingMethods):
+        """Optimizes each forecasting method and returns the one with the smallest error.
+
+        The optimized parameters are set for the returned forecasting method.
+
+        :param TimeSeries timeSeries:    TimeSeries instance that requires an optimized forecast.
+        :param list forecastingMethods:    List of forecastingMethods that will be used for optimization.
+
+        :return:    Returns the optimized forecasting method, the corresponding error measure and the forecasting methods
+            parameters.
+        :rtype:     [BaseForecastingMethod, BaseErrorMeasure, Dictionary]
+        """
+        results = []
+        for forecastingMethod in forecastingMethods:
+            results.append([forecastingMethod] + self.optimize_forecasting_method(timeSeries, forecastingMethod))
+
+        # get the forecasting method with the smallest error
+        bestForecastingMethod = min(results, key=lambda item: item[1].get_error(self._startingPercentage, self._endPercentage))
+
+        for parameter in bestForecastingMethod[2]:
+            bestForecastingMethod[0].set_parameter(parameter, bestForecastingMethod[2][parameter])
+
+        return bestForecastingMethod
+
+    def _evaluate_parameter_values(self, timeSeries, forecastingMethod, parameterValues):
+        """Calculates the forecast and its error for one parameter combination.
+
+        :param TimeSeries timeSeries:    TimeSeries instance that requires an optimized forecast.
+        :param BaseForecastingMethod forecastingMethod:    ForecastingMethod that is used to optimize the parameters.
+        :param dictionary parameterValues:    The evaluated forecast parameter combination.
+
+        :return:    Returns the initialized BaseErrorMeasure instance as defined in :py:meth:`BaseOptimizationMethod.__init__`
+            or :py:const:`None`, if the error could not be calculated.
+        :rtype: BaseErrorMeasure
+        """
+        # set the forecasting parameters
+        for parameter in parameterValues:
+            forecastingMethod.set_parameter(parameter, parameterValues[parameter])
+
+        # calculate the forecast
+        forecast = timeSeries.apply(forecastingMethod, resultCache=self._resultCache)
+
+        # create and initialize the ErrorMeasure
+        error = self._errorClass(**self._errorMeasureKWArgs)
+
+        # when the error could not be calculated, return no result
+        if not error.initialize(timeSeries, forecast):
+            return None
+
+        return error
+
+    def _get_parameter_bounds(self, parameter, forecastingMethod):
+        """Returns the smallest and largest valid value of a parameter with respect to the precision.
+
+        Open interval boundaries are moved inwards by 10^precision.
+
+        :param string parameter:    Name of the parameter.
+        :param BaseForecastingMethod forecastingMethod:    Instance of a ForecastingMethod.
+
+        :return:    Returns a list containing the smallest and the largest valid value.
+        :rtype: list
+
+        :raise:    Raises a :py:exc:`ValueError` if the interval of the parameter does not contain
+            any value with the given precision.
+        """
+        interval = forecastingMethod.get_interval(parameter)
+
+        lowerBound = interval[0]
+        upperBound = interval[1]
+
+        if not interval[2]:
+            lowerBound += 10**self._precison
+
+        if not interval[3]:
+            upperBound -= 10**self._precison
+
+        if lowerBound > upperBound:
+            raise ValueError("The interval of %s does not contain any value with a precision of 10^%s." % (parameter, self._precison))
+
+        return [lowerBound, upperBound]
+
+    def _create_objective(self, timeSeries, forecastingMethod, parameters):
+        """Returns the function minimized by continuous optimization methods.
+
+        The function takes a list containing one value per parameter. The values are rounded to the
+        precision and each point is evaluated only once.
+
+        :param TimeSeries timeSeries:    TimeSeries instance that requires an optimized forecast.
+        :param BaseForecastingMethod forecastingMethod:    ForecastingMethod that is used to optimize the parameters.
+        :param list parameters:    Names of the optimized parameters.
+
+        :return:    Returns a function returning the error for the given parameter values and the
+            initialized BaseErrorMeasure instance. The error is infinite, if it could not be calculated.
+        :rtype: function
+        """
+        evaluatedPoints = {}
+
+        def objective(values):
+            point = tuple(round(value, -self._precison) for value in values)
+
+            if point not in evaluatedPoints:
+                error = self._evaluate_parameter_values(timeSeries, forecastingMethod, dict(zip(parameters, point)))
+
+                if error is None:
+                    evaluatedPoints[point] = (float("inf"), None)
+                else:
+                    evaluatedPoints[point] = (error.get_error(self._startingPercentage, self._endPercentage), error)
+
+            return evaluatedPoints[point]
+
+        return objective
@@ -0,0 +1,169 @@
+# !/usr/bin/env python
+#  -*- coding: UTF-8 -*-
+
+# Copyright (c) 2012-2015 Christian Schwarz
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+import math
+
+from pycast.optimization.baseoptimizationmethod import BaseOptimizationMethod
+
+## ratio used to divide the search interval
+GOLDEN_RATIO = (math.sqrt(5.0) - 1.0) / 2.0
+
+class GoldenSectionSearch(BaseOptimizationMethod):
+
+    """Implements the golden-section line search for parameter optimization.
+
+    Each parameter is optimized on its own while the other parameters are fixed. This is repeated
+    until a cycle over all parameters does not reduce the error anymore. The golden-section search
+    finds the minimum of errors that are unimodal along each parameter.
+    """
+
+    def __init__(self, errorMeasureClass, errorMeasureInitializationParameters=None, precision=-1, resultCache=None,
+                 maximalCycles=10):
+        """Initializes the GoldenSectionSearch optimization method.
+
+        :param BaseErrorMeasure errorMeasureClass:    Error measure class from :py:mod:`pycast.errors`.
+        :param dictionary errorMeasureInitializationParameters:    Parameters used to initialize
+            the errorMeasureClass. This dictionary will be passed to the errorMeasureClass as \\*\\*kwargs.
+        :param integer precision:    Defines the accuracy for parameter tuning in 10^precision.
+            This parameter has to be an integer in [-7, 0]. Each line search stops, when the search interval
+            is smaller than this accuracy.
+        :param ResultCache resultCache:    Optional :py:class:`pycast.common.resultcache.ResultCache`
+            used for all forecasts calculated during the optimization.
+        :param integer maximalCycles:    Maximal number of cycles over all parameters per forecasting method.
+
+        :raise:    Raises a :py:exc:`ValueError` if maximalCycles is smaller than one.
+        """
+        if maximalCycles < 1:
+            raise ValueError("maximalCycles has to be larger than zero.")
+
+        super(GoldenSectionSearch, self).__init__(errorMeasureClass, errorMeasureInitializationParameters, precision, resultCache)
+
+        self._maximalCycles = maximalCycles
+
+    def optimize(self, timeSeries, forecastingMethods=None, startingPercentage=0.0, endPercentage=100.0):
+        """Runs the optimization of the given TimeSeries.
+
+        :param TimeSeries timeSeries:    TimeSeries instance that requires an optimized forecast.
+        :param list forecastingMethods:    List of forecastingMethods that will be used for optimization.
+        :param float startingPercentage: Defines the start of the interval. This has to be a value in [0.0, 100.0].
+            It represents the value, where the error calculation should be started.
+            25.0 for example means that the first 25% of all calculated errors will be ignored.
+        :param float endPercentage:    Defines the end of the interval. This has to be a value in [0.0, 100.0].
+            It represents the value, after which all error values will be ignored. 90.0 for example means that
+            the last 10% of all local errors will be ignored.
+
+        :return:    Returns the optimized forecasting method, the corresponding error measure and the forecasting methods
+            parameters.
+        :rtype:     [BaseForecastingMethod, BaseErrorMeasure, Dictionary]
+
+        :raise:    Raises a :py:exc:`ValueError` ValueError if no forecastingMethods is empty.
+        """
+        if forecastingMethods is None or len(forecastingMethods) == 0:
+            raise ValueError("forecastingMethods cannot be empty.")
+
+        self._startingPercentage = startingPercentage
+        self._endPercentage      = endPercentage
+
+        return self._select_best_forecasting_method(timeSeries, forecastingMethods)
+
+    def optimize_forecasting_method(self, timeSeries, forecastingMethod):
+        """Optimizes the parameters for the given timeSeries and forecastingMethod.
+
+        The search starts in the center of the parameter intervals.
+
+        :param TimeSeries timeSeries:    TimeSeries instance, containing hte original data.
+        :param BaseForecastingMethod forecastingMethod:    ForecastingMethod that is used to optimize the parameters.
+
+        :return: Returns a list containing the smallest BaseErrorMeasure instance as defined in
+            :py:meth:`BaseOptimizationMethod.__init__` and the forecastingMethods parameter.
+        :rtype: list
+
+        :raise:    Raises a :py:exc:`ValueError` if no error could be calculated.
+        """
+        parameters = forecastingMethod.get_optimizable_parameters()
+        bounds     = [self._get_parameter_bounds(parameter, forecastingMethod) for parameter in parameters]
+        objective  = self._create_objective(timeSeries, forecastingMethod, parameters)
+
+        point     = [(lowerBound + upperBound) / 2.0 for lowerBound, upperBound in bounds]
+        bestError = objective(point)[0]
+
+        for cycle in xrange(self._maximalCycles):
+            previousError = bestError
+
+            for index, (lowerBound, upperBound) in enumerate(bounds):
+                point[index] = self._line_search(objective, point, index, lowerBound, upperBound)
+
+            bestError = objective(point)[0]
+            if not bestError < previousError:
+                break
+
+        error = objective(point)[1]
+
+        if error is None:
+            raise ValueError("The error could not be calculated for any parameter combination.")
+
+        return [error, dict(zip(parameters, [round(value, -self._precison) for value in point]))]
+
+    def _line_search(self, objective, point, index, lowerBound, upperBound):
+        """Searches the best value of one parameter, while the other parameters are fixed.
+
+        :param function objective:    Function returning the error for a point as returned by
+            :py:meth:`BaseOptimizationMethod._create_objective`.
+        :param list point:    Current values of all parameters.
+        :param integer index:    Index of the parameter that is optimized.
+        :param float lowerBound:    Smallest valid value of the parameter.
+        :param float upperBound:    Largest valid value of the parameter.
+
+        :return:    Returns the value of the parameter with the smallest error. The current value
+            is kept, if no other value results in a smaller error.
+        :rtype: float
+        """
+        tolerance = 10**self._precison
+
+        def evaluate(value):
+            candidate = list(point)
+            candidate[index] = value
+            return objective(candidate)[0]
+
+        lower = lowerBound
+        upper = upperBound
+
+        left       = upper - GOLDEN_RATIO * (upper - lower)
+        right      = lower + GOLDEN_RATIO * (upper - lower)
+        leftError  = evaluate(left)
+        rightError = evaluate(right)
+
+        while upper - lower > tolerance:
+            if leftError < rightError:
+                upper, right, rightError = right, left, leftError
+                left      = upper - GOLDEN_RATIO * (upper - lower)
+                leftError = evaluate(left)
+            else:
+                lower, left, leftError = left, right, rightError
+                right      = lower + GOLDEN_RATIO * (upper - lower)
+                rightError = evaluate(right)
+
+        # the minimum might be located on a boundary of the parameters interval
+        return min([point[index], left, right, lowerBound, upperBound], key=evaluate)
@@ -22,8 +22,54 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
 # WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
+import threading
+
+from copy import copy, deepcopy
+from heapq import heappush, heapreplace
+from itertools import product, izip
+from multiprocessing import Pool, cpu_count
+from multiprocessing.pool import ThreadPool
+
 from pycast.optimization.baseoptimizationmethod import BaseOptimizationMethod
 
+## Executors that can be used to evaluate the grid of a GridSearch
+GridSearchExecutors = {
+    "serial":  None,
+    "thread":  ThreadPool,
+    "process": Pool
+}
+
+## data shared by all tasks of a GridSearch worker
+_workerState = threading.local()
+
+def _initialize_worker(gridSearch, timeSeries, forecastingMethod):
+    """Stores the data shared by all tasks evaluated by a worker of the GridSearch.
+
+    This is called once per worker, so the TimeSeries is not transferred with each task.
+
+    :param GridSearch gridSearch:    GridSearch instance evaluating the grid.
+    :param TimeSeries timeSeries:    TimeSeries instance that requires an optimized forecast.
+    :param BaseForecastingMethod forecastingMethod:    ForecastingMethod that is used to optimize the parameters.
+        Each worker uses its own copy, because the parameters are changed for each evaluation.
+    """
+    _workerState.gridSearch        = gridSearch
+    _workerState.timeSeries        = timeSeries
+    _workerState.forecastingMethod = deepcopy(forecastingMethod)
+
+def _optimize_task(task):
+    """Evaluates a part of the grid within a worker of the GridSearch.
+
+    :param tuple task:    Tuple containing the fixed parameter values, the remaining parameters
+        and the number of results as used by :py:meth:`GridSearch.optimization_loop`.
+
+    :return:    Returns the results with the smallest errors as returned by :py:meth:`GridSearch.optimization_loop`.
+    :rtype: list
+    """
+    currentParameterValues, remainingParameters, numberOfResults = task
+
+    return _workerState.gridSearch.optimization_loop(_workerState.timeSeries, _workerState.forecastingMethod,
+                                                     remainingParameters, currentParameterValues, numberOfResults)
+
 class GridSearch(BaseOptimizationMethod):
 
     """Implements the grid search method for parameter optimization.
@@ -31,6 +77,49 @@ class GridSearch(BaseOptimizationMethod):
     GridSearch is the brute force method.
     """
 
+    def __init__(self, errorMeasureClass, errorMeasureInitializationParameters=None, precision=-1, resultCache=None,
+                 executor="serial", workers=None, coarsePrecision=None, numberOfRefinedResults=3):
+        """Initializes the GridSearch.
+
+        :param BaseErrorMeasure errorMeasureClass:    Error measure class from :py:mod:`pycast.errors`.
+        :param dictionary errorMeasureInitializationParameters:    Parameters used to initialize
+            the errorMeasureClass. This dictionary will be passed to the errorMeasureClass as \*\*kwargs.
+        :param integer precision:    Defines the accuracy for parameter tuning in 10^precision.
+            This parameter has to be an integer in [-7, 0].
+        :param ResultCache resultCache:    Optional :py:class:`pycast.common.resultcache.ResultCache`
+            used for all forecasts calculated during the optimization. It is not used by the "process" executor.
+        :param string executor:    Defines how the grid is evaluated. Valid values are "serial", "thread" and "process".
+            The "thread" and "process" executors partition the grid into tasks that are evaluated by a pool of workers.
+        :param integer workers:    Number of workers used by the "thread" and "process" executors.
+            The number of CPUs is used by default.
+        :param integer coarsePrecision:    Enables the coarse-to-fine search. The grid is evaluated with an accuracy
+            of 10^coarsePrecision first. Afterwards the neighbourhood of the best results is evaluated with a ten times
+            higher accuracy, until the accuracy of 10^precision is reached. This has to be an integer in [precision, 0].
+            Parameters without a value at the accuracy of 10^coarsePrecision are refined from the center of their interval.
+        :param integer numberOfRefinedResults:    Number of best results whose neighbourhood is evaluated in each
+            refinement step of the coarse-to-fine search.
+
+        :raise:    Raises a :py:exc:`ValueError` if the executor is unknown, workers or numberOfRefinedResults
+            is smaller than one or coarsePrecision is not in [precision, 0].
+        """
+        if executor not in GridSearchExecutors:
+            raise ValueError("executor has to be one of %s." % ", ".join(sorted(GridSearchExecutors)))
+        if workers is not None and workers < 1:
+            raise ValueError("workers has to be larger than zero.")
+        if numberOfRefinedResults < 1:
+            raise ValueError("numberOfRefinedResults has to be larger than zero.")
+
+        super(GridSearch, self).__init__(errorMeasureClass, errorMeasureInitializationParameters, precision, resultCache)
+
+        if coarsePrecision is not None and not self._precison <= coarsePrecision <= 0:
+            raise ValueError("coarsePrecision has to be in [precision, 0].")
+
+        self._executor = executor
+        self._workers  = workers
+
+        self._coarsePrecision        = coarsePrecision
+        self._numberOfRefinedResults = numberOfRefinedResults
+
     def optimize(self, timeSeries, forecastingMethods=None, startingPercentage=0.0, endPercentage=100.0):
         """Runs the optimization of the given TimeSeries.
 
@@ -56,30 +145,25 @@ class GridSearch(BaseOptimizationMethod):
         self._startingPercentage = startingPercentage
         self._endPercentage      = endPercentage
 
-        results = []
-        for forecastingMethod in forecastingMethods:
-            results.append([forecastingMethod] + self.optimize_forecasting_method(timeSeries, forecastingMethod))
-
-        # get the forecasting method with the smallest error
-        bestForecastingMethod = min(results, key=lambda item: item[1].get_error(self._startingPercentage, self._endPercentage))
-
-        for parameter in bestForecastingMethod[2]:
-            bestForecastingMethod[0].set_parameter(parameter, bestForecastingMethod[2][parameter])
+        return self._select_best_forecasting_method(timeSeries, forecastingMethods)
 
-        return bestForecastingMethod
 
-
-    def _generate_next_parameter_value(self, parameter, forecastingMethod):
+    def _generate_next_parameter_value(self, parameter, forecastingMethod, precision=None):
         """Generator for a specific parameter of the given forecasting method.
 
         :param string parameter:    Name of the parameter the generator is used for.
         :param BaseForecastingMethod forecastingMethod:    Instance of a ForecastingMethod.
+        :param integer precision:    Accuracy of the values in 10^precision. The precision
+            of the GridSearch is used by default.
 
         :return:    Creates a generator used to iterate over possible parameters.
         :rtype:     generator
         """
+        if precision is None:
+            precision = self._precison
+
         interval  = forecastingMethod.get_interval(parameter)
-        precision = 10**self._precison
+        precision = 10**precision
 
         startValue = interval[0]
         endValue   = interval[1]
@@ -97,6 +181,22 @@ class GridSearch(BaseOptimizationMethod):
             yield parameterValue
             startValue += precision
 
+    def _generate_neighbouring_parameter_values(self, parameter, forecastingMethod, value, precision):
+        """Returns the values of a parameter around a previously evaluated value.
+
+        The neighbourhood covers one step of the previous accuracy 10^(precision + 1) in each direction.
+
+        :param string parameter:    Name of the parameter the values are generated for.
+        :param BaseForecastingMethod forecastingMethod:    Instance of a ForecastingMethod.
+        :param float value:    Center of the neighbourhood.
+        :param integer precision:    Accuracy of the values in 10^precision.
+
+        :return:    Returns a list of the valid parameter values within the neighbourhood.
+        :rtype:     list
+        """
+        values = [round(value + step * 10**precision, -precision) for step in xrange(-10, 11)]
+        return [item for item in values if forecastingMethod._in_valid_interval(parameter, item)]
+
     def optimize_forecasting_method(self, timeSeries, forecastingMethod):
         """Optimizes the parameters for the given timeSeries and forecastingMethod.
 
@@ -106,93 +206,277 @@ class GridSearch(BaseOptimizationMethod):
         :return: Returns a tuple containing only the smallest BaseErrorMeasure instance as defined in
             :py:meth:`BaseOptimizationMethod.__init__` and the forecastingMethods parameter.
         :rtype: tuple
+
+        :raise:    Raises a :py:exc:`ValueError` if no error could be calculated.
         """
         tuneableParameters = forecastingMethod.get_optimizable_parameters()
 
+        precision       = self._precison
+        numberOfResults = 1
+        if self._coarsePrecision is not None:
+            precision       = self._coarsePrecision
+            numberOfResults = self._numberOfRefinedResults
+
         remainingParameters = []
         for tuneableParameter in tuneableParameters:
-            remainingParameters.append([tuneableParameter, [item for item in self._generate_next_parameter_value(tuneableParameter, forecastingMethod)]])
-
-        # Collect the forecasting results
-        forecastingResults = self.optimization_loop(timeSeries, forecastingMethod, remainingParameters)
-
-        # Debugging GridSearchTest.inner_optimization_result_test
-        #print ""
-        #print "GridSearch"
-        #print "Instance    /    SMAPE / Alpha"
-        #for item in forecastingResults:
-        #    print "%s / %s / %s" % (
-        #    str(item[0])[-12:-1],
-        #    str(item[0].get_error(self._startingPercentage, self._endPercentage))[:8],
-        #    item[1]["smoothingFactor"]
-        #)
-        #print ""
-
-        # Collect the parameters that resulted in the smallest error
-        bestForecastingResult = min(forecastingResults, key=lambda item: item[0].get_error(self._startingPercentage, self._endPercentage))
+            values = [item for item in self._generate_next_parameter_value(tuneableParameter, forecastingMethod, precision)]
+
+            if precision > self._precison:
+                # the coarse values are rounded like the refined ones, so they are not evaluated again
+                values = [round(item, -precision) for item in values]
+                values = [item for item in values if forecastingMethod._in_valid_interval(tuneableParameter, item)]
+
+                # the coarse grid might not contain a valid value, e.g. for the open interval (0.0, 1.0) and a step of 1.0
+                if 0 == len(values):
+                    interval = forecastingMethod.get_interval(tuneableParameter)
+                    values   = [(interval[0] + interval[1]) / 2.0]
+
+            remainingParameters.append([tuneableParameter, values])
+
+        # all grids of the optimization are evaluated by the same workers
+        pool = None
+        if "serial" != self._executor and 0 < len(tuneableParameters):
+            pool = self._create_pool(timeSeries, forecastingMethod)
+
+        try:
+            # Collect the parameters that resulted in the smallest errors
+            forecastingResults = self._evaluate_tasks(self._create_grid_tasks(remainingParameters, pool), numberOfResults,
+                                                      timeSeries, forecastingMethod, pool)
+
+            # evaluate the neighbourhood of the best results until the requested precision is reached
+            evaluatedParameters = set()
+            if precision > self._precison and 0 < len(tuneableParameters):
+                evaluatedParameters.update(self._get_parameter_key(parameterValues) for parameterValues in self._enumerate_parameter_values(remainingParameters, {}))
+
+            while precision > self._precison and 0 < len(tuneableParameters):
+                precision -= 1
+
+                # the neighbourhoods of the best results overlap and contain the previously evaluated combinations,
+                # so only the combinations that have not been evaluated before are passed to the workers
+                tasks = []
+                for forecastingResult in forecastingResults:
+                    remainingParameters = []
+                    for tuneableParameter in tuneableParameters:
+                        remainingParameters.append([tuneableParameter, self._generate_neighbouring_parameter_values(tuneableParameter, forecastingMethod, forecastingResult[1][tuneableParameter], precision)])
+
+                    for parameterValues in self._enumerate_parameter_values(remainingParameters, {}):
+                        parameterKey = self._get_parameter_key(parameterValues)
+                        if parameterKey not in evaluatedParameters:
+                            evaluatedParameters.add(parameterKey)
+                            tasks.append((parameterValues, []))
+
+                # the previous results are part of the neighbourhoods, but they are not evaluated again
+                forecastingResults = self._select_best_results(forecastingResults + self._evaluate_tasks(tasks, numberOfResults, timeSeries, forecastingMethod, pool), numberOfResults)
+
+            if pool is not None:
+                pool.close()
+        except:
+            if pool is not None:
+                pool.terminate()
+            raise
+        finally:
+            if pool is not None:
+                pool.join()
+
+        if 0 == len(forecastingResults):
+            raise ValueError("The error could not be calculated for any parameter combination.")
 
         # return the determined parameters
-        return bestForecastingResult
+        return forecastingResults[0]
+
+    def _enumerate_parameter_values(self, remainingParameters, currentParameterValues):
+        """Generator for all parameter combinations of the grid.
+
+        The last parameter in remainingParameters changes slowest, the first one fastest.
+
+        :param list remainingParameters:    List containing all parameters with their corresponding values.
+        :param dictionary currentParameterValues:    Fixed parameter values that are part of each combination.
+
+        :return:    Creates a generator used to iterate over the parameter combinations as dictionaries.
+        :rtype:     generator
+        """
+        parameterNames  = [parameter[0] for parameter in reversed(remainingParameters)]
+        parameterValues = [parameter[1] for parameter in reversed(remainingParameters)]
+
+        for values in product(*parameterValues):
+            parameterCombination = dict(currentParameterValues)
+            parameterCombination.update(izip(parameterNames, values))
+
+            yield parameterCombination
+
+    def _get_parameter_key(self, parameterValues):
+        """Returns a hashable representation of a parameter combination.
+
+        The values are rounded to the precision of the GridSearch, so values that
+        only differ by floating point errors are represented equally.
+
+        :param dictionary parameterValues:    Parameter combination.
 
-    def optimization_loop(self, timeSeries, forecastingMethod, remainingParameters, currentParameterValues=None):
+        :return:    Returns the sorted (name, value) pairs of the combination.
+        :rtype: tuple
+        """
+        return tuple(sorted((name, round(value, -self._precison)) for name, value in parameterValues.iteritems()))
+
+    def _create_grid_tasks(self, remainingParameters, pool):
+        """Returns the tasks evaluating the given grid.
+
+        :param list remainingParameters:    List containing all parameters with their corresponding values.
+        :param Pool pool:    Pool of workers evaluating the tasks or :py:const:`None` for the serial executor.
+
+        :return:    Returns a list of tuples, containing the fixed parameter values and the remaining parameters.
+        :rtype: list
+        """
+        if pool is None:
+            return [({}, remainingParameters)]
+
+        # multiple tasks per worker balance the load
+        return self._create_tasks(remainingParameters, 4 * self._get_worker_count())
+
+    def _evaluate_tasks(self, tasks, numberOfResults, timeSeries, forecastingMethod, pool):
+        """Evaluates the given tasks, using the pool of workers if available.
+
+        Each task only returns its best results, and the results with the smallest errors
+        are determined while the tasks are evaluated.
+
+        :param list tasks:    List of tuples as returned by :py:meth:`GridSearch._create_tasks`.
+        :param integer numberOfResults:    Number of results with the smallest errors that are returned.
+        :param TimeSeries timeSeries:    TimeSeries instance that requires an optimized forecast.
+        :param BaseForecastingMethod forecastingMethod:    ForecastingMethod that is used to optimize the parameters.
+        :param Pool pool:    Pool of workers created by :py:meth:`GridSearch._create_pool` or :py:const:`None`
+            to evaluate the tasks within the current thread.
+
+        :return:    Returns the best results as described in :py:meth:`GridSearch.optimization_loop`.
+        :rtype: list
+        """
+        if pool is None:
+            taskResults = (self.optimization_loop(timeSeries, forecastingMethod, remainingParameters, currentParameterValues, numberOfResults)
+                           for currentParameterValues, remainingParameters in tasks)
+        else:
+            # chunks of tasks keep the overhead low
+            chunkSize   = max(1, len(tasks) // (4 * self._get_worker_count()))
+            taskResults = pool.imap(_optimize_task, [task + (numberOfResults, ) for task in tasks], chunkSize)
+
+        bestResults = []
+        for results in taskResults:
+            bestResults = self._select_best_results(bestResults + results, numberOfResults)
+
+        return bestResults
+
+    def _select_best_results(self, results, numberOfResults):
+        """Returns the best of the given results.
+
+        :param list results:    List of results as returned by :py:meth:`GridSearch.optimization_loop`.
+        :param integer numberOfResults:    Number of results that are returned.
+
+        :return:    Returns up to numberOfResults results with distinct parameters, ordered by their error.
+            Results with equal errors keep their order.
+        :rtype: list
+        """
+        results = sorted(results, key=lambda item: item[0].get_error(self._startingPercentage, self._endPercentage))
+
+        bestResults    = []
+        seenParameters = set()
+        for result in results:
+            parameterKey = self._get_parameter_key(result[1])
+            if parameterKey in seenParameters:
+                continue
+
+            seenParameters.add(parameterKey)
+            bestResults.append(result)
+
+            if numberOfResults == len(bestResults):
+                break
+
+        return bestResults
+
+    def optimization_loop(self, timeSeries, forecastingMethod, remainingParameters, currentParameterValues=None, numberOfResults=1):
         """The optimization loop.
 
-        This function is called recursively, until all parameter values were evaluated.
+        All parameter combinations are enumerated one after the other, while only the best results are kept.
+        The memory consumption therefore does not depend on the size of the grid.
 
         :param TimeSeries timeSeries:    TimeSeries instance that requires an optimized forecast.
         :param BaseForecastingMethod forecastingMethod:    ForecastingMethod that is used to optimize the parameters.
-        :param list remainingParameters:    List containing all parameters with their corresponding values that still
+        :param list remainingParameters:    List containing all parameters with their corresponding values that
             need to be evaluated.
-            When this list is empty, the most inner optimization loop is reached.
-        :param dictionary currentParameterValues:    The currently evaluated forecast parameter combination.
+        :param dictionary currentParameterValues:    Fixed forecast parameter values used for all combinations.
+        :param integer numberOfResults:    Number of results with the smallest errors that are returned.
 
-        :return: Returns a list containing a BaseErrorMeasure instance as defined in
-            :py:meth:`BaseOptimizationMethod.__init__` and the forecastingMethods parameter.
+        :return: Returns a list containing up to numberOfResults lists of a BaseErrorMeasure instance as defined in
+            :py:meth:`BaseOptimizationMethod.__init__` and the forecastingMethods parameter, ordered by their error.
+            Results with equal errors are ordered by their position within the grid.
         :rtype: list
         """
-
         if currentParameterValues is None:
             currentParameterValues = {}
 
-        # The most inner loop is reached
-        if 0 == len(remainingParameters):
-            # set the forecasting parameters
-            for parameter in currentParameterValues:
-                forecastingMethod.set_parameter(parameter, currentParameterValues[parameter])
+        # heap of the best results, the worst result is stored first
+        bestResults = []
 
-            # calculate the forecast
-            forecast = timeSeries.apply(forecastingMethod)
+        parameterCombinations = self._enumerate_parameter_values(remainingParameters, currentParameterValues)
+        for index, parameterValues in enumerate(parameterCombinations):
+            error = self._evaluate_parameter_values(timeSeries, forecastingMethod, parameterValues)
 
-            # create and initialize the ErrorMeasure
-            error = self._errorClass(**self._errorMeasureKWArgs)
+            if error is None:
+                continue
 
-            # when the error could not be calculated, return an empty result
-            if not error.initialize(timeSeries, forecast):
-                return []
+            entry = (-error.get_error(self._startingPercentage, self._endPercentage), -index, [error, parameterValues])
 
-            # Debugging GridSearchTest.inner_optimization_result_test
-            #print "Instance / SMAPE / Alpha: %s / %s / %s" % (
-            #    str(error)[-12:-1],
-            #    str(error.get_error(self._startingPercentage, self._endPercentage))[:8],
-            #    currentParameterValues["smoothingFactor"]
-            #)
+            if len(bestResults) < numberOfResults:
+                heappush(bestResults, entry)
+            elif entry > bestResults[0]:
+                heapreplace(bestResults, entry)
 
-            # return the result
-            return [[error, dict(currentParameterValues)]]
+        return [entry[2] for entry in sorted(bestResults, reverse=True)]
 
-        # If this is not the most inner loop than extract an additional parameter
-        localParameter       = remainingParameters[-1]
-        localParameterName   = localParameter[0]
-        localParameterValues = localParameter[1]
+    def _create_tasks(self, remainingParameters, taskCount):
+        """Partitions the grid into tasks of equal size.
 
+        The outermost parameters of :py:meth:`GridSearch.optimization_loop` are fixed until
+        at least taskCount tasks exist. The order of the tasks matches the evaluation order
+        of :py:meth:`GridSearch.optimization_loop`.
 
-        # initialize the result
-        results = []
+        :param list remainingParameters:    List containing all parameters with their corresponding values.
+        :param integer taskCount:    Minimal number of tasks that should be created.
 
-        # check the next level for each existing parameter
-        for value in localParameterValues:
-            currentParameterValues[localParameterName] = value
-            remainingParameters = remainingParameters[:-1]
-            results += self.optimization_loop(timeSeries, forecastingMethod, remainingParameters, currentParameterValues)
+        :return:    Returns a list of tuples, containing the fixed parameter values and the remaining parameters.
+        :rtype: list
+        """
+        tasks = [({}, remainingParameters)]
 
-        return results
+        while len(tasks) < taskCount and 0 < len(tasks[0][1]):
+            parameterName, parameterValues = tasks[0][1][-1]
+            innerParameters = tasks[0][1][:-1]
+
+            tasks = [(dict(currentParameterValues, **{parameterName: value}), innerParameters)
+                     for currentParameterValues, dummy in tasks for value in parameterValues]
+
+        return tasks
+
+    def _get_worker_count(self):
+        """Returns the number of workers used by the "thread" and "process" executors."""
+        return self._workers or cpu_count()
+
+    def _create_pool(self, timeSeries, forecastingMethod):
+        """Creates the pool of workers evaluating the grids of one forecasting method.
+
+        The TimeSeries is transferred to each worker once, when the pool is created.
+
+        :param TimeSeries timeSeries:    TimeSeries instance that requires an optimized forecast.
+        :param BaseForecastingMethod forecastingMethod:    ForecastingMethod that is used to optimize the parameters.
+
+        :return:    Returns a pool of the executor of the GridSearch.
+        :rtype: Pool
+        """
+        # the workers share the TimeSeries, so it is prepared before
+        if forecastingMethod.has_to_be_sorted():
+            timeSeries.sort_timeseries()
+
+        gridSearch = self
+        if "process" == self._executor:
+            gridSearch = copy(self)
+            gridSearch._resultCache = None
+        elif self._resultCache is not None:
+            timeSeries.fingerprint()
+
+        return GridSearchExecutors[self._executor](self._get_worker_count(), _initialize_worker, (gridSearch, timeSeries, forecastingMethod))
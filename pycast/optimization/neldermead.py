@@ -0,0 +1,196 @@
+# !/usr/bin/env python
+#  -*- coding: UTF-8 -*-
+
+# Copyright (c) 2012-2015 Christian Schwarz
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+from pycast.optimization.baseoptimizationmethod import BaseOptimizationMethod
+
+class NelderMead(BaseOptimizationMethod):
+
+    """Implements the Nelder-Mead simplex method for parameter optimization.
+
+    The simplex method does not require the derivatives of the error and needs far fewer forecasts than
+    the :py:class:`pycast.optimization.gridsearch.GridSearch`. It converges to a local minimum of the error.
+    """
+
+    ## coefficients used for reflection, expansion, contraction and shrinkage of the simplex
+    _reflection  = 1.0
+    _expansion   = 2.0
+    _contraction = 0.5
+    _shrinkage   = 0.5
+
+    def __init__(self, errorMeasureClass, errorMeasureInitializationParameters=None, precision=-1, resultCache=None,
+                 maximalIterations=500):
+        """Initializes the NelderMead optimization method.
+
+        :param BaseErrorMeasure errorMeasureClass:    Error measure class from :py:mod:`pycast.errors`.
+        :param dictionary errorMeasureInitializationParameters:    Parameters used to initialize
+            the errorMeasureClass. This dictionary will be passed to the errorMeasureClass as \\*\\*kwargs.
+        :param integer precision:    Defines the accuracy for parameter tuning in 10^precision.
+            This parameter has to be an integer in [-7, 0]. The optimization stops, when the simplex
+            is smaller than this accuracy.
+        :param ResultCache resultCache:    Optional :py:class:`pycast.common.resultcache.ResultCache`
+            used for all forecasts calculated during the optimization.
+        :param integer maximalIterations:    Maximal number of iterations per forecasting method.
+
+        :raise:    Raises a :py:exc:`ValueError` if maximalIterations is smaller than one.
+        """
+        if maximalIterations < 1:
+            raise ValueError("maximalIterations has to be larger than zero.")
+
+        super(NelderMead, self).__init__(errorMeasureClass, errorMeasureInitializationParameters, precision, resultCache)
+
+        self._maximalIterations = maximalIterations
+
+    def optimize(self, timeSeries, forecastingMethods=None, startingPercentage=0.0, endPercentage=100.0):
+        """Runs the optimization of the given TimeSeries.
+
+        :param TimeSeries timeSeries:    TimeSeries instance that requires an optimized forecast.
+        :param list forecastingMethods:    List of forecastingMethods that will be used for optimization.
+        :param float startingPercentage: Defines the start of the interval. This has to be a value in [0.0, 100.0].
+            It represents the value, where the error calculation should be started.
+            25.0 for example means that the first 25% of all calculated errors will be ignored.
+        :param float endPercentage:    Defines the end of the interval. This has to be a value in [0.0, 100.0].
+            It represents the value, after which all error values will be ignored. 90.0 for example means that
+            the last 10% of all local errors will be ignored.
+
+        :return:    Returns the optimized forecasting method, the corresponding error measure and the forecasting methods
+            parameters.
+        :rtype:     [BaseForecastingMethod, BaseErrorMeasure, Dictionary]
+
+        :raise:    Raises a :py:exc:`ValueError` ValueError if no forecastingMethods is empty.
+        """
+        if forecastingMethods is None or len(forecastingMethods) == 0:
+            raise ValueError("forecastingMethods cannot be empty.")
+
+        self._startingPercentage = startingPercentage
+        self._endPercentage      = endPercentage
+
+        return self._select_best_forecasting_method(timeSeries, forecastingMethods)
+
+    def optimize_forecasting_method(self, timeSeries, forecastingMethod):
+        """Optimizes the parameters for the given timeSeries and forecastingMethod.
+
+        The initial simplex is placed in the center of the parameter intervals and spans a quarter of each interval.
+        Points outside of the parameter intervals are moved onto their boundaries.
+
+        :param TimeSeries timeSeries:    TimeSeries instance, containing hte original data.
+        :param BaseForecastingMethod forecastingMethod:    ForecastingMethod that is used to optimize the parameters.
+
+        :return: Returns a list containing the smallest BaseErrorMeasure instance as defined in
+            :py:meth:`BaseOptimizationMethod.__init__` and the forecastingMethods parameter.
+        :rtype: list
+
+        :raise:    Raises a :py:exc:`ValueError` if no error could be calculated.
+        """
+        parameters = forecastingMethod.get_optimizable_parameters()
+        bounds     = [self._get_parameter_bounds(parameter, forecastingMethod) for parameter in parameters]
+        objective  = self._create_objective(timeSeries, forecastingMethod, parameters)
+        tolerance  = 10**self._precison
+
+        # create the initial simplex
+        center  = [(lowerBound + upperBound) / 2.0 for lowerBound, upperBound in bounds]
+        simplex = [center]
+        for index, (lowerBound, upperBound) in enumerate(bounds):
+            vertex = list(center)
+            vertex[index] += (upperBound - lowerBound) / 4.0
+            simplex.append(vertex)
+
+        errors = [objective(vertex)[0] for vertex in simplex]
+
+        for iteration in xrange(self._maximalIterations):
+            # order the vertices by their error, the best vertex is stored first
+            order   = sorted(xrange(len(simplex)), key=errors.__getitem__)
+            simplex = [simplex[index] for index in order]
+            errors  = [errors[index] for index in order]
+
+            if self._get_simplex_size(simplex) < tolerance:
+                break
+
+            centroid = [sum(values) / len(parameters) for values in zip(*simplex[:-1])]
+
+            reflected      = self._move(centroid, simplex[-1], -self._reflection, bounds)
+            reflectedError = objective(reflected)[0]
+
+            if reflectedError < errors[0]:
+                expanded      = self._move(centroid, simplex[-1], -self._expansion, bounds)
+                expandedError = objective(expanded)[0]
+
+                if expandedError < reflectedError:
+                    simplex[-1], errors[-1] = expanded, expandedError
+                else:
+                    simplex[-1], errors[-1] = reflected, reflectedError
+
+            elif reflectedError < errors[-2]:
+                simplex[-1], errors[-1] = reflected, reflectedError
+
+            else:
+                # contract towards the better one of the reflected and the worst vertex
+                if reflectedError < errors[-1]:
+                    contracted = self._move(centroid, reflected, self._contraction, bounds)
+                else:
+                    contracted = self._move(centroid, simplex[-1], self._contraction, bounds)
+                contractedError = objective(contracted)[0]
+
+                if contractedError < min(reflectedError, errors[-1]):
+                    simplex[-1], errors[-1] = contracted, contractedError
+                else:
+                    # shrink the simplex towards the best vertex
+                    simplex = [simplex[0]] + [self._move(simplex[0], vertex, self._shrinkage, bounds) for vertex in simplex[1:]]
+                    errors  = [errors[0]] + [objective(vertex)[0] for vertex in simplex[1:]]
+
+        best  = min(xrange(len(simplex)), key=errors.__getitem__)
+        error = objective(simplex[best])[1]
+
+        if error is None:
+            raise ValueError("The error could not be calculated for any parameter combination.")
+
+        return [error, dict(zip(parameters, [round(value, -self._precison) for value in simplex[best]]))]
+
+    def _move(self, origin, vertex, factor, bounds):
+        """Returns the point origin + factor * (vertex - origin), limited to the parameter bounds.
+
+        :param list origin:    Point the movement is relative to.
+        :param list vertex:    Vertex of the simplex.
+        :param float factor:    Factor applied to the distance between origin and vertex.
+        :param list bounds:    Lists containing the smallest and largest valid value of each parameter.
+
+        :return:    Returns the new point.
+        :rtype: list
+        """
+        point = []
+        for originValue, vertexValue, (lowerBound, upperBound) in zip(origin, vertex, bounds):
+            point.append(min(max(originValue + factor * (vertexValue - originValue), lowerBound), upperBound))
+
+        return point
+
+    def _get_simplex_size(self, simplex):
+        """Returns the largest distance of a vertex to the best vertex in any dimension.
+
+        :param list simplex:    Vertices of the simplex, the best vertex is stored first.
+
+        :return:    Returns the size of the simplex.
+        :rtype: float
+        """
+        best = simplex[0]
+        return max([abs(value - bestValue) for vertex in simplex[1:] for value, bestValue in zip(vertex, best)] + [0.0])
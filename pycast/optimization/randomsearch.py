@@ -0,0 +1,174 @@
+# !/usr/bin/env python
+#  -*- coding: UTF-8 -*-
+
+# Copyright (c) 2012-2015 Christian Schwarz
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+import random
+import time
+
+from pycast.optimization.baseoptimizationmethod import BaseOptimizationMethod
+
+## Methods that can be used to draw the parameter values of a RandomSearch
+RandomSearchSamplings = ("uniform", "latinhypercube")
+
+class RandomSearch(BaseOptimizationMethod):
+
+    """Implements the random search method for parameter optimization.
+
+    The parameter values are drawn from the parameter intervals instead of being enumerated on a grid.
+    Latin hypercube sampling spreads the values of each parameter evenly over its interval.
+    """
+
+    def __init__(self, errorMeasureClass, errorMeasureInitializationParameters=None, precision=-1, resultCache=None,
+                 numberOfSamples=100, sampling="uniform", seed=None, timeLimit=None):
+        """Initializes the RandomSearch.
+
+        :param BaseErrorMeasure errorMeasureClass:    Error measure class from :py:mod:`pycast.errors`.
+        :param dictionary errorMeasureInitializationParameters:    Parameters used to initialize
+            the errorMeasureClass. This dictionary will be passed to the errorMeasureClass as \\*\\*kwargs.
+        :param integer precision:    Defines the accuracy for parameter tuning in 10^precision.
+            This parameter has to be an integer in [-7, 0]. The drawn values are rounded to this accuracy.
+        :param ResultCache resultCache:    Optional :py:class:`pycast.common.resultcache.ResultCache`
+            used for all forecasts calculated during the optimization.
+        :param integer numberOfSamples:    Number of parameter combinations evaluated per forecasting method.
+        :param string sampling:    Defines how the parameter values are drawn. Valid values are "uniform"
+            and "latinhypercube".
+        :param integer seed:    Seed of the random number generator. Each forecasting method is optimized
+            using the same sequence of random numbers, so the results are reproducible.
+            :py:const:`None` uses a different sequence for each optimization.
+        :param float timeLimit:    Maximal duration of :py:meth:`RandomSearch.optimize` in seconds.
+            When the time limit is reached, the remaining samples are skipped. At least one sample is
+            evaluated for each forecasting method. :py:const:`None` disables the time limit.
+
+        :raise:    Raises a :py:exc:`ValueError` if numberOfSamples is smaller than one, the sampling is
+            unknown or the timeLimit is not larger than zero.
+        """
+        if numberOfSamples < 1:
+            raise ValueError("numberOfSamples has to be larger than zero.")
+        if sampling not in RandomSearchSamplings:
+            raise ValueError("sampling has to be one of %s." % ", ".join(RandomSearchSamplings))
+        if timeLimit is not None and timeLimit <= 0:
+            raise ValueError("timeLimit has to be larger than zero.")
+
+        super(RandomSearch, self).__init__(errorMeasureClass, errorMeasureInitializationParameters, precision, resultCache)
+
+        self._numberOfSamples = numberOfSamples
+        self._sampling        = sampling
+        self._seed            = seed
+        self._timeLimit       = timeLimit
+        self._deadline        = None
+
+    def optimize(self, timeSeries, forecastingMethods=None, startingPercentage=0.0, endPercentage=100.0):
+        """Runs the optimization of the given TimeSeries.
+
+        :param TimeSeries timeSeries:    TimeSeries instance that requires an optimized forecast.
+        :param list forecastingMethods:    List of forecastingMethods that will be used for optimization.
+        :param float startingPercentage: Defines the start of the interval. This has to be a value in [0.0, 100.0].
+            It represents the value, where the error calculation should be started.
+            25.0 for example means that the first 25% of all calculated errors will be ignored.
+        :param float endPercentage:    Defines the end of the interval. This has to be a value in [0.0, 100.0].
+            It represents the value, after which all error values will be ignored. 90.0 for example means that
+            the last 10% of all local errors will be ignored.
+
+        :return:    Returns the optimized forecasting method, the corresponding error measure and the forecasting methods
+            parameters.
+        :rtype:     [BaseForecastingMethod, BaseErrorMeasure, Dictionary]
+
+        :raise:    Raises a :py:exc:`ValueError` ValueError if no forecastingMethods is empty.
+        """
+        if forecastingMethods is None or len(forecastingMethods) == 0:
+            raise ValueError("forecastingMethods cannot be empty.")
+
+        self._startingPercentage = startingPercentage
+        self._endPercentage      = endPercentage
+
+        self._deadline = None
+        if self._timeLimit is not None:
+            self._deadline = time.time() + self._timeLimit
+
+        try:
+            return self._select_best_forecasting_method(timeSeries, forecastingMethods)
+        finally:
+            self._deadline = None
+
+    def _generate_samples(self, bounds, randomGenerator):
+        """Generator for the parameter combinations evaluated by the RandomSearch.
+
+        :param list bounds:    Lists containing the smallest and largest valid value of each parameter.
+        :param Random randomGenerator:    Random number generator used to draw the values.
+
+        :return:    Creates a generator used to iterate over lists containing one value per parameter.
+        :rtype:     generator
+        """
+        if "uniform" == self._sampling:
+            for sample in xrange(self._numberOfSamples):
+                yield [randomGenerator.uniform(lowerBound, upperBound) for lowerBound, upperBound in bounds]
+            return
+
+        # each parameter interval is divided into numberOfSamples strata and each stratum is used once
+        strata = []
+        for parameter in bounds:
+            parameterStrata = range(self._numberOfSamples)
+            randomGenerator.shuffle(parameterStrata)
+            strata.append(parameterStrata)
+
+        for sample in xrange(self._numberOfSamples):
+            values = []
+            for (lowerBound, upperBound), parameterStrata in zip(bounds, strata):
+                position = (parameterStrata[sample] + randomGenerator.random()) / self._numberOfSamples
+                values.append(lowerBound + position * (upperBound - lowerBound))
+
+            yield values
+
+    def optimize_forecasting_method(self, timeSeries, forecastingMethod):
+        """Optimizes the parameters for the given timeSeries and forecastingMethod.
+
+        :param TimeSeries timeSeries:    TimeSeries instance, containing hte original data.
+        :param BaseForecastingMethod forecastingMethod:    ForecastingMethod that is used to optimize the parameters.
+
+        :return: Returns a list containing the smallest BaseErrorMeasure instance as defined in
+            :py:meth:`BaseOptimizationMethod.__init__` and the forecastingMethods parameter.
+        :rtype: list
+
+        :raise:    Raises a :py:exc:`ValueError` if no error could be calculated.
+        """
+        parameters = forecastingMethod.get_optimizable_parameters()
+        bounds     = [self._get_parameter_bounds(parameter, forecastingMethod) for parameter in parameters]
+        objective  = self._create_objective(timeSeries, forecastingMethod, parameters)
+
+        bestError  = None
+        bestValues = None
+        for values in self._generate_samples(bounds, random.Random(self._seed)):
+            error = objective(values)
+
+            if bestValues is None or error[0] < bestError[0]:
+                bestError  = error
+                bestValues = values
+
+            if self._deadline is not None and time.time() >= self._deadline:
+                break
+
+        if bestError[1] is None:
+            raise ValueError("The error could not be calculated for any parameter combination.")
+
+        return [bestError[1], dict(zip(parameters, [round(value, -self._precison) for value in bestValues]))]
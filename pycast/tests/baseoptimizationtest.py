@@ -29,6 +29,7 @@ from pycast.optimization.baseoptimizationmethod import BaseOptimizationMethod
 from pycast.methods.basemethod import BaseMethod
 from pycast.errors.baseerrormeasure import BaseErrorMeasure
 from pycast.common.timeseries import TimeSeries
+from pycast.methods.exponentialsmoothing import ExponentialSmoothing
 
 class BaseOptimizationMethodTest(unittest.TestCase):
 
@@ -79,3 +80,21 @@ class BaseOptimizationMethodTest(unittest.TestCase):
             pass
         else:
             assert False    # pragma: no cover
+
+    def parameter_bounds_test(self):
+        """Test the bounds of the parameters used by the continuous optimization methods."""
+        fm = ExponentialSmoothing()
+
+        assert [0.001, 0.999] == BaseOptimizationMethod(BaseErrorMeasure, precision=-3)._get_parameter_bounds("smoothingFactor", fm)
+
+        fm._parameterIntervals["smoothingFactor"] = [0.0, 1.0, True, True]
+        assert [0.0, 1.0] == BaseOptimizationMethod(BaseErrorMeasure, precision=0)._get_parameter_bounds("smoothingFactor", fm)
+
+        # the open interval (0.0, 1.0) does not contain an integer
+        fm._parameterIntervals["smoothingFactor"] = [0.0, 1.0, False, False]
+        try:
+            BaseOptimizationMethod(BaseErrorMeasure, precision=0)._get_parameter_bounds("smoothingFactor", fm)
+        except ValueError:
+            pass
+        else:
+            assert False    # pragma: no cover
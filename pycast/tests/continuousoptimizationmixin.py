@@ -0,0 +1,132 @@
+# !/usr/bin/env python
+#  -*- coding: UTF-8 -*-
+
+# Copyright (c) 2012-2015 Christian Schwarz
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+# required external modules
+import unittest
+
+# required modules from pycast
+from pycast.errors.symmetricmeanabsolutepercentageerror import SymmetricMeanAbsolutePercentageError as SMAPE
+from pycast.common.timeseries import TimeSeries
+from pycast.methods.basemethod import BaseForecastingMethod
+from pycast.methods.exponentialsmoothing import ExponentialSmoothing, HoltMethod
+from pycast.optimization.gridsearch import GridSearch
+
+def create_forecasting_method():
+    """Returns a forecasting method with the parameters a in [0.0, 1.0) and b in (1.0, 2.0]."""
+    bfm = BaseForecastingMethod(["a", "b"])
+    bfm._parameterIntervals = {}
+    bfm._parameterIntervals["a"] = [0.0, 1.0, True, False]
+    bfm._parameterIntervals["b"] = [1.0, 2.0, False, True]
+
+    return bfm
+
+def create_quadratic_objective(optimizer, minimum):
+    """Replaces the objective of the optimizer by a quadratic function.
+
+    :param BaseOptimizationMethod optimizer:    Optimization method whose objective is replaced.
+    :param list minimum:    Location of the minimum of the quadratic function.
+
+    :return:    Returns a list containing all points the objective was evaluated for.
+    :rtype: list
+    """
+    evaluatedPoints = []
+
+    def create_objective(timeSeries, forecastingMethod, parameters):
+        def objective(values):
+            evaluatedPoints.append(list(values))
+            return sum((value - center)**2 for value, center in zip(values, minimum)), "error"
+
+        return objective
+
+    optimizer._create_objective = create_objective
+    return evaluatedPoints
+
+class ContinuousOptimizationMixin(object):
+
+    """Tests shared by all continuous optimization methods.
+
+    The test classes have to set optimizationClass.
+    """
+
+    optimizationClass = None
+
+    def setUp(self):
+        """Initializes self.timeSeries."""
+        data = [[0.0, 0.0], [1.1, 0.2], [2.2, 0.6], [3.3, 0.2], [4.4, 0.3], [5.5, 0.5]]
+        self.timeSeries = TimeSeries.from_twodim_list(data)
+        self.timeSeries.normalize("second")
+
+    def tearDown(self):
+        """Deletes the TimeSeries of the test."""
+        del self.timeSeries
+
+    def optimize_exception_test(self):
+        """Test the exceptions raised by optimize."""
+        try:
+            self.optimizationClass(SMAPE).optimize(self.timeSeries, [])
+        except ValueError:
+            pass
+        else:
+            assert False    # pragma: no cover
+
+        # the interval (0.0, 1.0) of the smoothingFactor does not contain an integer
+        try:
+            self.optimizationClass(SMAPE, precision=0).optimize(self.timeSeries, [ExponentialSmoothing()])
+        except ValueError:
+            pass
+        else:
+            assert False    # pragma: no cover
+
+    def optimization_result_test(self):
+        """Test that the optimization method is at least as good as the GridSearch."""
+        for forecastingMethod in (ExponentialSmoothing(), HoltMethod()):
+            gridResult = GridSearch(SMAPE, precision=-2).optimize(self.timeSeries, [forecastingMethod])
+            result     = self.optimizationClass(SMAPE, precision=-4).optimize(self.timeSeries, [forecastingMethod])
+
+            assert result[0] is forecastingMethod
+            assert result[1].get_error() <= gridResult[1].get_error()
+            assert sorted(result[2]) == sorted(gridResult[2])
+
+            # the parameters are rounded to the precision and are within their intervals
+            for parameter, value in result[2].iteritems():
+                assert round(value, 4) == value
+                assert forecastingMethod._in_valid_interval(parameter, value)
+                assert forecastingMethod.get_parameter(parameter) == value
+
+    def optimization_method_selection_test(self):
+        """Test the selection of the best forecasting method."""
+        result = self.optimizationClass(SMAPE, precision=-3).optimize(self.timeSeries, [ExponentialSmoothing(), HoltMethod()])
+        assert isinstance(result[0], HoltMethod)
+
+    def quadratic_objective_test(self):
+        """Test the optimization method on a quadratic function."""
+        optimizer = self.optimizationClass(SMAPE, precision=-4)
+        evaluatedPoints = create_quadratic_objective(optimizer, [0.37, 1.62])
+
+        result = optimizer.optimize_forecasting_method(None, create_forecasting_method())
+        assert "error" == result[0]
+        assert abs(result[1]["a"] - 0.37) <= 0.0002
+        assert abs(result[1]["b"] - 1.62) <= 0.0002
+        assert len(evaluatedPoints) < 500
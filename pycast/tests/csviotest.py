@@ -0,0 +1,135 @@
+# !/usr/bin/env python
+#  -*- coding: UTF-8 -*-
+
+# Copyright (c) 2012-2015 Christian Schwarz
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+# required external modules
+import unittest
+import os
+import random
+
+# required modules from pycast
+from pycast.common.timeseries import TimeSeries, MultiDimensionalTimeSeries
+from pycast.common.csvio import read_csv, read_wide_csv, read_long_csv, write_csv, write_long_csv
+
+class CSVTest(unittest.TestCase):
+
+    """Test class for reading and writing CSV files."""
+
+    def tearDown(self):
+        """This function gets called after each test function."""
+        if os.path.isfile("temp_timeseries.csv"):
+            os.remove("temp_timeseries.csv")
+
+    def roundtrip_test(self):
+        """Test writing and reading a TimeSeries."""
+        data = [[float(idx) + random.random(), random.random() * 1000] for idx in xrange(20000)]
+        ts   = TimeSeries.from_twodim_list(data)
+
+        write_csv(ts, "temp_timeseries.csv", header=["timestamp", "value"])
+        with open("temp_timeseries.csv", "rb") as csvfile:
+            assert "timestamp,value" == csvfile.readline().strip()
+            assert 20000 == len(csvfile.readlines())
+
+        for storage in ("list", "column"):
+            tsRead = read_csv("temp_timeseries.csv", skipHeader=True, storage=storage, chunkSize=333)
+            assert tsRead.to_twodim_list() == data
+
+        # TSV files
+        write_csv(ts, "temp_timeseries.csv", delimiter="\t")
+        assert ts == read_csv("temp_timeseries.csv", delimiter="\t")
+
+    def column_selection_test(self):
+        """Test reading selected columns of a CSV file."""
+        with open("temp_timeseries.csv", "wb") as csvfile:
+            csvfile.write("junk;value;timestamp;other\n")
+            csvfile.write("a;1.5;2013-03-01 12:00:01;3\n")
+            csvfile.write("b;2.5;2013-03-01 12:00:00;4\n")
+
+        tsformat = "%Y-%m-%d %H:%M:%S"
+        ts = read_csv("temp_timeseries.csv", timestampColumn=2, valueColumns=[1], delimiter=";", skipHeader=True, tsformat=tsformat)
+        assert ts.to_twodim_list() == [["2013-03-01 12:00:00", 2.5], ["2013-03-01 12:00:01", 1.5]]
+
+        ts = read_csv("temp_timeseries.csv", timestampColumn=2, valueColumns=[1, 3], delimiter=";", skipHeader=True, tsformat=tsformat)
+        assert isinstance(ts, MultiDimensionalTimeSeries)
+        assert ts.to_twodim_list() == [["2013-03-01 12:00:00", [2.5, 4.0]], ["2013-03-01 12:00:01", [1.5, 3.0]]]
+
+        # formatted timestamps are written in the same format
+        write_csv(ts, "temp_timeseries.csv", tsformat=tsformat)
+        with open("temp_timeseries.csv", "rb") as csvfile:
+            assert csvfile.readline() == "2013-03-01 12:00:00,2.5,4.0\n"
+
+        # the timestamps are truncated to seconds, like by TimeSeries.convert_epoch_to_timestamp
+        ts = TimeSeries.from_twodim_list([[0.0, 1.0], [0.5, 2.0], [1.75, 3.0]])
+        write_csv(ts, "temp_timeseries.csv", tsformat=tsformat)
+        with open("temp_timeseries.csv", "rb") as csvfile:
+            assert csvfile.read() == "".join(["%s,%r\n" % (TimeSeries.convert_epoch_to_timestamp(timestamp, tsformat), value) for timestamp, value in ts])
+
+        try:
+            read_csv("temp_timeseries.csv", valueColumns=[1], tsformat=None)
+        except ValueError:
+            pass
+        else:
+            assert False    # pragma: no cover
+
+    def wide_file_test(self):
+        """Test reading CSV files containing one time series per row."""
+        with open("temp_timeseries.csv", "wb") as csvfile:
+            csvfile.write("Series,N Obs,1,2,3,4\n")
+            csvfile.write("N1  ,4,1.0,2.0,3.0,4.0\n")
+            csvfile.write("N2  ,2,5.0,6.0,,\n")
+            csvfile.write("N3  ,3,7.0,,8.0,9.0\n")
+
+        series = read_wide_csv("temp_timeseries.csv", firstValueColumn=2, chunkSize=2)
+        assert series.keys() == ["N1", "N2", "N3"]
+        assert series["N1"].to_twodim_list() == [[0.0, 1.0], [1.0, 2.0], [2.0, 3.0], [3.0, 4.0]]
+        assert series["N2"].to_twodim_list() == [[0.0, 5.0], [1.0, 6.0]]
+        assert series["N3"].to_twodim_list() == [[0.0, 7.0], [2.0, 8.0], [3.0, 9.0]]
+        assert series["N1"].is_normalized()
+        assert not series["N3"].is_normalized()
+
+        series = read_wide_csv("temp_timeseries.csv", firstValueColumn=2, start=10.0, step=0.5, storage="implicit")
+        assert series["N1"].to_twodim_list() == [[10.0, 1.0], [10.5, 2.0], [11.0, 3.0], [11.5, 4.0]]
+
+    def long_file_test(self):
+        """Test reading and writing CSV files containing one data point of one time series per row."""
+        series = {
+            "a": TimeSeries.from_twodim_list([[0.0, 0.0], [1.0, 0.1], [2.0, 0.2]]),
+            "%b": TimeSeries.from_twodim_list([[5.0, 1.0]])
+        }
+
+        write_long_csv(series, "temp_timeseries.csv", header=["id", "time", "value"])
+        seriesRead = read_long_csv("temp_timeseries.csv", skipHeader=True, chunkSize=2)
+
+        assert sorted(seriesRead.keys()) == ["%b", "a"]
+        for seriesId, ts in series.iteritems():
+            assert ts == seriesRead[seriesId]
+
+        # data points of different series can be mixed
+        with open("temp_timeseries.csv", "wb") as csvfile:
+            csvfile.write("a,2.0,0.2\nb,0.0,1.0\na,0.0,0.0\na,1.0,0.1\n")
+
+        seriesRead = read_long_csv("temp_timeseries.csv", chunkSize=3)
+        assert seriesRead.keys() == ["a", "b"]
+        assert seriesRead["a"] == series["a"]
+        assert seriesRead["b"].to_twodim_list() == [[0.0, 1.0]]
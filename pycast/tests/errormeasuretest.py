@@ -199,6 +199,10 @@ class BaseErrorMeasureTest(unittest.TestCase):
         self.assertEquals(bem._get_error_values(0,100, None, 4), [1,-1,3,-5])
         self.assertEquals(bem._get_error_values(0,100, 2, 4), [-1,3,-5])
         self.assertRaises(ValueError, bem._get_error_values, 0, 100, None, 0)
+        self.assertRaises(ValueError, bem._get_error_values, 0, 100, 6, None)
+
+        bem._errorDates = [1,2,2,4,5]
+        self.assertEquals(bem._get_error_values(0,100, 2, 2), [-1,3])
 
     def number_of_comparisons_test(self):
         """ Test BaseErrorMeasure.initialize for behaviour if not enough dates match."""
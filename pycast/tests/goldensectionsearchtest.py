@@ -0,0 +1,82 @@
+# !/usr/bin/env python
+#  -*- coding: UTF-8 -*-
+
+# Copyright (c) 2012-2015 Christian Schwarz
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+# required external modules
+import unittest
+
+# required modules from pycast
+from pycast.errors.symmetricmeanabsolutepercentageerror import SymmetricMeanAbsolutePercentageError as SMAPE
+from pycast.optimization.goldensectionsearch import GoldenSectionSearch
+from pycast.tests.continuousoptimizationmixin import ContinuousOptimizationMixin, create_forecasting_method, create_quadratic_objective
+
+class GoldenSectionSearchTest(ContinuousOptimizationMixin, unittest.TestCase):
+
+    """Test class for the GoldenSectionSearch optimization method."""
+
+    optimizationClass = GoldenSectionSearch
+
+    def initialization_exception_test(self):
+        """Test the parameter validation of the initialization."""
+        try:
+            GoldenSectionSearch(SMAPE, maximalCycles=0)
+        except ValueError:
+            pass
+        else:
+            assert False    # pragma: no cover
+
+    def line_search_test(self):
+        """Test the line search on a unimodal function."""
+        goldenSectionSearch = GoldenSectionSearch(SMAPE, precision=-5)
+        objective = lambda values: ((values[0] - 0.4321)**2 + values[1], None)
+
+        point = [0.9, 3.0]
+        value = goldenSectionSearch._line_search(objective, point, 0, 0.0, 1.0)
+
+        assert abs(value - 0.4321) < 0.00001
+        assert [0.9, 3.0] == point
+
+    def line_search_boundary_test(self):
+        """Test the line search for minima located on the interval boundaries."""
+        goldenSectionSearch = GoldenSectionSearch(SMAPE, precision=-3)
+
+        assert 2.0 == goldenSectionSearch._line_search(lambda values: (-values[0], None), [1.5], 0, 1.0, 2.0)
+        assert 1.0 == goldenSectionSearch._line_search(lambda values: (values[0], None), [1.5], 0, 1.0, 2.0)
+
+        # the current value is kept, if no other value is better
+        assert 1.5 == goldenSectionSearch._line_search(lambda values: (0.0, None), [1.5], 0, 1.0, 2.0)
+
+    def cycles_test(self):
+        """Test that the parameters are searched in cycles until the error does not improve anymore."""
+        evaluations = []
+        for maximalCycles in (1, 10):
+            goldenSectionSearch = GoldenSectionSearch(SMAPE, precision=-2, maximalCycles=maximalCycles)
+            evaluatedPoints = create_quadratic_objective(goldenSectionSearch, [0.37, 1.62])
+
+            goldenSectionSearch.optimize_forecasting_method(None, create_forecasting_method())
+            # the starting point and the result are evaluated once
+            evaluations.append(len(evaluatedPoints) - 2)
+
+        # the second cycle does not improve the separable function, so the search stops
+        assert 2 * evaluations[0] == evaluations[1]
@@ -233,3 +233,166 @@ class GridSearchTest(unittest.TestCase):
 
         result = gridSearch.optimization_loop(self.timeSeries, self.bfm, [], {})
         assert result == []
+
+    def executor_exception_test(self):
+        """Test the validation of the executor parameters."""
+        for kwargs in ({"executor": "cluster"}, {"executor": "process", "workers": 0}):
+            try:
+                GridSearch(SMAPE, **kwargs)
+            except ValueError:
+                pass
+            else:
+                assert False    # pragma: no cover
+
+    def create_tasks_test(self):
+        """Test the partitioning of the grid."""
+        gridSearch = GridSearch(SMAPE, executor="thread")
+        remainingParameters = [["a", [1, 2, 3]], ["b", [4, 5]]]
+
+        tasks = gridSearch._create_tasks(remainingParameters, 1)
+        assert tasks == [({}, remainingParameters)]
+
+        tasks = gridSearch._create_tasks(remainingParameters, 2)
+        assert tasks == [({"b": 4}, [["a", [1, 2, 3]]]), ({"b": 5}, [["a", [1, 2, 3]]])]
+
+        tasks = gridSearch._create_tasks(remainingParameters, 3)
+        assert 6 == len(tasks)
+        assert [task[0] for task in tasks] == [{"a": a, "b": b} for b in (4, 5) for a in (1, 2, 3)]
+        assert tasks == gridSearch._create_tasks(remainingParameters, 100)
+
+    def parallel_optimization_test(self):
+        """Test that all executors find the same parameters."""
+        self.timeSeries.normalize("second")
+
+        for forecastingMethod in (ExponentialSmoothing(), HoltMethod()):
+            results = []
+            for executor in ("serial", "thread", "process"):
+                gridSearch = GridSearch(SMAPE, precision=-1, executor=executor, workers=3)
+                result     = gridSearch.optimize(self.timeSeries, [forecastingMethod])
+
+                results.append((result[1].get_error(), result[2]))
+
+            assert results[0] == results[1] == results[2]
+
+    def enumerate_parameter_values_test(self):
+        """Test the order of the enumerated parameter combinations."""
+        gridSearch = GridSearch(SMAPE)
+        combinations = gridSearch._enumerate_parameter_values([["a", [1, 2]], ["b", [3, 4, 5]]], {"c": 0})
+
+        assert list(combinations) == [{"a": a, "b": b, "c": 0} for b in (3, 4, 5) for a in (1, 2)]
+        assert list(gridSearch._enumerate_parameter_values([], {})) == [{}]
+
+    def best_results_test(self):
+        """Test that the optimization loop only keeps the best results."""
+        self.timeSeries.normalize("second")
+        fm = HoltMethod()
+        gridSearch = GridSearch(SMAPE, precision=-1)
+        remainingParameters = [["smoothingFactor", [0.2, 0.4, 0.6]], ["trendSmoothingFactor", [0.1, 0.5]]]
+
+        # evaluate each combination on its own
+        results = []
+        for parameterValues in gridSearch._enumerate_parameter_values(remainingParameters, {}):
+            result = gridSearch.optimization_loop(self.timeSeries, fm, [], parameterValues)
+            assert 1 == len(result)
+            results.append(result[0])
+
+        results.sort(key=lambda item: item[0].get_error())
+
+        bestResults = gridSearch.optimization_loop(self.timeSeries, fm, remainingParameters, numberOfResults=4)
+        assert [item[1] for item in bestResults] == [item[1] for item in results[:4]]
+
+        allResults = gridSearch.optimization_loop(self.timeSeries, fm, remainingParameters, numberOfResults=10)
+        assert [item[1] for item in allResults] == [item[1] for item in results]
+
+    def coarse_to_fine_exception_test(self):
+        """Test the validation of the coarse-to-fine parameters."""
+        for kwargs in ({"precision": -2, "coarsePrecision": -3}, {"coarsePrecision": 1}, {"numberOfRefinedResults": 0}):
+            try:
+                GridSearch(SMAPE, **kwargs)
+            except ValueError:
+                pass
+            else:
+                assert False    # pragma: no cover
+
+    def neighbouring_parameter_values_test(self):
+        """Test the values evaluated around a previous result."""
+        gridSearch = GridSearch(SMAPE, precision=-2)
+        values = gridSearch._generate_neighbouring_parameter_values("smoothingFactor", ExponentialSmoothing(), 0.30000000000000004, -2)
+
+        assert 21 == len(values)
+        assert 0.2 == values[0] and 0.3 == values[10] and 0.4 == values[-1]
+
+        # the values are limited to the parameters interval
+        values = gridSearch._generate_neighbouring_parameter_values("smoothingFactor", ExponentialSmoothing(), 0.9, -2)
+        assert [round(0.8 + item / 100.0, 2) for item in xrange(20)] == values
+
+    def coarse_to_fine_optimization_test(self):
+        """Test that the coarse-to-fine search finds the optimum of the full grid."""
+        self.timeSeries.normalize("second")
+
+        for forecastingMethod in (ExponentialSmoothing(), HoltMethod()):
+            fullResult = GridSearch(SMAPE, precision=-2).optimize(self.timeSeries, [forecastingMethod])
+
+            for executor in ("serial", "thread"):
+                gridSearch = GridSearch(SMAPE, precision=-2, coarsePrecision=-1, executor=executor, workers=2)
+                result     = gridSearch.optimize(self.timeSeries, [forecastingMethod])
+
+                assert round(fullResult[1].get_error(), 10) == round(result[1].get_error(), 10)
+                for parameter in fullResult[2]:
+                    assert round(fullResult[2][parameter], 2) == result[2][parameter]
+
+    def coarse_to_fine_open_interval_test(self):
+        """Test that the coarse-to-fine search starts at the center of intervals without a coarse value."""
+        self.timeSeries.normalize("second")
+
+        fullResult = GridSearch(SMAPE, precision=-1).optimize(self.timeSeries, [ExponentialSmoothing()])
+        result     = GridSearch(SMAPE, precision=-1, coarsePrecision=0).optimize(self.timeSeries, [ExponentialSmoothing()])
+
+        assert round(fullResult[1].get_error(), 10) == round(result[1].get_error(), 10)
+        assert fullResult[2] == result[2]
+
+        result = GridSearch(SMAPE, precision=-1, coarsePrecision=0).optimize(self.timeSeries, [HoltMethod()])
+        assert 0.0 < result[2]["smoothingFactor"] < 1.0
+        assert 0.0 < result[2]["trendSmoothingFactor"] < 1.0
+
+    def coarse_to_fine_evaluation_count_test(self):
+        """Test that each parameter combination of the coarse-to-fine search is evaluated once."""
+        self.timeSeries.normalize("second")
+
+        results = []
+        for executor in ("serial", "thread"):
+            gridSearch = GridSearch(SMAPE, precision=-3, coarsePrecision=-1, numberOfRefinedResults=3, executor=executor, workers=2)
+
+            evaluatedParameters = []
+            evaluate_parameter_values = gridSearch._evaluate_parameter_values
+
+            def counting_evaluate_parameter_values(timeSeries, forecastingMethod, parameterValues):
+                evaluatedParameters.append(gridSearch._get_parameter_key(parameterValues))
+                return evaluate_parameter_values(timeSeries, forecastingMethod, parameterValues)
+
+            gridSearch._evaluate_parameter_values = counting_evaluate_parameter_values
+            result = gridSearch.optimize(self.timeSeries, [HoltMethod()])
+
+            # the coarse grid and the overlapping neighbourhoods of both refinement steps share combinations
+            assert len(evaluatedParameters) == len(set(evaluatedParameters))
+            assert 81 < len(evaluatedParameters) < 81 + 2 * 3 * 21 * 21
+            results.append((sorted(evaluatedParameters), result[1].get_error(), result[2]))
+
+        assert results[0] == results[1]
+
+    def worker_pool_test(self):
+        """Test that one pool of workers evaluates all grids of a forecasting method."""
+        self.timeSeries.normalize("second")
+        gridSearch = GridSearch(SMAPE, precision=-2, coarsePrecision=-1, executor="thread", workers=2)
+
+        pools = []
+        create_pool = gridSearch._create_pool
+
+        def counting_create_pool(timeSeries, forecastingMethod):
+            pools.append(create_pool(timeSeries, forecastingMethod))
+            return pools[-1]
+
+        gridSearch._create_pool = counting_create_pool
+        gridSearch.optimize(self.timeSeries, [ExponentialSmoothing(), HoltMethod()])
+
+        assert 2 == len(pools)
@@ -25,7 +25,7 @@
 import unittest
 import json
 
-from pycast.common.timeseries import TimeSeries
+from pycast.common.timeseries import TimeSeries, MultiDimensionalTimeSeries
 from pycast.common.json_encoder import PycastEncoder
 
 class PycastEncoderTest(unittest.TestCase):
@@ -47,3 +47,46 @@ class PycastEncoderTest(unittest.TestCase):
 		normal_encode = json.dumps(obj)
 		our_encode = json.dumps(obj, cls=PycastEncoder)
 		assert normal_encode == our_encode
+
+	def encode_nested_timeseries_test(self):
+		"""Test if time series within other objects are encoded chunk by chunk"""
+		data = [[float(idx), idx * 0.5] for idx in xrange(100)]
+		ts = TimeSeries.from_twodim_list(data)
+		ts.set_timeformat("%H:%M:%S")
+		obj = {"original": ts, "other": [ts, 1.5, "text"]}
+
+		chunks = list(PycastEncoder(chunkSize=7).iterencode(obj))
+		assert len(chunks) > 2 * (100 // 7)
+		assert "".join(chunks) == json.dumps({"original": ts.to_twodim_list(), "other": [ts.to_twodim_list(), 1.5, "text"]})
+		assert json.dumps(obj, cls=PycastEncoder, separators=(",", ":")) == json.dumps(json.loads("".join(chunks)), separators=(",", ":"))
+
+		mts = MultiDimensionalTimeSeries.from_twodim_list([[0.0, [1.0, 2.0]], [1.0, [3.0, 4.0]]], dimensions=2)
+		assert json.dumps(mts, cls=PycastEncoder) == json.dumps(mts.to_twodim_list())
+		mts.set_timeformat("%H:%M:%S")
+		assert json.dumps(mts, cls=PycastEncoder) == json.dumps(mts.to_twodim_list())
+
+	def encode_columnar_test(self):
+		"""Test the columnar encoding of time series"""
+		ts = TimeSeries.from_twodim_list([[10.0, 1.0], [12.5, 2.0], [15.0, 3.0]])
+		assert json.dumps(ts, cls=PycastEncoder, columnar=True) == '{"t0": 10.0, "step": 2.5, "values": [1.0, 2.0, 3.0]}'
+
+		ts.add_entry(16.0, 4.0)
+		assert json.dumps(ts, cls=PycastEncoder, columnar=True, chunkSize=3) == '{"timestamps": [10.0, 12.5, 15.0, 16.0], "values": [1.0, 2.0, 3.0, 4.0]}'
+
+		mts = MultiDimensionalTimeSeries.from_twodim_list([[0.0, [1.0, 2.0]], [1.0, [3.0, 4.0]]], dimensions=2)
+		assert json.dumps(mts, cls=PycastEncoder, columnar=True) == '{"t0": 0.0, "step": 1.0, "values": [[1.0, 3.0], [2.0, 4.0]]}'
+
+		assert json.dumps(TimeSeries(), cls=PycastEncoder, columnar=True) == '{"timestamps": [], "values": []}'
+
+	def encode_special_floats_test(self):
+		"""Test if NaN and infinite values are encoded like the default encoder does"""
+		data = [[0.0, float("nan")], [1.0, float("inf")], [2.0, -float("inf")]]
+		ts = TimeSeries.from_twodim_list(data)
+		assert json.dumps(ts, cls=PycastEncoder) == json.dumps(data)
+
+		try:
+			json.dumps(ts, cls=PycastEncoder, allow_nan=False)
+		except ValueError:
+			pass
+		else:
+			assert False    # pragma: no cover
@@ -24,6 +24,7 @@
 
 import unittest
 import random
+import pickle
 from copy import copy
 
 from pycast.common.matrix import Matrix
@@ -439,6 +440,35 @@ class MatrixTest(unittest.TestCase):
         self.assertNotEqual(mtrx.get_value(2, 0), cp.get_value(2, 0))
         self.assertTrue(cp.optimizationEnabled)
 
+    def pickle_test(self):
+        """Test to pickle the Matrix."""
+        # Initialize Test Objects
+        data = [
+                    [1.5, 2.0, 3.0],
+                    [4.0, 5.0, 6.0]
+                ]
+        mtrx = Matrix(3, 2)
+        mtrx.initialize(data, rowBased=True)
+        mtrx.set_string_precision(5)
+        mtrx.optimizationEnabled = True
+        vec  = Vector(4)
+        vec.set_value(0, 3, 2.5)
+
+        for protocol in xrange(pickle.HIGHEST_PROTOCOL + 1):
+            cp = pickle.loads(pickle.dumps(mtrx, protocol))
+            self.assertEqual(cp, mtrx)
+            self.assertEqual(cp.get_array(rowBased=True), data)
+            self.assertEqual(cp._stringPrecision, 5)
+            self.assertTrue(cp.optimizationEnabled)
+
+            cp = pickle.loads(pickle.dumps(vec, protocol))
+            self.assertTrue(isinstance(cp, Vector))
+            self.assertEqual(cp, vec)
+
+        # non numeric values are pickled as they are
+        mtrx.set_value(0, 0, "text")
+        self.assertEqual(pickle.loads(pickle.dumps(mtrx)).get_value(0, 0), "text")
+
     def invers_test(self):
         """Test the calculation of the inverse."""
         size = 2
@@ -1185,3 +1215,17 @@ class MatrixHelperTest(unittest.TestCase):
         b = 3
         res = sign(a, b)
         self.assertEqual(res, 2)
+
+    def pickle_integer_test(self):
+        """Test that pickling keeps the type and value of non float values."""
+        data = [
+                    [1, 2, 10**17 + 1],
+                    [4, 5.5, 6]
+                ]
+        mtrx = Matrix(3, 2)
+        mtrx.initialize(data, rowBased=True)
+
+        for protocol in xrange(pickle.HIGHEST_PROTOCOL + 1):
+            cp = pickle.loads(pickle.dumps(mtrx, protocol))
+            self.assertEqual(cp.get_array(rowBased=True), data)
+            self.assertEqual([type(value) for value in cp.get_array(rowBased=True)[0]], [int, int, int])
@@ -26,7 +26,7 @@
 # SQLite is used for connector tests
 
 # required external modules
-import unittest, os
+import unittest, os, pickle
 from copy import copy
 
 from pycast.common.timeseries import MultiDimensionalTimeSeries
@@ -106,6 +106,64 @@ class MultiDimensionalTimeSeriesTest(unittest.TestCase):
         assert tsOne == tsThree
         assert tsTwo == tsThree
 
+    def from_arrays_test(self):
+        """Test the bulk initialization of a MultiDimensionalTimeSeries."""
+        data = [[0.0, [0.0, 0.42]], [0.1, [0.1, 0.42]], [0.2, [0.2, 0.42]]]
+
+        for storage in ("list", "column"):
+            ts = MultiDimensionalTimeSeries.from_arrays([0.2, 0.0, 0.1], [[0.2, 0.0, 0.1], [0.42, 0.42, 0.42]], storage=storage)
+
+            assert ts.dimension_count() == 2
+            assert ts.is_sorted()
+            assert ts == MultiDimensionalTimeSeries.from_twodim_list(data, dimensions=2)
+
+        try:
+            MultiDimensionalTimeSeries.from_arrays([0.0, 0.1], [])
+        except ValueError:
+            pass
+        else:
+            assert False    # pragma: no cover
+
+        try:
+            MultiDimensionalTimeSeries.from_arrays([0.0, 0.1], [[1.0, 2.0], [3.0]])
+        except ValueError:
+            pass
+        else:
+            assert False    # pragma: no cover
+
+    def from_json_test(self):
+        """Test the initialization of a MultiDimensionalTimeSeries from its JSON representation."""
+        data = [[0.0, [0.0, 0.42]], [0.1, [0.1, 0.42]]]
+
+        tsOne   = MultiDimensionalTimeSeries.from_json("[[0.1, [0.1, 0.42]], [0.0, [0.0, 0.42]]]", dimensions=2)
+        tsTwo   = MultiDimensionalTimeSeries.from_json("[[0.1, 0.1, 0.42], [0.0, 0.0, 0.42]]", dimensions=2)
+        tsThree = MultiDimensionalTimeSeries.from_json('{"t0": 0.0, "step": 0.1, "values": [[0.0, 0.1], [0.42, 0.42]]}', dimensions=2)
+
+        for ts in (tsOne, tsTwo, tsThree):
+            assert ts == MultiDimensionalTimeSeries.from_twodim_list(data, dimensions=2)
+
+        tsFour = MultiDimensionalTimeSeries.from_json('{"timestamps": [0.0, 0.1], "values": [0.0, 0.1]}')
+        assert tsFour == MultiDimensionalTimeSeries.from_twodim_list([[0.0, [0.0]], [0.1, [0.1]]])
+
+        try:
+            MultiDimensionalTimeSeries.from_json('{"timestamps": [0.0], "values": [[0.0], [1.0]]}', dimensions=3)
+        except ValueError:
+            pass
+        else:
+            assert False    # pragma: no cover
+
+    def pickle_test(self):
+        """Test pickling a MultiDimensionalTimeSeries."""
+        data = [[0.0, [0.0, 0.42]], [0.1, [0.1, 0.42]], [0.2, [0.2, 0.42]]]
+
+        for storage in ("list", "column"):
+            ts = MultiDimensionalTimeSeries.from_arrays([0.2, 0.0, 0.1], [[0.2, 0.0, 0.1], [0.42, 0.42, 0.42]], storage=storage)
+            tsCopy = pickle.loads(pickle.dumps(ts, pickle.HIGHEST_PROTOCOL))
+
+            assert tsCopy.dimension_count() == 2
+            assert tsCopy.is_sorted()
+            assert tsCopy == MultiDimensionalTimeSeries.from_twodim_list(data, dimensions=2)
+
     def equal_test(self):
         """Test the == operator for TimeSeries instances."""
         data  = [[0.0, [0.0]], [0.1, [0.1]], [0.2, [0.2]], [0.3, [0.3]], [0.4, [0.4]], [0.5, [0.5]]]
@@ -149,6 +207,7 @@ class MultiDimensionalTimeSeriesTest(unittest.TestCase):
         tsFive = MultiDimensionalTimeSeries.from_twodim_list(data2Dim, dimensions=2)
 
         assert tsFour == tsThree
+        assert tsFive + tsFive == MultiDimensionalTimeSeries.from_twodim_list(data2Dim + data2Dim, dimensions=2)
         try:
             tsFive + tsOne
         except ValueError:
@@ -198,6 +257,14 @@ class MultiDimensionalTimeSeriesTest(unittest.TestCase):
 
         assert os.path.isfile("temp_plot.dat")
 
+        tsTwo = MultiDimensionalTimeSeries.from_twodim_list([[0.0, [0.1, 0.2]], [1.0, [1.1, 1.2]]], dimensions=2)
+        tsTwo.to_gnuplot_datafile("temp_plot.dat")
+
+        with open("temp_plot.dat", "rb") as datafile:
+            assert datafile.read() == "# time_as_<UNIX-epochs> value...\n0.0 0.1 0.2\n1.0 1.1 1.2\n"
+
+        os.remove("temp_plot.dat")
+
     def gnuplot_serialization_with_format_test(self):
         """Test serialization of timeSeries into gnuplot file."""
         data  = [[0.0, 0.0], [0.1, 0.1], [0.2, 0.2], [0.3, 0.3], [0.4, 0.4], [0.5, 0.5]]
@@ -0,0 +1,108 @@
+# !/usr/bin/env python
+#  -*- coding: UTF-8 -*-
+
+# Copyright (c) 2012-2015 Christian Schwarz
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+# required external modules
+import unittest
+
+# required modules from pycast
+from pycast.errors.symmetricmeanabsolutepercentageerror import SymmetricMeanAbsolutePercentageError as SMAPE
+from pycast.optimization.neldermead import NelderMead
+from pycast.tests.continuousoptimizationmixin import ContinuousOptimizationMixin, create_forecasting_method, create_quadratic_objective
+
+class NelderMeadTest(ContinuousOptimizationMixin, unittest.TestCase):
+
+    """Test class for the NelderMead optimization method."""
+
+    optimizationClass = NelderMead
+
+    def initialization_exception_test(self):
+        """Test the parameter validation of the initialization."""
+        try:
+            NelderMead(SMAPE, maximalIterations=0)
+        except ValueError:
+            pass
+        else:
+            assert False    # pragma: no cover
+
+    def move_test(self):
+        """Test the reflection, expansion and shrinkage of vertices."""
+        nelderMead = NelderMead(SMAPE)
+        bounds     = [[0.0, 1.0], [0.0, 1.0]]
+        centroid   = [0.5, 0.5]
+        vertex     = [0.75, 0.25]
+
+        assert [0.25, 0.75] == nelderMead._move(centroid, vertex, -NelderMead._reflection, bounds)
+        assert [0.0, 1.0]   == nelderMead._move(centroid, vertex, -NelderMead._expansion, bounds)
+        assert [0.625, 0.375] == nelderMead._move(centroid, vertex, NelderMead._contraction, bounds)
+
+        # points outside of the parameter intervals are moved onto their boundaries
+        assert [0.0, 0.75] == nelderMead._move(centroid, vertex, -3.0, [[0.0, 1.0], [0.0, 0.75]])
+
+        # shrinking moves all vertices halfway to the best vertex
+        best = [0.0, 0.0]
+        assert [0.375, 0.125] == nelderMead._move(best, vertex, NelderMead._shrinkage, bounds)
+
+    def simplex_size_test(self):
+        """Test the size of the simplex used as stopping criterion."""
+        nelderMead = NelderMead(SMAPE)
+
+        assert 0.0 == nelderMead._get_simplex_size([[]])
+        assert 0.0 == nelderMead._get_simplex_size([[0.5, 0.5], [0.5, 0.5], [0.5, 0.5]])
+        assert 0.375 == nelderMead._get_simplex_size([[0.5, 0.5], [0.625, 0.25], [0.5, 0.875]])
+
+    def maximal_iterations_test(self):
+        """Test that the optimization stops after maximalIterations."""
+        for maximalIterations, maximalEvaluations in ((1, 6), (10, 33)):
+            nelderMead      = NelderMead(SMAPE, precision=-7, maximalIterations=maximalIterations)
+            evaluatedPoints = create_quadratic_objective(nelderMead, [0.37, 1.62])
+
+            nelderMead.optimize_forecasting_method(None, create_forecasting_method())
+
+            # the initial simplex has three vertices, each iteration evaluates at most three points
+            assert len(evaluatedPoints) <= maximalEvaluations
+
+    def shrinkage_test(self):
+        """Test that the simplex is shrunk, when neither reflection nor contraction improve the worst vertex."""
+        nelderMead = NelderMead(SMAPE, precision=-2, maximalIterations=1)
+
+        def create_objective(timeSeries, forecastingMethod, parameters):
+            def objective(values):
+                evaluatedPoints.append(list(values))
+                return 1.0, "error"
+
+            return objective
+
+        evaluatedPoints = []
+        nelderMead._create_objective = create_objective
+        nelderMead.optimize_forecasting_method(None, create_forecasting_method())
+
+        # the initial simplex, the reflected and the contracted point, the two shrunk vertices and the result
+        assert 8 == len(evaluatedPoints)
+
+        best = evaluatedPoints[0]
+        assert best == evaluatedPoints[-1]
+        for vertex, shrunkVertex in zip(evaluatedPoints[1:3], evaluatedPoints[5:7]):
+            for bestValue, value, shrunkValue in zip(best, vertex, shrunkVertex):
+                assert round(bestValue + 0.5 * (value - bestValue), 10) == round(shrunkValue, 10)
@@ -0,0 +1,130 @@
+# !/usr/bin/env python
+#  -*- coding: UTF-8 -*-
+
+# Copyright (c) 2012-2015 Christian Schwarz
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+# required external modules
+import unittest
+import random
+import time
+
+# required modules from pycast
+from pycast.errors.symmetricmeanabsolutepercentageerror import SymmetricMeanAbsolutePercentageError as SMAPE
+from pycast.common.timeseries import TimeSeries
+from pycast.methods.exponentialsmoothing import ExponentialSmoothing, HoltMethod
+from pycast.optimization import randomsearch
+from pycast.optimization.randomsearch import RandomSearch
+
+class RandomSearchTest(unittest.TestCase):
+
+    """Test class for the RandomSearch optimization method."""
+
+    def setUp(self):
+        """Initializes self.timeSeries."""
+        data = [[0.0, 0.0], [1.1, 0.2], [2.2, 0.6], [3.3, 0.2], [4.4, 0.3], [5.5, 0.5]]
+        self.timeSeries = TimeSeries.from_twodim_list(data)
+        self.timeSeries.normalize("second")
+
+    def tearDown(self):
+        """Deletes the TimeSeries of the test."""
+        del self.timeSeries
+
+    def initialization_exception_test(self):
+        """Test the parameter validation of the initialization."""
+        for kwargs in ({"numberOfSamples": 0}, {"sampling": "sobol"}, {"timeLimit": 0}):
+            try:
+                RandomSearch(SMAPE, **kwargs)
+            except ValueError:
+                pass
+            else:
+                assert False    # pragma: no cover
+
+    def latin_hypercube_sampling_test(self):
+        """Test that each stratum of each parameter is sampled once."""
+        randomSearch = RandomSearch(SMAPE, numberOfSamples=50, sampling="latinhypercube")
+        bounds  = [[0.0, 1.0], [10.0, 20.0]]
+        samples = list(randomSearch._generate_samples(bounds, random.Random(42)))
+
+        assert 50 == len(samples)
+        assert range(50) == sorted(int(sample[0] * 50) for sample in samples)
+        assert range(50) == sorted(int((sample[1] - 10.0) * 5) for sample in samples)
+
+    def reproducibility_test(self):
+        """Test that a seeded RandomSearch returns the same parameters."""
+        for sampling in ("uniform", "latinhypercube"):
+            results = []
+            for dummy in xrange(2):
+                randomSearch = RandomSearch(SMAPE, precision=-3, numberOfSamples=30, sampling=sampling, seed=7)
+                results.append(randomSearch.optimize(self.timeSeries, [HoltMethod()])[2])
+
+            assert results[0] == results[1]
+
+    def optimization_result_test(self):
+        """Test the parameters determined by the RandomSearch."""
+        forecastingMethod = ExponentialSmoothing()
+        result = RandomSearch(SMAPE, precision=-2, numberOfSamples=200, seed=1).optimize(self.timeSeries, [forecastingMethod])
+
+        # the best smoothingFactor on the grid is 0.56
+        assert result[0] is forecastingMethod
+        assert abs(result[2]["smoothingFactor"] - 0.56) < 0.015
+        assert forecastingMethod.get_parameter("smoothingFactor") == result[2]["smoothingFactor"]
+
+    def time_limit_test(self):
+        """Test that the remaining samples are skipped when the time limit is reached."""
+        randomSearch = RandomSearch(SMAPE, precision=-7, numberOfSamples=10**7, timeLimit=2.0)
+
+        class SteppingClock(object):
+            """Replaces the time module, the clock advances by one second per call."""
+
+            def __init__(self):
+                """Starts the clock at zero."""
+                self.now = -1.0
+
+            def time(self):
+                """Returns the current time and advances the clock."""
+                self.now += 1.0
+                return self.now
+
+        evaluatedPoints  = []
+        create_objective = randomSearch._create_objective
+
+        def counting_create_objective(timeSeries, forecastingMethod, parameters):
+            objective = create_objective(timeSeries, forecastingMethod, parameters)
+
+            def counting_objective(values):
+                evaluatedPoints.append(values)
+                return objective(values)
+
+            return counting_objective
+
+        randomSearch._create_objective = counting_create_objective
+
+        randomsearch.time = SteppingClock()
+        try:
+            result = randomSearch.optimize(self.timeSeries, [ExponentialSmoothing(), HoltMethod()])
+        finally:
+            randomsearch.time = time
+
+        # the deadline is reached after two samples of the first and one sample of the second method
+        assert 3 == len(evaluatedPoints)
+        assert 3 == len(result)
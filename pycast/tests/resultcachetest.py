@@ -0,0 +1,188 @@
+# !/usr/bin/env python
+#  -*- coding: UTF-8 -*-
+
+# Copyright (c) 2012-2015 Christian Schwarz
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+# required external modules
+import unittest
+import sys
+
+# required modules from pycast
+from pycast.common.timeseries import TimeSeries
+from pycast.common.resultcache import ResultCache
+from pycast.methods.exponentialsmoothing import ExponentialSmoothing
+from pycast.optimization.gridsearch import GridSearch
+from pycast.errors.symmetricmeanabsolutepercentageerror import SymmetricMeanAbsolutePercentageError as SMAPE
+
+class CountingExponentialSmoothing(ExponentialSmoothing):
+
+    """ExponentialSmoothing counting its executions."""
+
+    executions = 0
+
+    def execute(self, timeSeries):
+        """Counts the execution and executes the ExponentialSmoothing."""
+        CountingExponentialSmoothing.executions += 1
+        return super(CountingExponentialSmoothing, self).execute(timeSeries)
+
+class ResultCacheTest(unittest.TestCase):
+
+    """Test class for the ResultCache."""
+
+    def setUp(self):
+        """Initializes the TimeSeries and resets the execution counter."""
+        data = [[0.0, 0.0], [1.0, 0.2], [2.0, 0.6], [3.0, 0.2], [4.0, 0.3], [5.0, 0.5]]
+        self.timeSeries = TimeSeries.from_twodim_list(data)
+        self.timeSeries.normalize("second")
+
+        CountingExponentialSmoothing.executions = 0
+
+    def initialization_test(self):
+        """Test the limits of the ResultCache."""
+        for maximalEntries, maximalMemory in ((0, None), (1, 0), (-1, 100)):
+            try:
+                ResultCache(maximalEntries, maximalMemory)
+            except ValueError:
+                pass
+            else:
+                assert False    # pragma: no cover
+
+    def cached_execution_test(self):
+        """Test that repeated forecasts are served from the cache."""
+        cache  = ResultCache()
+        method = CountingExponentialSmoothing(smoothingFactor=0.3, valuesToForecast=2)
+
+        result = self.timeSeries.apply(method, resultCache=cache)
+        cached = self.timeSeries.apply(method, resultCache=cache)
+        assert 1 == CountingExponentialSmoothing.executions
+        assert result == cached
+        assert result == self.timeSeries.apply(method)
+
+        # the cached results cannot be changed by the caller
+        cached[0] = [0.0, 100.0]
+        assert result == self.timeSeries.apply(method, resultCache=cache)
+
+        # a different parameter or TimeSeries results in a new calculation
+        method.set_parameter("smoothingFactor", 0.4)
+        self.timeSeries.apply(method, resultCache=cache)
+        assert 3 == CountingExponentialSmoothing.executions
+
+        self.timeSeries.add_entry(6.0, 0.4)
+        self.timeSeries.normalize("second")
+        self.timeSeries.apply(method, resultCache=cache)
+        assert 4 == CountingExponentialSmoothing.executions
+
+        method.set_parameter("smoothingFactor", 0.3)
+        self.timeSeries.apply(method, resultCache=cache)
+        assert 5 == CountingExponentialSmoothing.executions
+
+        statistics = cache.get_statistics()
+        assert 2 == statistics["hits"]
+        assert 4 == statistics["misses"]
+        assert 4 == statistics["entries"] == len(cache)
+
+        cache.clear()
+        assert 0 == len(cache)
+        assert 0 == cache.get_statistics()["memory"]
+
+    def changed_data_entries_test(self):
+        """Test that results are calculated again after data entries were changed in place."""
+        method = CountingExponentialSmoothing(smoothingFactor=0.3, valuesToForecast=0)
+
+        for storage in ("list", "column"):
+            cache      = ResultCache()
+            timeSeries = TimeSeries(storage=storage)
+            for entry in self.timeSeries:
+                timeSeries.add_entry(*entry)
+
+            result = cache.execute(method, timeSeries)
+            timeSeries[1][1] = 100.0
+            changedResult = cache.execute(method, timeSeries)
+
+            assert changedResult != result
+            assert changedResult == method.execute(timeSeries)
+            assert 0 == cache.get_statistics()["hits"]
+
+            # the changed result is cached, the outdated result of the "list" storage was replaced
+            assert changedResult == cache.execute(method, timeSeries)
+            statistics = cache.get_statistics()
+            assert 1 == statistics["hits"]
+            assert statistics["entries"] * ResultCache._estimate_size(result) == statistics["memory"]
+
+    def eviction_test(self):
+        """Test the eviction of the least recently used results."""
+        cache  = ResultCache(maximalEntries=2)
+        method = CountingExponentialSmoothing(valuesToForecast=0)
+
+        for smoothingFactor in (0.1, 0.2, 0.1, 0.3, 0.1, 0.2):
+            method.set_parameter("smoothingFactor", smoothingFactor)
+            cache.execute(method, self.timeSeries)
+
+        # 0.1 is used most recently, 0.2 was evicted by 0.3
+        assert 4 == CountingExponentialSmoothing.executions
+        statistics = cache.get_statistics()
+        assert 2 == statistics["hits"]
+        assert 2 == statistics["evictions"]
+
+        # each result has 5 data points with 2 columns
+        size  = ResultCache._estimate_size(self.timeSeries.apply(method))
+        cache = ResultCache(maximalMemory=2 * size + 1)
+        for smoothingFactor in (0.1, 0.2, 0.3):
+            method.set_parameter("smoothingFactor", smoothingFactor)
+            cache.execute(method, self.timeSeries)
+
+        statistics = cache.get_statistics()
+        assert 2 == statistics["entries"]
+        assert 2 * size == statistics["memory"]
+
+        # results larger than the cache are not stored
+        cache = ResultCache(maximalMemory=size - 1)
+        cache.execute(method, self.timeSeries)
+        assert 0 == len(cache)
+
+    def estimated_size_test(self):
+        """Test that the estimated size includes the overhead of the storage backends."""
+        data = [[float(idx), float(idx)] for idx in xrange(100)]
+
+        rowSize      = ResultCache._estimate_size(TimeSeries.from_twodim_list(data))
+        columnSize   = ResultCache._estimate_size(TimeSeries(storage="column")._initialize_from_columns(zip(*data)))
+        implicitSize = ResultCache._estimate_size(TimeSeries(storage="implicit")._initialize_from_columns(zip(*data)))
+
+        # the values are float objects within lists, arrays or calculated
+        assert 100 * 8 < implicitSize < 100 * 2 * 8 < columnSize < rowSize
+        assert 100 * (2 * sys.getsizeof(0.0) + sys.getsizeof([0.0, 0.0])) < rowSize
+        assert 0 == ResultCache._estimate_size(None)
+
+    def gridsearch_test(self):
+        """Test the ResultCache within the GridSearch."""
+        method = CountingExponentialSmoothing()
+        result = GridSearch(SMAPE, precision=-1).optimize(self.timeSeries, [method])
+        executions = CountingExponentialSmoothing.executions
+
+        cache = ResultCache()
+        for dummy in xrange(3):
+            cachedResult = GridSearch(SMAPE, precision=-1, resultCache=cache).optimize(self.timeSeries, [method])
+            assert result[2] == cachedResult[2]
+
+        assert 2 * executions == CountingExponentialSmoothing.executions
+        assert 2 * executions == cache.get_statistics()["hits"]
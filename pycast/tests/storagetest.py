@@ -0,0 +1,436 @@
+# !/usr/bin/env python
+#  -*- coding: UTF-8 -*-
+
+# Copyright (c) 2012-2015 Christian Schwarz
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+# required external modules
+import unittest
+import os
+import mmap
+import pickle
+from copy import copy
+
+# required modules from pycast
+from pycast.common import storage
+from pycast.common.storage import RowStorage, ColumnStorage, DataPoint, MappedColumnStorage, ImplicitTimestampStorage
+from pycast.common.storage import pack_columns, unpack_columns
+from pycast.common.timeseries import TimeSeries, MultiDimensionalTimeSeries
+
+class ColumnStorageTest(unittest.TestCase):
+
+    """Test class for the ColumnStorage and its DataPoints."""
+
+    def setUp(self):
+        """Initializes the data used within each test."""
+        self.data = [[0.0, 0.0], [0.1, 0.1], [0.2, 0.2], [0.3, 0.3], [0.4, 0.4], [0.5, 0.5]]
+
+    def initialization_test(self):
+        """Test the initialization of a ColumnStorage from a list of rows."""
+        storage = ColumnStorage(2, self.data)
+
+        assert len(storage) == len(self.data)
+        assert storage.column_count() == 2
+        assert storage.to_list() == self.data
+        assert list(storage.get_column(0)) == [entry[0] for entry in self.data]
+        assert list(storage.get_column(1)) == [entry[1] for entry in self.data]
+
+    def append_test(self):
+        """Test ColumnStorage.append()."""
+        storage = ColumnStorage(3)
+        storage.append([0.0, 1.0, 2.0])
+
+        assert len(storage) == 1
+        assert storage[0] == [0.0, 1.0, 2.0]
+
+        try:
+            storage.append([0.0, 1.0])
+        except ValueError:
+            pass
+        else:
+            assert False    # pragma: no cover
+
+    def append_columns_test(self):
+        """Test the append_columns() of all storage backends."""
+        for storageClass in (RowStorage, ColumnStorage, ImplicitTimestampStorage):
+            storage = storageClass(2, self.data[:2])
+            storage.append_columns([[0.2, 0.3], [0.2, 0.3]])
+            storage.append_columns([[], []])
+
+            assert storage.to_list() == self.data[:4]
+
+            for columns in ([[0.4], [0.4], [0.4]], [[0.4, 0.5], [0.4]]):
+                try:
+                    storage.append_columns(columns)
+                except ValueError:
+                    pass
+                else:
+                    assert False    # pragma: no cover
+
+        storage = ImplicitTimestampStorage(2, [[0.0, 0.0], [1.0, 0.1]])
+        storage.append_columns([[2.0, 3.0], [0.2, 0.3]])
+        assert storage.has_implicit_timestamps()
+        storage.append_columns([[5.0], [0.5]])
+        assert not storage.has_implicit_timestamps()
+        assert list(storage.get_column(0)) == [0.0, 1.0, 2.0, 3.0, 5.0]
+        assert list(storage.get_column(1)) == [0.0, 0.1, 0.2, 0.3, 0.5]
+
+    def getitem_test(self):
+        """Test the index and slice access of ColumnStorage."""
+        storage = ColumnStorage(2, self.data)
+
+        assert isinstance(storage[0], DataPoint)
+        assert storage[1] == self.data[1]
+        assert storage[-1] == self.data[-1]
+        assert storage[1:3] == self.data[1:3]
+        assert storage[::2] == self.data[::2]
+        assert storage[2][1:] == self.data[2][1:]
+
+        for index in (6, -7):
+            try:
+                storage[index]
+            except IndexError:
+                pass
+            else:
+                assert False    # pragma: no cover
+
+    def datapoint_write_through_test(self):
+        """Test that DataPoints write into the underlying columns."""
+        storage = ColumnStorage(2, self.data)
+
+        storage[1][0] = 1.3
+        storage[2] = [4.2, 2.4]
+
+        assert storage.get_column(0)[1] == 1.3
+        assert storage[2] == [4.2, 2.4]
+        assert storage[1] != storage[2]
+        assert str(storage[2]) == str([4.2, 2.4])
+
+    def sort_by_timestamp_test(self):
+        """Test that sorting keeps the columns aligned and is stable."""
+        storage = ColumnStorage(2, [[3.0, 1.0], [1.0, 2.0], [2.0, 3.0], [1.0, 4.0]])
+
+        storage.sort_by_timestamp()
+        assert storage.to_list() == [[1.0, 2.0], [1.0, 4.0], [2.0, 3.0], [3.0, 1.0]]
+
+        storage.sort_by_timestamp(reverse=True)
+        assert storage.to_list() == [[3.0, 1.0], [2.0, 3.0], [1.0, 2.0], [1.0, 4.0]]
+
+    def copy_test(self):
+        """Test that a copied storage does not share its buffers."""
+        for storage in (ColumnStorage(2, self.data), RowStorage(2, [entry[:] for entry in self.data])):
+            clone = storage.copy()
+            storage[0][1] = 42.0
+
+            assert clone.to_list() == self.data
+            assert storage.to_list() != self.data
+
+class ColumnStorageTimeSeriesTest(unittest.TestCase):
+
+    """Test class for TimeSeries instances using the ColumnStorage."""
+
+    def unknown_storage_test(self):
+        """Test the ValueError for unknown storage backends."""
+        try:
+            TimeSeries(storage="ILLEGAL_PARAMETER")
+        except ValueError:
+            pass
+        else:
+            assert False    # pragma: no cover
+
+    def equal_to_list_storage_test(self):
+        """Test that both storage backends behave equally."""
+        data = [[0.0, 0.0], [1.0, 1.0], [2.0, 2.0], [5.1, 5.0], [0.5, 3.0]]
+
+        tsList   = TimeSeries()
+        tsColumn = TimeSeries(storage="column")
+        for entry in data:
+            tsList.add_entry(*entry)
+            tsColumn.add_entry(*entry)
+
+        assert tsList == tsColumn
+        assert tsList.to_twodim_list() == tsColumn.to_twodim_list()
+        assert str(tsList) == str(tsColumn)
+
+        tsList.normalize("second")
+        tsColumn.normalize("second")
+
+        assert tsList.to_twodim_list() == tsColumn.to_twodim_list()
+        assert tsColumn.is_normalized()
+        assert isinstance(tsColumn._timeseriesData, ColumnStorage)
+
+    def copy_test(self):
+        """Test that copies keep the storage backend."""
+        ts = TimeSeries(storage="column")
+        ts.add_entry(0.0, 1.0)
+        ts.add_entry(1.0, 2.0)
+
+        tsClone = copy(ts)
+        assert isinstance(tsClone._timeseriesData, ColumnStorage)
+        assert ts == tsClone
+
+        ts[0][1] = 3.0
+        assert ts != tsClone
+
+    def column_view_test(self):
+        """Test that all storages return column views matching their columns."""
+        data = [[0.0, 1.0, 2.0], [1.0, 3.0, 4.0], [2.0, 5.0, 6.0]]
+
+        for storage in (RowStorage(3, data), ColumnStorage(3, data), ImplicitTimestampStorage(3, data)):
+            for column in xrange(3):
+                view = storage.get_column_view(column)
+                assert len(view) == len(data)
+                assert [view[idx] for idx in xrange(len(view))] == list(storage.get_column(column))
+
+        # the view of a RowStorage reads the current values
+        storage = RowStorage(3, [list(row) for row in data])
+        view    = storage.get_column_view(1)
+        storage[0][1] = 7.0
+        assert view[0] == 7.0
+        assert view[-1] == 5.0
+
+    def between_storage_test(self):
+        """Test that TimeSeries.between() and loc() behave equally for all storage backends."""
+        data = [[0.0, 0.0], [1.0, 1.0], [2.0, 2.0], [3.0, 3.0], [4.0, 4.0]]
+
+        for storage in ("list", "column", "implicit"):
+            ts = TimeSeries.from_arrays([row[0] for row in data], [row[1] for row in data], storage=storage)
+
+            assert ts.between(1.0, 3.0).to_twodim_list() == [[1.0, 1.0], [2.0, 2.0], [3.0, 3.0]]
+            assert ts.between(1.5, 2.5).to_twodim_list() == [[2.0, 2.0]]
+            assert ts.between(5.0, 6.0).to_twodim_list() == []
+            assert ts.loc(3.0) == [3.0, 3.0]
+
+    def multidimensional_test(self):
+        """Test the ColumnStorage for MultiDimensionalTimeSeries."""
+        ts = MultiDimensionalTimeSeries(dimensions=2, storage="column")
+        ts.add_entry(1.0, [1.0, 2.0])
+        ts.add_entry(0.0, [3.0, 4.0])
+
+        assert ts._timeseriesData.column_count() == 3
+
+        tsSorted = ts.sorted_timeseries()
+        assert tsSorted.to_twodim_list() == [[0.0, 3.0, 4.0], [1.0, 1.0, 2.0]]
+        assert tsSorted == copy(ts)
+
+class ImplicitTimestampStorageTest(unittest.TestCase):
+
+    """Test class for the ImplicitTimestampStorage."""
+
+    def implicit_timestamps_test(self):
+        """Test that equidistant timestamps are not stored."""
+        storage = ImplicitTimestampStorage(2, [[0.5, 1.0], [1.5, 2.0], [2.5, 3.0]])
+
+        assert storage.has_implicit_timestamps()
+        assert list(storage.get_column(0)) == [0.5, 1.5, 2.5]
+        assert storage[-1] == [2.5, 3.0]
+        assert storage.to_list() == [[0.5, 1.0], [1.5, 2.0], [2.5, 3.0]]
+
+        storage.append([3.5, 4.0])
+        assert storage.has_implicit_timestamps()
+
+        storage.truncate(2)
+        assert storage.to_list() == [[0.5, 1.0], [1.5, 2.0]]
+        assert storage.has_implicit_timestamps()
+
+        storageCopy = storage.copy()
+        assert storageCopy.has_implicit_timestamps()
+
+        # timestamps that do not fit are stored
+        storage.append([4.0, 5.0])
+        assert not storage.has_implicit_timestamps()
+        assert storage.to_list() == [[0.5, 1.0], [1.5, 2.0], [4.0, 5.0]]
+
+        storageCopy[0][0] = 0.0
+        assert not storageCopy.has_implicit_timestamps()
+        assert storageCopy.to_list() == [[0.0, 1.0], [1.5, 2.0]]
+
+        storage = ImplicitTimestampStorage(2, [[0.0, 0.0], [1.0, 1.0], [3.0, 3.0]])
+        assert not storage.has_implicit_timestamps()
+
+    def normalized_timeseries_test(self):
+        """Test the normalization of a TimeSeries using the ImplicitTimestampStorage."""
+        data = [[0.0, 0.0], [1.1, 0.1], [3.9, 0.2], [4.5, 0.3], [1.2, 0.4]]
+
+        tsList     = TimeSeries.from_twodim_list(data)
+        tsImplicit = TimeSeries(storage="implicit")
+        for entry in data:
+            tsImplicit.add_entry(*entry)
+
+        assert not tsImplicit._timeseriesData.has_implicit_timestamps()
+
+        tsList.normalize("second")
+        tsImplicit.normalize("second")
+
+        assert tsImplicit._timeseriesData.has_implicit_timestamps()
+        assert tsImplicit.to_twodim_list() == tsList.to_twodim_list()
+        assert tsImplicit._check_normalization()
+
+        # data entries appended after the normalization keep the timestamps implicit
+        tsList.add_entry(5.2, 0.5)
+        tsImplicit.add_entry(5.2, 0.5)
+        tsList.normalize("second")
+        tsImplicit.normalize("second")
+
+        assert tsImplicit._timeseriesData.has_implicit_timestamps()
+        assert tsImplicit.to_twodim_list() == tsList.to_twodim_list()
+
+class MappedColumnStorageTest(unittest.TestCase):
+
+    """Test class for the binary TimeSeries file format."""
+
+    def tearDown(self):
+        """This function gets called after each test function."""
+        if os.path.isfile("temp_timeseries.pcts"):
+            os.remove("temp_timeseries.pcts")
+
+    def timeseries_roundtrip_test(self):
+        """Test writing and mapping a TimeSeries."""
+        data = [[3.0, 0.3], [0.0, 0.0], [1.0, 0.1], [2.5, 0.2]]
+        ts   = TimeSeries.from_twodim_list(data)
+
+        assert ts.to_binary_file("temp_timeseries.pcts")
+        assert os.path.getsize("temp_timeseries.pcts") == 64 + 2 * 4 * 8
+
+        mapped = TimeSeries.from_binary_file("temp_timeseries.pcts")
+
+        assert isinstance(mapped._timeseriesData, MappedColumnStorage)
+        assert mapped == ts
+        assert mapped[-1] == [3.0, 0.3]
+        assert mapped[1:3] == [[1.0, 0.1], [2.5, 0.2]]
+        assert list(mapped.get_column(1)[2:]) == [0.2, 0.3]
+        assert mapped.is_sorted()
+        assert not mapped.is_normalized()
+
+        # mapped TimeSeries are read only, copies are not
+        self.assertRaises(TypeError, mapped.add_entry, 4.0, 0.4)
+        self.assertRaises(TypeError, mapped.__setitem__, 0, [0.0, 1.0])
+
+        tsCopy = copy(mapped)
+        tsCopy.add_entry(4.0, 0.4)
+        assert len(tsCopy) == 5
+
+        mapped.close()
+        tsCopy.close()
+        assert len(tsCopy) == 5
+
+    def normalized_timeseries_test(self):
+        """Test that the timestamps of normalized TimeSeries are not stored."""
+        ts = TimeSeries.from_twodim_list([[0.0, 0.0], [1.1, 0.1], [3.9, 0.2], [4.5, 0.3]])
+        ts.normalize("second")
+
+        assert ts.to_binary_file("temp_timeseries.pcts")
+        assert os.path.getsize("temp_timeseries.pcts") == 64 + len(ts) * 8
+
+        with TimeSeries.from_binary_file("temp_timeseries.pcts") as mapped:
+            assert mapped.to_twodim_list() == ts.to_twodim_list()
+            assert mapped.is_normalized()
+            assert mapped._normalizationLevel == "second"
+
+        self.assertRaises(ValueError, mapped.get_column(1).__getitem__, 0)
+
+    def multidimensional_timeseries_test(self):
+        """Test writing and mapping a MultiDimensionalTimeSeries."""
+        data = [[0.0, [0.0, 1.0]], [1.0, [0.1, 1.1]], [2.0, [0.2, 1.2]]]
+        ts   = MultiDimensionalTimeSeries.from_twodim_list(data, dimensions=2)
+
+        assert ts.to_binary_file("temp_timeseries.pcts")
+
+        with MultiDimensionalTimeSeries.from_binary_file("temp_timeseries.pcts") as mapped:
+            assert mapped.dimension_count() == 2
+            assert mapped == ts
+
+        self.assertRaises(ValueError, TimeSeries.from_binary_file, "temp_timeseries.pcts")
+
+    def pickle_test(self):
+        """Test pickling a TimeSeries read from a binary file."""
+        ts = TimeSeries.from_twodim_list([[3.0, 0.3], [0.0, 0.0], [1.0, 0.1], [2.0, 0.2]])
+        ts.to_binary_file("temp_timeseries.pcts")
+
+        mapped = TimeSeries.from_binary_file("temp_timeseries.pcts")
+        tsCopy = pickle.loads(pickle.dumps(mapped, pickle.HIGHEST_PROTOCOL))
+
+        assert tsCopy == ts
+        assert isinstance(tsCopy._timeseriesData, ColumnStorage)
+
+        # pickled TimeSeries can be changed
+        tsCopy.add_entry(4.0, 0.4)
+
+    def pack_columns_test(self):
+        """Test packing columns into one buffer."""
+        columns = [[0.0, 1.0, 2.0], [0.5, -1.5, 1e300]]
+        data    = pack_columns(columns)
+
+        assert len(data) == 6 * 8
+        assert data[:8] == "\x00" * 8
+        assert [list(column) for column in unpack_columns(data, 2)] == columns
+        assert [len(column) for column in unpack_columns(pack_columns([[], []]), 2)] == [0, 0]
+
+        for invalidColumns in ([[0.0], []], [[0.0], ["a"]]):
+            try:
+                pack_columns(invalidColumns)
+            except (ValueError, TypeError):
+                pass
+            else:
+                assert False    # pragma: no cover
+
+        try:
+            unpack_columns(data, 4)
+        except ValueError:
+            pass
+        else:
+            assert False    # pragma: no cover
+
+    def invalid_file_test(self):
+        """Test the handling of files that are not valid binary TimeSeries files."""
+        datafile = open("temp_timeseries.pcts", "wb")
+        datafile.write("This is not a TimeSeries")
+        datafile.close()
+
+        self.assertRaises(ValueError, TimeSeries.from_binary_file, "temp_timeseries.pcts")
+
+        datafile = open("temp_timeseries.pcts", "wb")
+        datafile.write("x" * 128)
+        datafile.close()
+
+        self.assertRaises(ValueError, TimeSeries.from_binary_file, "temp_timeseries.pcts")
+
+        TimeSeries.from_twodim_list([[0.0, 0.0], [1.0, 2.0]]).to_binary_file("temp_timeseries.pcts")
+        datafile = open("temp_timeseries.pcts", "ab")
+        datafile.write("x")
+        datafile.close()
+
+        # the memory mapped file is closed before the ValueError is raised
+        buffers = []
+        def recording_mmap(*args, **kwargs):
+            buffers.append(mmap.mmap(*args, **kwargs))
+            return buffers[-1]
+
+        storage.mmap = type("RecordingMmapModule", (object, ), {"mmap": staticmethod(recording_mmap), "ACCESS_READ": mmap.ACCESS_READ})
+        try:
+            self.assertRaises(ValueError, TimeSeries.from_binary_file, "temp_timeseries.pcts")
+        finally:
+            storage.mmap = mmap
+
+        assert 1 == len(buffers)
+        self.assertRaises(ValueError, buffers[0].read_byte)
+
+        assert not TimeSeries().to_binary_file(None)
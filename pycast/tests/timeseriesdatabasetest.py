@@ -26,7 +26,7 @@
 # SQLite is used for connector tests
 
 # required external modules
-import unittest, random, sqlite3
+import unittest, random, sqlite3, datetime
 
 # required modules from pycast
 from pycast.common.timeseries import TimeSeries, MultiDimensionalTimeSeries
@@ -161,7 +161,7 @@ class DatabaseConnectorTest(unittest.TestCase):
         tsManual = TimeSeries()
         data     = self._db.cursor().execute(sqlstmt).fetchall()
         for entry in data:
-            tsManual.add_entry(str(entry[0]), entry[1])
+            tsManual.add_entry(entry[0], entry[1])
 
         # Initialize one TimeSeries from SQL cursor
         tsAuto = TimeSeries()
@@ -172,3 +172,195 @@ class DatabaseConnectorTest(unittest.TestCase):
         assert (nbrOfTuples == len(tsAuto))
         assert (len(tsManual) == len(tsAuto))
         assert (tsManual == tsAuto)
+
+    def return_value_and_statistics_test(self):
+        """Test that the number of loaded rows is returned and the statistics are stored."""
+        cur = self._db.cursor().execute("""SELECT COUNT(*) from TestTable""")
+        nbrOfTuples = cur.fetchall()[0][0]
+
+        ts = TimeSeries()
+        assert ts.sql_load_statistics() is None
+
+        cur = self._db.cursor().execute("""SELECT timestamp, value FROM TestTable""")
+        arraysize = cur.arraysize
+        assert nbrOfTuples == ts.initialize_from_sql_cursor(cur, arraysize=37)
+        assert arraysize == cur.arraysize
+
+        statistics = ts.sql_load_statistics()
+        assert nbrOfTuples == statistics["rows"]
+        assert (nbrOfTuples + 36) // 37 == statistics["batches"]
+        assert 0 < statistics["rowsPerSecond"]
+
+        # a second result is appended to the existing data
+        cur = self._db.cursor().execute("""SELECT timestamp, value FROM TestTable""")
+        assert nbrOfTuples == ts.initialize_from_sql_cursor(cur)
+        assert 2 * nbrOfTuples == len(ts)
+
+    def column_storage_test(self):
+        """Test the initialization of TimeSeries using a column based storage."""
+        sqlstmt = """SELECT timestamp, value FROM TestTable ORDER BY timestamp ASC"""
+
+        tsList = TimeSeries()
+        tsList.initialize_from_sql_cursor(self._db.cursor().execute(sqlstmt))
+
+        for storage in ("column", "implicit"):
+            ts = TimeSeries(storage=storage)
+            ts.initialize_from_sql_cursor(self._db.cursor().execute(sqlstmt), arraysize=10)
+
+            assert tsList.to_twodim_list() == ts.to_twodim_list()
+
+    def formatted_timestamps_test(self):
+        """Test the initialization of TimeSeries from time stamps stored as strings."""
+        tsformat = "%Y-%m-%d %H:%M:%S"
+        cur = self._db.cursor()
+        cur.execute("""CREATE TABLE FormattedTable(timestamp TEXT, value REAL)""")
+        cur.executemany("""INSERT INTO FormattedTable VALUES (?,?)""",
+                        [("2013-03-0%s 12:00:%02d" % (day, second), day * second) for day in xrange(1, 4) for second in xrange(60)])
+
+        ts = TimeSeries()
+        ts.set_timeformat(tsformat)
+        assert 180 == ts.initialize_from_sql_cursor(cur.execute("""SELECT * FROM FormattedTable"""), arraysize=50)
+
+        data = cur.execute("""SELECT * FROM FormattedTable""").fetchall()
+        assert list(ts.get_column(0)) == [TimeSeries.convert_timestamp_to_epoch(entry[0], tsformat) for entry in data]
+        assert list(ts.get_column(1)) == [entry[1] for entry in data]
+
+        # numeric timestamps do not need a format
+        ts = TimeSeries()
+        ts.set_timeformat(tsformat)
+        ts.initialize_from_sql_cursor(self._db.cursor().execute("""SELECT timestamp, value FROM TestTable"""))
+        data = self._db.cursor().execute("""SELECT timestamp, value FROM TestTable""").fetchall()
+        assert list(ts.get_column(0)) == [entry[0] for entry in data]
+
+    def datetime_timestamps_test(self):
+        """Test the initialization of TimeSeries from time stamps returned as datetime objects."""
+        tsformat = "%Y-%m-%d %H:%M:%S"
+        database = sqlite3.connect(":memory:", detect_types=sqlite3.PARSE_DECLTYPES)
+        cur = database.cursor()
+        cur.execute("""CREATE TABLE DatetimeTable(timestamp TIMESTAMP, value REAL)""")
+        cur.executemany("""INSERT INTO DatetimeTable VALUES (?,?)""",
+                        [(datetime.datetime(2013, 3, day, 12, 0, second), day * second) for day in xrange(1, 4) for second in xrange(60)])
+
+        data = cur.execute("""SELECT * FROM DatetimeTable""").fetchall()
+        assert isinstance(data[0][0], datetime.datetime)
+
+        for ts in (TimeSeries(), MultiDimensionalTimeSeries(dimensions=1)):
+            ts.set_timeformat(tsformat)
+            assert 180 == ts.initialize_from_sql_cursor(cur.execute("""SELECT * FROM DatetimeTable"""), arraysize=50)
+            assert list(ts.get_column(0)) == [TimeSeries.convert_timestamp_to_epoch(str(entry[0]), tsformat) for entry in data]
+
+        database.close()
+
+    def normalization_test(self):
+        """Test that the normalization of the TimeSeries is checked after loading."""
+        cur = self._db.cursor()
+        cur.execute("""CREATE TABLE NormalizedTable(timestamp REAL, value REAL)""")
+        cur.executemany("""INSERT INTO NormalizedTable VALUES (?,?)""", [(idx * 10.0, idx) for idx in xrange(100)])
+
+        ts = TimeSeries()
+        ts.initialize_from_sql_cursor(cur.execute("""SELECT * FROM NormalizedTable"""), arraysize=7)
+        assert ts.is_normalized()
+
+        ts.initialize_from_sql_cursor(cur.execute("""SELECT timestamp + 0.5, value FROM NormalizedTable"""), arraysize=7)
+        assert not ts._normalized
+
+    def multidimensionaltimeseries_dimension_test(self):
+        """Test that the SQL result has to match the dimensions of the MultiDimensionalTimeSeries."""
+        ts = MultiDimensionalTimeSeries(dimensions=3)
+        cur = self._db.cursor().execute("""SELECT timestamp, value, junk_one FROM TestTable""")
+
+        try:
+            ts.initialize_from_sql_cursor(cur)
+        except ValueError:
+            pass
+        else:
+            assert False    # pragma: no cover
+
+        cur = self._db.cursor().execute("""SELECT timestamp, value, junk_one, value FROM TestTable""")
+        assert len(ts.to_twodim_list()) == 0
+        assert ts.initialize_from_sql_cursor(cur, arraysize=100) == len(ts)
+        assert [row[1] for row in ts.to_twodim_list()] == [row[3] for row in ts.to_twodim_list()]
+
+    def to_sql_test(self):
+        """Test writing a TimeSeries into a database table."""
+        sqlstmt = """SELECT timestamp, value FROM TestTable ORDER BY timestamp ASC"""
+        ts = TimeSeries()
+        ts.initialize_from_sql_cursor(self._db.cursor().execute(sqlstmt))
+
+        self._db.cursor().execute("""CREATE TABLE ForecastTable(timestamp REAL, value REAL)""")
+        assert len(ts) == ts.to_sql(self._db, "ForecastTable", batch_size=33)
+
+        tsCopy = TimeSeries()
+        tsCopy.initialize_from_sql_cursor(self._db.cursor().execute("""SELECT * FROM ForecastTable ORDER BY timestamp ASC"""))
+        assert ts == tsCopy
+
+        # invalid parameters
+        for kwargs in ({"batch_size": 0}, {"columnNames": ["timestamp"]}, {"paramstyle": "named"},
+                       {"columnNames": ["timestamp", "value) SELECT 1, 1; --"]}, {"columnNames": ["timestamp", "1value"]},
+                       {"table": "ForecastTable; DROP TABLE TestTable"}, {"table": "main..ForecastTable"}):
+            try:
+                ts.to_sql(self._db, **dict({"table": "ForecastTable"}, **kwargs))
+            except ValueError:
+                pass
+            else:
+                assert False    # pragma: no cover
+
+        # qualified table names
+        assert len(ts) == ts.to_sql(self._db, "main.ForecastTable")
+        assert 2 * len(ts) == self._db.cursor().execute("""SELECT COUNT(*) FROM ForecastTable""").fetchone()[0]
+
+    def to_sql_upsert_test(self):
+        """Test replacing existing rows while writing a TimeSeries into a database table."""
+        self._db.cursor().execute("""CREATE TABLE ForecastTable(ts REAL PRIMARY KEY, v1 REAL, v2 REAL)""")
+        ts = MultiDimensionalTimeSeries.from_twodim_list([[0.0, [0.0, 0.0]], [1.0, [1.0, 1.0]]], dimensions=2)
+        ts.to_sql(self._db, "ForecastTable", columnNames=["ts", "v1", "v2"])
+
+        # inserting existing timestamps fails and is rolled back
+        ts = MultiDimensionalTimeSeries.from_twodim_list([[1.0, [2.0, 3.0]], [2.0, [2.0, 2.0]]], dimensions=2)
+        try:
+            ts.to_sql(self._db, "ForecastTable", columnNames=["ts", "v1", "v2"])
+        except sqlite3.IntegrityError:
+            pass
+        else:
+            assert False    # pragma: no cover
+
+        data = self._db.cursor().execute("""SELECT * FROM ForecastTable ORDER BY ts ASC""").fetchall()
+        assert data == [(0.0, 0.0, 0.0), (1.0, 1.0, 1.0)]
+
+        assert 2 == ts.to_sql(self._db, "ForecastTable", batch_size=1, upsert=True, columnNames=["ts", "v1", "v2"])
+        data = self._db.cursor().execute("""SELECT * FROM ForecastTable ORDER BY ts ASC""").fetchall()
+        assert data == [(0.0, 0.0, 0.0), (1.0, 2.0, 3.0), (2.0, 2.0, 2.0)]
+
+    def to_sql_commit_failure_test(self):
+        """Test that a failed commit of TimeSeries.to_sql is rolled back."""
+        self._db.cursor().execute("""CREATE TABLE ForecastTable(timestamp REAL, value REAL)""")
+        database = self._db
+
+        class FailingConnection(object):
+            """Connection whose commit fails."""
+
+            rollbacks = 0
+
+            def cursor(self):
+                """Returns a cursor of the database."""
+                return database.cursor()
+
+            def commit(self):
+                """Raises a database error."""
+                raise sqlite3.OperationalError("database is locked")
+
+            def rollback(self):
+                """Rolls back the transaction of the database."""
+                FailingConnection.rollbacks += 1
+                database.rollback()
+
+        ts = TimeSeries.from_twodim_list([[0.0, 0.0], [1.0, 1.0]])
+        try:
+            ts.to_sql(FailingConnection(), "ForecastTable")
+        except sqlite3.OperationalError:
+            pass
+        else:
+            assert False    # pragma: no cover
+
+        assert 1 == FailingConnection.rollbacks
+        assert 0 == self._db.cursor().execute("""SELECT COUNT(*) FROM ForecastTable""").fetchone()[0]
@@ -27,12 +27,17 @@ import unittest
 import re
 import os
 import random
+import pickle
 
 from copy import copy
+from StringIO import StringIO
 
 # required modules from pycast
-from pycast.common.timeseries import TimeSeries, FusionMethods
+from pycast.common.timeseries import TimeSeries, MultiDimensionalTimeSeries, FusionMethods, write_gnuplot_datafile
 from pycast.methods.basemethod import BaseMethod
+from pycast.methods.exponentialsmoothing import ExponentialSmoothing
+from pycast.errors.symmetricmeanabsolutepercentageerror import SymmetricMeanAbsolutePercentageError as SMAPE
+from pycast.common.resultcache import ResultCache
 from pycast.common.pycastobject import PyCastObject
 
 class TimeSeriesMiscellaneousTest(unittest.TestCase):
@@ -117,6 +122,186 @@ class TimeSeriesMiscellaneousTest(unittest.TestCase):
         if not (len(tsOne) == len(tsTwo)): raise AssertionError
         if not (tsOne == tsTwo):          raise AssertionError
 
+    def from_arrays_test(self):
+        """Test the bulk initialization of a TimeSeries."""
+        data = [[0.0, 0.0], [0.1, 0.1], [0.2, 0.2], [0.3, 0.3], [0.4, 0.4], [0.5, 0.5]]
+
+        for storage in ("list", "column"):
+            tsOne = TimeSeries.from_arrays([0.3, 0.1, 0.0, 0.5, 0.4, 0.2], [0.3, 0.1, 0, 0.5, 0.4, 0.2], storage=storage)
+            tsTwo = TimeSeries.from_arrays([0, 1, 2], [0.0, 0.1, 0.2], assumeSorted=True, assumeNormalized=True, storage=storage)
+
+            assert tsOne == TimeSeries.from_twodim_list(data)
+            assert tsOne.to_twodim_list() == data
+            assert tsOne.is_sorted()
+            assert tsTwo.is_sorted() and tsTwo.is_normalized()
+            assert isinstance(tsTwo[0][0], float)
+
+        tsThree = TimeSeries.from_arrays([0.0, 1.0, 3.0], [0.0, 1.0, 3.0])
+        assert not tsThree.is_normalized()
+
+        try:
+            TimeSeries.from_arrays([0.0, 0.1], [0.0])
+        except ValueError:
+            pass
+        else:
+            assert False    # pragma: no cover
+
+    def from_json_test(self):
+        """Test the initialization of a TimeSeries from its JSON representation."""
+        data = [[0.0, 0.0], [0.1, 0.1], [0.2, 0.2], [0.3, 0.3]]
+
+        for storage in ("list", "column", "implicit"):
+            tsOne   = TimeSeries.from_json("[[0.3, 0.3], [0.1, 0.1], [0.0, 0], [0.2, 0.2]]", storage=storage)
+            tsTwo   = TimeSeries.from_json(StringIO('{"t0": 0.0, "step": 2.5, "values": [0.0, 0.1, 0.2]}'), storage=storage)
+            tsThree = TimeSeries.from_json('{"timestamps": [0.0, 0.1, 0.3, 0.2], "values": [0.0, 0.1, 0.3, 0.2]}', storage=storage)
+
+            assert tsOne.to_twodim_list() == data
+            assert tsOne.is_sorted()
+            assert tsTwo.to_twodim_list() == [[0.0, 0.0], [2.5, 0.1], [5.0, 0.2]]
+            assert tsTwo.is_sorted() and tsTwo.is_normalized()
+            assert tsThree.to_twodim_list() == data
+
+        # sorting is skipped for sorted data
+        tsFour = TimeSeries.from_json('{"timestamps": [1.0, 0.0], "values": [1.0, 0.0], "sorted": true}')
+        assert tsFour.to_twodim_list() == [[1.0, 1.0], [0.0, 0.0]]
+        tsFour = TimeSeries.from_json('[[1.0, 1.0], [0.0, 0.0]]', assumeSorted=True)
+        assert tsFour.to_twodim_list() == [[1.0, 1.0], [0.0, 0.0]]
+
+        tsformat = "%Y-%m-%d %H:%M:%S"
+        tsFive   = TimeSeries.from_json('[["2013-03-01 12:00:01", 1.0], ["2013-03-01 12:00:00", 0.0]]', tsformat=tsformat)
+        assert tsFive.to_twodim_list() == [["2013-03-01 12:00:00", 0.0], ["2013-03-01 12:00:01", 1.0]]
+        assert tsFive.get_column(0)[1] == TimeSeries.convert_timestamp_to_epoch("2013-03-01 12:00:01", tsformat)
+
+        for invalid in ("[[0.0, 1.0], [1.0]]", '{"timestamps": [0.0]}', '{"values": [0.0]}', "[[0.0, 1.0]", "[0.0, 1.0]"):
+            try:
+                TimeSeries.from_json(invalid)
+            except ValueError:
+                pass
+            else:
+                assert False    # pragma: no cover
+
+    def pickle_test(self):
+        """Test pickling TimeSeries using each storage backend."""
+        data = [[0.0, 0.0], [0.1, 0.1], [0.2, 0.2], [0.35, 0.3]]
+
+        for storage in ("list", "column", "implicit"):
+            ts = TimeSeries.from_arrays([entry[0] for entry in data], [entry[1] for entry in data], storage=storage)
+            ts.set_timeformat("%Y")
+
+            for protocol in xrange(pickle.HIGHEST_PROTOCOL + 1):
+                tsCopy = pickle.loads(pickle.dumps(ts, protocol))
+
+                assert tsCopy == ts
+                assert tsCopy._storage == storage
+                assert tsCopy.get_timeformat() == "%Y"
+                assert not tsCopy.is_normalized()
+
+        # the state of the incremental normalization is kept
+        ts = TimeSeries(storage="implicit")
+        for entry in data:
+            ts.add_entry(*entry)
+
+        ts.normalize("second")
+        tsCopy = pickle.loads(pickle.dumps(ts, pickle.HIGHEST_PROTOCOL))
+        assert tsCopy._timeseriesData.has_implicit_timestamps()
+        assert tsCopy.is_normalized()
+
+        for tsNormalized in (ts, tsCopy):
+            tsNormalized.add_entry(3.0, 1.0)
+            tsNormalized.normalize("second")
+
+        assert tsCopy == ts
+
+        # the data points are not pickled one by one
+        ts = TimeSeries.from_arrays(range(1000), range(1000), storage="list")
+        assert len(pickle.dumps(ts, pickle.HIGHEST_PROTOCOL)) < len(pickle.dumps(ts.to_twodim_list(), pickle.HIGHEST_PROTOCOL))
+
+    def equal_unsorted_test(self):
+        """Test the equality and digest of TimeSeries containing unsorted data entries."""
+        data = [[0.3, 0.3], [0.1, 0.1], [0.0, 0.0], [0.1, 0.2]]
+
+        tsOne = TimeSeries()
+        for entry in data:
+            tsOne.add_entry(*entry)
+
+        tsTwo   = TimeSeries.from_arrays([0.0, 0.1, 0.1, 0.3], [0.0, 0.1, 0.2, 0.3], storage="column")
+        tsThree = TimeSeries.from_arrays([0.0, 0.1, 0.1, 0.3], [0.0, 0.2, 0.1, 0.3], storage="column")
+        tsFour  = TimeSeries.from_arrays([0.0, 0.1, 0.1, 0.3], [0.0, 0.1, 0.2, 0.4])
+
+        assert not tsOne.is_sorted()
+        assert tsOne == tsTwo and tsTwo == tsOne
+        assert tsOne.to_twodim_list() == data
+
+        # data entries with equal timestamps are compared in their order
+        assert tsOne != tsThree
+        assert tsOne != tsFour
+
+        assert tsOne.digest() == tsTwo.digest()
+        assert tsOne.digest() != tsThree.digest()
+        assert tsOne.digest() != tsFour.digest()
+        assert TimeSeries().digest() != MultiDimensionalTimeSeries(dimensions=2).digest()
+
+        tsTwo.set_timeformat("%Y")
+        assert tsOne.digest() == tsTwo.digest()
+
+    def fingerprint_test(self):
+        """Test the incrementally maintained fingerprint of a TimeSeries."""
+        for storage in ("list", "column", "implicit"):
+            tsOne = TimeSeries(storage=storage)
+            tsTwo = TimeSeries(storage=storage)
+            for idx in xrange(10):
+                tsOne.add_entry(float(idx), idx * 0.5)
+                tsTwo.add_entry(float(idx), idx * 0.5)
+
+                # appended data entries are hashed incrementally
+                assert tsOne.fingerprint() == tsTwo.fingerprint()
+                assert tsOne._fingerprintState[1] == idx + 1
+
+            fingerprint = tsOne.fingerprint()
+
+            # the flags are part of the fingerprint
+            tsOne.sort_timeseries()
+            assert tsOne.fingerprint() != fingerprint
+            tsTwo.sort_timeseries()
+            assert tsOne.fingerprint() == tsTwo.fingerprint()
+
+            # changed data entries
+            fingerprint = tsOne.fingerprint()
+            tsOne[3] = [3.0, 0.0]
+            assert tsOne.fingerprint() != fingerprint
+            tsOne[3] = [3.0, 1.5]
+            assert tsOne.fingerprint() == fingerprint
+
+            # data entries changed in place are detected, unless they are lists of the "list" storage
+            tsOne[3][1] = 100.0
+            assert (tsOne.fingerprint() == fingerprint) == ("list" == storage)
+            tsOne[3][1] = 1.5
+            assert tsOne.fingerprint() == fingerprint
+
+            # the order of the data entries is part of the fingerprint
+            tsOne.add_entry(20.0, 1.0)
+            tsOne.add_entry(15.0, 1.0)
+            tsTwo.add_entry(15.0, 1.0)
+            tsTwo.add_entry(20.0, 1.0)
+            assert tsOne == tsTwo
+            assert tsOne.fingerprint() != tsTwo.fingerprint()
+
+            tsOne.sort_timeseries()
+            tsTwo.sort_timeseries()
+            assert tsOne.fingerprint() == tsTwo.fingerprint()
+
+            # normalization replaces the data entries
+            tsOne.normalize("second")
+            assert tsOne.fingerprint() != tsTwo.fingerprint()
+            assert tsOne.fingerprint() == copy(tsOne).fingerprint()
+            assert tsOne.fingerprint() == pickle.loads(pickle.dumps(tsOne, pickle.HIGHEST_PROTOCOL)).fingerprint()
+
+            tsOne.add_entry(21.0, 5.0)
+            tsOne.normalize("second")
+            tsTwo.add_entry(21.0, 5.0)
+            tsTwo.normalize("second")
+            assert tsOne.fingerprint() == tsTwo.fingerprint()
+
     def list_serialization_formatfree_test(self):
         """Test the format free list serialization."""
         data = [[0.0, 0.0], [0.1, 0.1], [0.2, 0.2], [0.3, 0.3], [0.4, 0.4], [0.5, 0.5]]
@@ -168,6 +353,14 @@ class TimeSeriesMiscellaneousTest(unittest.TestCase):
 
         assert os.path.isfile("temp_plot.dat")
 
+        # writing the file does not change the timestamp format
+        assert tsOne.to_twodim_list() == data
+        with open("temp_plot.dat", "rb") as datafile:
+            lines = datafile.readlines()
+
+        assert lines[0] == "# time_as_<UNIX-epochs> value\n"
+        assert lines[1:] == ["%s %s\n" % tuple(entry) for entry in data]
+
     def gnuplot_serialization_with_format_test(self):
         """Test serialization of timeSeries into gnuplot file."""
         data  = [[0.0, 0.0], [0.1, 0.1], [0.2, 0.2], [0.3, 0.3], [0.4, 0.4], [0.5, 0.5]]
@@ -177,6 +370,25 @@ class TimeSeriesMiscellaneousTest(unittest.TestCase):
 
         assert os.path.isfile("temp_plot.dat")
 
+        with open("temp_plot.dat", "rb") as datafile:
+            lines = datafile.readlines()
+
+        assert lines[0] == "# time_as_<%Y-%m-%d_%H:%M:%S> value\n"
+        assert lines[1:] == ["1970-01-01_00:00:00 %s\n" % entry[1] for entry in data]
+
+    def gnuplot_multiple_blocks_test(self):
+        """Test serialization of multiple TimeSeries into one gnuplot file."""
+        tsOne = TimeSeries.from_twodim_list([[0.0, 0.0], [1.0, 0.1]])
+        tsTwo = TimeSeries.from_twodim_list([[2.0, 0.2]])
+        tsTwo.set_timeformat("%H:%M:%S")
+
+        assert write_gnuplot_datafile("temp_plot.dat", [tsOne, tsTwo], ["original", "forecast"])
+        with open("temp_plot.dat", "rb") as datafile:
+            content = datafile.read()
+
+        assert content == "# original\n# time_as_<UNIX-epochs> value\n0.0 0.0\n1.0 0.1\n\n\n# forecast\n# time_as_<%H:%M:%S> value\n00:00:02 0.2\n"
+        assert not write_gnuplot_datafile(None, [tsOne])
+
     def gnuplot_serialization_exception_handling_test(self):
         """Test serialization of timeSeries into gnuplot file."""
         data  = [[0.0, 0.0], [0.1, 0.1], [0.2, 0.2], [0.3, 0.3], [0.4, 0.4], [0.5, 0.5]]
@@ -241,6 +453,117 @@ class TimeSeriesMiscellaneousTest(unittest.TestCase):
 
         if not tsThree == tsOne + tsTwo: raise AssertionError
 
+    def addition_merge_test(self):
+        """Test the merge of sorted and unsorted TimeSeries by the addition operator."""
+        for storage in ("list", "column"):
+            tsOne   = TimeSeries.from_arrays([0.0, 1.0, 2.0], [0.0, 1.0, 2.0], storage=storage)
+            tsTwo   = TimeSeries.from_arrays([3.0, 4.0], [3.0, 4.0], storage=storage)
+            tsThree = TimeSeries.from_arrays([5.0, 7.0], [5.0, 7.0], storage=storage)
+
+            # one TimeSeries follows the other one
+            for tsSum in (tsOne + tsTwo, tsTwo + tsOne):
+                assert tsSum.to_twodim_list() == [[0.0, 0.0], [1.0, 1.0], [2.0, 2.0], [3.0, 3.0], [4.0, 4.0]]
+                assert tsSum.is_sorted()
+                assert tsSum._normalized
+
+            assert not (tsTwo + tsThree)._normalized
+
+            # interleaved and unsorted TimeSeries
+            tsFour = TimeSeries(storage=storage)
+            for entry in [[1.5, 1.5], [0.0, 42.0], [-1.0, -1.0]]:
+                tsFour.add_entry(*entry)
+
+            tsSum = tsOne + tsFour
+            assert tsSum.to_twodim_list() == [[-1.0, -1.0], [0.0, 0.0], [0.0, 42.0], [1.0, 1.0], [1.5, 1.5], [2.0, 2.0]]
+            assert tsSum.is_sorted()
+            assert not tsSum.is_normalized()
+
+            assert (tsOne + TimeSeries()).to_twodim_list() == tsOne.to_twodim_list()
+
+    def loc_and_between_test(self):
+        """Test the timestamp based access to sorted and normalized TimeSeries."""
+        data = [[0.0, 0.0], [1.0, 0.1], [2.0, 0.2], [3.0, 0.3], [4.0, 0.4]]
+
+        for storage in ("list", "column"):
+            tsNormalized = TimeSeries.from_arrays([4.0, 3.0, 2.0, 1.0, 0.0], [0.4, 0.3, 0.2, 0.1, 0.0], storage=storage)
+            tsIrregular  = TimeSeries.from_arrays([0.0, 1.0, 1.0, 2.5, 7.0], [0.0, 0.1, 0.2, 0.3, 0.4], storage=storage)
+
+            assert tsNormalized.is_normalized()
+            assert tsNormalized.loc(3.0) == [3.0, 0.3]
+            assert tsIrregular.loc(1.0) == [1.0, 0.1]
+
+            for ts in (tsNormalized, tsIrregular):
+                for timestamp in (-1.0, 0.5, 42.0):
+                    self.assertRaises(KeyError, ts.loc, timestamp)
+
+            assert tsNormalized.between(0.5, 3.0).to_twodim_list() == data[1:4]
+            assert tsNormalized.between(1.0).to_twodim_list() == data[1:]
+            assert tsNormalized.between(end=-0.5).to_twodim_list() == []
+            assert tsNormalized.between(1.0, 2.0).is_normalized()
+            assert tsIrregular.between(1.0, 2.5).to_twodim_list() == [[1.0, 0.1], [1.0, 0.2], [2.5, 0.3]]
+            assert tsIrregular.between(3.0, 2.0).to_twodim_list() == []
+
+    def view_test(self):
+        """Test the TimeSeriesView."""
+        data = [[0.0, 0.0], [1.0, 0.1], [2.0, 0.2], [3.0, 0.3], [4.0, 0.4], [5.0, 0.5]]
+
+        for storage in ("list", "column"):
+            ts   = TimeSeries.from_arrays([entry[0] for entry in data], [entry[1] for entry in data], storage=storage)
+            view = ts.view(1, 5)
+
+            assert len(view) == 4
+            assert view[0] == [1.0, 0.1]
+            assert view[-1] == [4.0, 0.4]
+            assert view[1:3] == data[2:4]
+            assert view[::2] == [data[1], data[3]]
+            assert [entry for entry in view] == data[1:5]
+            assert list(view.get_column(1)) == [0.1, 0.2, 0.3, 0.4]
+            assert view.is_sorted() and view.is_normalized()
+            assert view.to_twodim_list() == data[1:5]
+            assert view.to_timeseries() == TimeSeries.from_twodim_list(data[1:5])
+            assert len(ts.view(4, 2)) == 0
+            assert ts.view(-2).to_twodim_list() == data[4:]
+            self.assertRaises(IndexError, view.__getitem__, 4)
+
+            # views on views reference the TimeSeries
+            subView = view.view(1, -1)
+            assert subView.to_twodim_list() == data[2:4]
+
+            ts[2][1] = 42.0
+            assert subView[0] == [2.0, 42.0]
+
+    def view_error_test(self):
+        """Test forecasts and errors calculated on a TimeSeriesView."""
+        data = [[float(idx), random.random()] for idx in xrange(20)]
+        ts   = TimeSeries.from_twodim_list(data)
+        ts.normalize("second")
+
+        view = ts.view(5, 15)
+        fm   = ExponentialSmoothing(smoothingFactor=0.3, valuesToForecast=0)
+
+        forecast = view.apply(fm)
+        assert forecast == ts.view(5, 15).to_timeseries().apply(fm)
+
+        cache = ResultCache()
+        assert forecast == view.apply(fm, resultCache=cache)
+        assert forecast == view.apply(fm, resultCache=cache)
+        assert 1 == cache.get_statistics()["hits"]
+        assert view.fingerprint() != ts.view(5, 14).fingerprint()
+
+        # the error of the test range of the TimeSeries
+        error = SMAPE()
+        assert error.initialize(view, forecast)
+
+        errorCopy = SMAPE()
+        errorCopy.initialize(view.to_timeseries(), forecast)
+        assert error.get_error() == errorCopy.get_error()
+
+        # views cannot be sorted
+        ts.add_entry(3.5, 1.0)
+        ts._sorted = False
+        self.assertRaises(ValueError, ts.view(0, 5).sort_timeseries)
+        self.assertRaises(ValueError, SMAPE().initialize, ts.view(0, 5), forecast)
+
     def is_normalized_test(self):
         """Test TimeSeries.is_normalized()."""
         ts = TimeSeries(isNormalized=True)
@@ -280,6 +603,63 @@ class TimeSeriesMiscellaneousTest(unittest.TestCase):
         if not len(tsOne) == len(tsTwo):  raise AssertionError
         if not tsOne == tsTwo:            raise AssertionError
 
+    def normalize_fusion_and_interpolation_test(self):
+        """Test normalization with multiple entries per bucket and missing buckets."""
+        data = [[0.0, 1.0], [0.4, 3.0], [0.9, 8.0], [1.2, 2.0], [3.0, 6.0], [3.99, 0.0]]
+
+        expected = {
+            "mean":   [[0.5, 4.0],  [1.5, 2.0], [2.5, 2.5], [3.5, 3.0]],
+            "median": [[0.5, 3.0],  [1.5, 2.0], [2.5, 4.0], [3.5, 6.0]],
+            "sum":    [[0.5, 12.0], [1.5, 2.0], [2.5, 4.0], [3.5, 6.0]]
+        }
+
+        for storage in ("list", "column"):
+            for fusionMethod in expected:
+                ts = TimeSeries(storage=storage)
+                for entry in reversed(data):
+                    ts.add_entry(*entry)
+
+                ts.normalize("second", fusionMethod=fusionMethod)
+
+                assert ts.to_twodim_list() == expected[fusionMethod], (storage, fusionMethod, ts)
+                assert ts.is_normalized()
+
+    def incremental_normalization_test(self):
+        """Test the normalization of data entries appended after a prior normalization."""
+        data     = [[0.0, 1.0], [0.4, 3.0], [0.9, 8.0], [1.2, 2.0], [3.0, 6.0], [3.99, 0.0], [4.2, 4.0], [7.1, 10.0]]
+        appended = [[3.5, 6.0], [4.7, 2.0], [9.3, 1.0]]
+
+        for storage in ("list", "column"):
+            for fusionMethod in ("mean", "median", "sum"):
+                ts = TimeSeries(storage=storage)
+                for entry in data[:6]:
+                    ts.add_entry(*entry)
+
+                ts.normalize("second", fusionMethod=fusionMethod)
+
+                # the appended entries extend the last bucket and add new ones
+                for entry in data[6:]:
+                    ts.add_entry(*entry)
+                    ts.normalize("second", fusionMethod=fusionMethod)
+
+                fullTS = TimeSeries.from_twodim_list(data)
+                fullTS.normalize("second", fusionMethod=fusionMethod)
+
+                assert ts == fullTS, (storage, fusionMethod, ts, fullTS)
+                assert ts._normalizationState is not None
+
+        # data entries that are not appended in temporal order require a full normalization
+        ts = TimeSeries.from_twodim_list(data)
+        ts.normalize("second")
+        for entry in appended:
+            ts.add_entry(*entry)
+        assert ts._normalizationState is None
+
+        fullTS = TimeSeries.from_twodim_list(ts.to_twodim_list())
+        ts.normalize("second")
+        fullTS.normalize("second")
+        assert ts == fullTS
+
     def normalization_illegal_parameter_test(self):
         """Test illegal parameter of TimeSeries.normalize()."""
         data = [[0.0, 0.0], [1.0, 1.0], [2.0, 2.0], [5.0, 5.0]]
@@ -0,0 +1,103 @@
+# !/usr/bin/env python
+#  -*- coding: UTF-8 -*-
+
+# Copyright (c) 2012-2015 Christian Schwarz
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+# required external modules
+import unittest
+import time
+from threading import Thread
+
+# required modules from pycast
+from pycast.common.timestampparser import TimestampParser, get_timestamp_parser
+from pycast.common.timeseries import TimeSeries
+
+class TimestampParserTest(unittest.TestCase):
+
+    """Test class for the TimestampParser."""
+
+    def compiled_format_test(self):
+        """Test the conversion of timestamps using a precompiled format."""
+        tsformat   = "%Y-%m-%dT%H:%M:%S"
+        parser     = TimestampParser(tsformat)
+        timestamps = ["2012-01-31T23:59:59", "2012-02-01T00:00:00", "2012-02-01T00:00:01",
+                      "2012-2-1T0:7:1", "2012-02-29T13:37:00", "1969-12-31T23:59:59"]
+
+        assert parser._expression is not None
+
+        for timestamp in timestamps:
+            assert parser.to_epoch(timestamp) == time.mktime(time.strptime(timestamp, tsformat)), timestamp
+
+        assert parser.convert(timestamps) == [time.mktime(time.strptime(timestamp, tsformat)) for timestamp in timestamps]
+
+    def strptime_format_test(self):
+        """Test the conversion of timestamps using formats that are not precompiled."""
+        tsformat = "%b %d %Y"
+        parser   = TimestampParser(tsformat)
+
+        assert parser._expression is None
+        assert parser.to_epoch("Feb 03 2012") == time.mktime(time.strptime("Feb 03 2012", tsformat))
+
+    def invalid_timestamp_test(self):
+        """Test that invalid timestamps raise a ValueError like time.strptime does."""
+        parser = TimestampParser("%Y-%m-%d %H:%M")
+
+        for timestamp in ("2012-02-30 12:00", "2012-02-01 12:00:00", "2012-13-01 12:00", "timestamp"):
+            self.assertRaises(ValueError, parser.to_epoch, timestamp)
+
+    def parser_cache_test(self):
+        """Test that the parsers are reused per format."""
+        assert get_timestamp_parser("%Y-%m-%d") is get_timestamp_parser("%Y-%m-%d")
+        assert get_timestamp_parser("%Y-%m-%d") is not get_timestamp_parser("%Y.%m.%d")
+
+    def concurrent_conversion_test(self):
+        """Test that a shared TimestampParser converts timestamps of different hours concurrently."""
+        tsformat   = "%Y-%m-%d %H:%M:%S"
+        parser     = get_timestamp_parser(tsformat)
+        timestamps = ["2013-04-%02d %02d:30:00" % (day, hour) for day in xrange(1, 8) for hour in xrange(24)]
+        expected   = [time.mktime(time.strptime(timestamp, tsformat)) for timestamp in timestamps]
+
+        results = []
+        def convert(offset):
+            # each thread starts at a different timestamp, so the threads change the cached hour alternately
+            order = range(offset, len(timestamps)) + range(offset)
+            results.append(all(parser.to_epoch(timestamps[idx]) == expected[idx] for repetition in xrange(20) for idx in order))
+
+        threads = [Thread(target=convert, args=(offset, )) for offset in xrange(0, len(timestamps), len(timestamps) // 4)][:4]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [True] * 4
+
+    def timeseries_conversion_test(self):
+        """Test TimeSeries.convert_timestamps_to_epoch."""
+        tsformat   = "%Y-%m-%d %H:%M:%S"
+        timestamps = ["2013-04-01 10:00:00", "2013-04-01 10:00:30", "2013-04-01 11:15:00"]
+
+        epochs = TimeSeries.convert_timestamps_to_epoch(timestamps, tsformat)
+
+        assert epochs == [TimeSeries.convert_timestamp_to_epoch(timestamp, tsformat) for timestamp in timestamps]
+        assert epochs[1] - epochs[0] == 30.0
+        assert [TimeSeries.convert_epoch_to_timestamp(epoch, tsformat) for epoch in epochs] == timestamps